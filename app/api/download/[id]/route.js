@@ -1,6 +1,6 @@
 import { NextResponse } from 'next/server';
 import { readFile } from 'fs/promises';
-import path from 'path';
+import { uploadFilePath } from '@/lib/paths';
 
 export async function GET(request, { params }) {
   try {
@@ -17,7 +17,7 @@ export async function GET(request, { params }) {
     }
     
     // 파일 경로
-    const filePath = path.join(process.cwd(), 'public', project.filePath);
+    const filePath = uploadFilePath(project.filePath);
     
     try {
       // 파일 읽기
@@ -1,14 +1,22 @@
 import { NextResponse } from 'next/server';
 import * as XLSX from 'xlsx';
 import { readFile } from 'fs/promises';
-import path from 'path';
+import { workbookStat, readCachedWorkbook, writeCachedWorkbook } from '@/lib/workbookCache';
+import { uploadFilePath } from '@/lib/paths';
 
 export async function POST(request) {
   try {
     const { filePath } = await request.json();
     
     // 파일 경로 확인
-    const fullPath = path.join(process.cwd(), 'public', filePath);
+    const fullPath = uploadFilePath(filePath);
+    
+    // 원본이 바뀌지 않았으면 캐시된 결과 사용 (엑셀 파일을 다시 읽지 않음)
+    const fileStat = await workbookStat(fullPath);
+    const cached = await readCachedWorkbook(filePath, fileStat);
+    if (cached) {
+      return NextResponse.json(cached);
+    }
     
     // Excel 파일 읽기
     const fileBuffer = await readFile(fullPath);
@@ -120,12 +128,15 @@ export async function POST(request) {
       formattedData.push(formattedRow);
     }
     
-    return NextResponse.json({ 
+    const result = { 
       success: true, 
       data: formattedData,
       projectInfo: projectInfo,
       sheetName: sheetName
-    });
+    };
+    await writeCachedWorkbook(filePath, fileStat, fileBuffer, result);
+    
+    return NextResponse.json(result);
     
   } catch (error) {
     console.error('Excel read error:', error);
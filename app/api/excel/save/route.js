@@ -1,7 +1,6 @@
 import { NextResponse } from 'next/server';
 import * as XLSX from 'xlsx';
-import { writeFile } from 'fs/promises';
-import path from 'path';
+import { storeContent } from '@/lib/contentStore';
 
 export async function POST(request) {
   try {
@@ -92,11 +91,13 @@ export async function POST(request) {
       cellStyles: true
     });
     
-    const fullPath = path.join(process.cwd(), 'public', filePath);
-    await writeFile(fullPath, buffer);
+    // 저장소 파일은 여러 프로젝트가 함께 쓸 수 있으므로 덮어쓰지 않고 새 내용으로 저장
+    // (프로젝트의 filePath는 호출한 쪽에서 새 경로로 변경)
+    const newFilePath = await storeContent(buffer, filePath);
     
     return NextResponse.json({ 
       success: true,
+      filePath: newFilePath,
       message: "파일이 성공적으로 저장되었습니다."
     });
     
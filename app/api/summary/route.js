@@ -0,0 +1,32 @@
+import { NextResponse } from 'next/server';
+import { readFile } from 'fs/promises';
+import path from 'path';
+import { dataDir } from '@/lib/paths';
+
+// 서버 관리자가 미리 계산해 두는 전체 프로젝트 점수 집계
+const summaryFile = path.join(dataDir, 'summary.json');
+
+// GET 요청 - 집계 결과 가져오기
+export async function GET() {
+  try {
+    const data = await readFile(summaryFile, 'utf8');
+    return new NextResponse(data, {
+      headers: {
+        'Content-Type': 'application/json',
+        'Cache-Control': 'no-store'
+      }
+    });
+  } catch (error) {
+    if (error.code === 'ENOENT') {
+      return NextResponse.json({ 
+        success: false, 
+        error: '집계 결과가 아직 없습니다' 
+      }, { status: 404 });
+    }
+    console.error('집계 읽기 오류:', error);
+    return NextResponse.json({ 
+      success: false, 
+      error: error.message 
+    }, { status: 500 });
+  }
+}
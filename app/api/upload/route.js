@@ -1,7 +1,6 @@
 import { NextResponse } from 'next/server';
-import { writeFile } from 'fs/promises';
 import * as XLSX from 'xlsx';
-import path from 'path';
+import { storeContent } from '@/lib/contentStore';
 
 export async function POST(request) {
   try {
@@ -17,10 +16,9 @@ export async function POST(request) {
 
     // 파일명 안전하게 변경 (공백을 _로)
     const filename = file.name.replaceAll(" ", "_");
-    const filepath = path.join(process.cwd(), "public/uploads", filename);
     
-    // 파일 저장
-    await writeFile(filepath, buffer);
+    // 파일 저장 (내용 기준으로 한 번만 저장되므로 같은 이름의 다른 파일을 덮어쓰지 않음)
+    const filePath = await storeContent(buffer, filename);
     
     // Excel 파일 내용 읽기
     let projectInfo = {
@@ -32,7 +30,7 @@ export async function POST(request) {
       inspectionDate: "",
       uploadDate: new Date().toISOString().split('T')[0],
       lastModified: new Date().toISOString().split('T')[0],
-      filePath: `/uploads/${filename}`
+      filePath: filePath
     };
 
     try {
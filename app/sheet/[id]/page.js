@@ -155,7 +155,8 @@ export default function InspectionSheet() {
       if (result.success) {
         alert('저장되었습니다!');
         
-        // 프로젝트 최종수정일 업데이트
+        // 프로젝트 최종수정일과 파일 경로 업데이트 (저장한 내용의 새 파일)
+        const filePath = result.filePath || project.filePath;
         await fetch('/api/projects', {
           method: 'PUT',
           headers: {
@@ -163,9 +164,11 @@ export default function InspectionSheet() {
           },
           body: JSON.stringify({
             id: project.id,
+            filePath: filePath,
             lastModified: new Date().toISOString().split('T')[0]
           })
         });
+        setProject({ ...project, filePath });
       } else {
         alert('저장 실패: ' + (result.error || '알 수 없는 오류'));
       }
@@ -81,12 +81,33 @@ export default function Summary() {
           })
         : projects;
       
+      // 서버 관리자가 미리 계산해 둔 프로젝트별 집계 (data/summary.json)
+      let cachedProjects = {};
+      try {
+        const summaryRes = await fetch('/api/summary');
+        if (summaryRes.ok) {
+          cachedProjects = (await summaryRes.json()).projects || {};
+        }
+      } catch (error) {
+        console.error('Failed to load materialized summary:', error);
+      }
+      
       const allData = [];
       let totalScore = 0;
       let totalMaxScore = 0;
+      const summary = { 대분류별: {}, 중분류별: {}, 담당자별: {} };
       
       // 각 프로젝트의 데이터 읽기
       for (const project of filteredProjects) {
+        // 집계가 있으면 엑셀 파일을 다시 읽지 않음
+        const cached = cachedProjects[project.id];
+        if (cached && !cached.error && cached.filePath === project.filePath) {
+          mergeSummary(summary, cached.summary);
+          totalScore += cached.total;
+          totalMaxScore += cached.max;
+          continue;
+        }
+        
         try {
           const excelRes = await fetch('/api/excel', {
             method: 'POST',
@@ -139,8 +160,8 @@ export default function Summary() {
       
       setFilteredData(allData);
       
-      // 데이터 집계
-      const summary = calculateSummary(allData);
+      // 데이터 집계 (집계가 없어 직접 읽은 프로젝트만 계산해서 합침)
+      mergeSummary(summary, calculateSummary(allData));
       summary.전체점수 = {
         total: totalScore,
         max: totalMaxScore,
@@ -196,6 +217,22 @@ export default function Summary() {
     }
   };
 
+  // 집계 결과 합치기 (합계는 더하고 담당자목록/프로젝트목록은 합집합)
+  const mergeSummary = (target, source) => {
+    for (const [key, value] of Object.entries(source)) {
+      if (key === '담당자목록' || key === '프로젝트목록') {
+        if (!target[key]) target[key] = new Set();
+        for (const item of value) target[key].add(item);
+      } else if (value !== null && typeof value === 'object') {
+        if (!target[key]) target[key] = {};
+        mergeSummary(target[key], value);
+      } else {
+        target[key] = (target[key] || 0) + value;
+      }
+    }
+    return target;
+  };
+
   const calculateSummary = (data) => {
     const summary = {
       대분류별: {},
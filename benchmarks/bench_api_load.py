@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+API 부하 테스트
+여러 검수자가 동시에 작업하는 상황을 흉내 내어 /api/projects, /api/excel,
+/api/excel/save, /api/upload를 경로별로 동시 요청하고 응답 시간(p50/p95/p99)과
+처리량(초당 요청 수)을 측정합니다. 결과를 JSON으로 저장해 버전 간에 비교할 수 있습니다.
+
+--url을 주지 않으면 --dir의 빌드된 서버를 빈 포트에서 직접 시작합니다. (npm run build 필요)
+저장/업로드는 데이터를 바꾸므로 --writes를 줄 때만 측정하며, 업로드로 생긴 프로젝트는
+끝난 뒤 삭제합니다. (저장/업로드로 생긴 파일은 python -m manager.storage --gc --gc-grace 0으로 정리)
+
+실행: python -m benchmarks.bench_api_load [--url http://127.0.0.1:3000] [--concurrency 20]
+                                          [--duration 10] [--writes] [--json 결과.json]
+                                          [--compare 이전결과.json]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from manager.launcher import resolve_launch_command
+from manager.readiness import ReadinessProbe, STATE_READY
+
+READ_ROUTES = ('projects', 'excel')
+WRITE_ROUTES = ('save', 'upload')
+PERCENTILES = (50, 95, 99)
+DEFAULT_SAMPLE = os.path.join(ROOT, 'public', 'uploads', '업무메뉴얼_양식.xlsx')
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def percentile(sorted_values, pct):
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def make_session():
+    """작업 스레드마다 연결을 재사용하는 세션 하나"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0)
+    session.mount('http://', adapter)
+    return session
+
+
+class LocalServer:
+    """--dir의 빌드된 Next.js 서버를 빈 포트에서 실행"""
+
+    def __init__(self, work_dir, timeout):
+        self.work_dir = work_dir
+        self.timeout = timeout
+        self.process = None
+        self.url = None
+
+    def __enter__(self):
+        launch = resolve_launch_command(self.work_dir, shutil.which('node'),
+                                        shutil.which('npm') or shutil.which('npm.cmd'), 'auto')
+        port = free_port()
+        env = os.environ.copy()
+        env['PORT'] = str(port)
+        env['NODE_ENV'] = 'production'
+        # 업로드 라우트가 /api/projects를 호출할 때 같은 서버를 사용하도록
+        env['NEXTAUTH_URL'] = f"http://127.0.0.1:{port}"
+        self.url = f"http://127.0.0.1:{port}"
+
+        print(f"서버 시작: {launch.describe()} (포트 {port})")
+        self.process = subprocess.Popen(launch.cmd, env=env, cwd=self.work_dir,
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        probe = ReadinessProbe(self.url + "/", timeout=self.timeout, interval=0.1)
+        try:
+            state, elapsed = probe.wait(is_alive=lambda: self.process.poll() is None)
+        finally:
+            probe.close()
+        if state != STATE_READY:
+            self.__exit__(None, None, None)
+            raise RuntimeError(f"서버가 {self.timeout}초 안에 응답하지 않았습니다.")
+        print(f"서버 준비: {elapsed:.2f}초")
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        return False
+
+
+class RouteScenario:
+    """경로 하나의 요청 만들기"""
+
+    def __init__(self, base_url, sample_path):
+        self.base_url = base_url.rstrip('/')
+        self.sample_path = sample_path
+        self.file_path = None
+        self.sheet = None
+        self.created_ids = []
+        self._lock = threading.Lock()
+
+    def prepare(self, routes):
+        """측정에 필요한 프로젝트 파일/시트 데이터 준비, 반환값: 측정할 수 있는 경로 목록"""
+        session = make_session()
+        projects = session.get(self.base_url + '/api/projects', timeout=30).json()
+        if not projects and 'upload' in routes:
+            self.request('upload', session).raise_for_status()
+            projects = session.get(self.base_url + '/api/projects', timeout=30).json()
+        if projects:
+            self.file_path = projects[0]['filePath']
+            response = session.post(self.base_url + '/api/excel', json={'filePath': self.file_path}, timeout=30)
+            if response.ok:
+                self.sheet = response.json()
+
+        ready = []
+        for route in routes:
+            if route in ('excel', 'save') and not self.sheet:
+                print(f"건너뜀 ({route}): 읽을 수 있는 프로젝트 파일이 없습니다.")
+            elif route == 'upload' and not os.path.exists(self.sample_path):
+                print(f"건너뜀 (upload): 예제 파일이 없습니다: {self.sample_path}")
+            else:
+                ready.append(route)
+        return ready
+
+    def request(self, route, session):
+        if route == 'projects':
+            return session.get(self.base_url + '/api/projects', timeout=60)
+        if route == 'excel':
+            return session.post(self.base_url + '/api/excel', json={'filePath': self.file_path}, timeout=60)
+        if route == 'save':
+            return session.post(self.base_url + '/api/excel/save', timeout=60, json={
+                'filePath': self.file_path,
+                'data': self.sheet['data'],
+                'projectInfo': self.sheet['projectInfo'],
+            })
+        if route == 'upload':
+            with open(self.sample_path, 'rb') as f:
+                files = {'file': (f"loadtest_{threading.get_ident()}.xlsx", f)}
+                response = session.post(self.base_url + '/api/upload', files=files, timeout=60)
+            if response.ok:
+                with self._lock:
+                    self.created_ids.append(response.json()['project']['id'])
+            return response
+        raise ValueError(route)
+
+    def cleanup(self):
+        """업로드로 만든 프로젝트 삭제"""
+        session = make_session()
+        for project_id in self.created_ids:
+            try:
+                session.delete(self.base_url + '/api/projects', json={'id': project_id}, timeout=30)
+            except requests.RequestException:
+                continue
+        if self.created_ids:
+            print(f"업로드로 만든 프로젝트 {len(self.created_ids)}개를 삭제했습니다.")
+        self.created_ids = []
+
+
+def run_route(scenario, route, concurrency, duration, warmup):
+    """경로 하나를 concurrency개 스레드로 duration초 동안 요청"""
+    latencies = []
+    errors = {}
+    lock = threading.Lock()
+    measure_from = [0.0]
+    deadline = [0.0]
+
+    def start_clock():
+        # 모든 스레드의 준비 요청이 끝난 뒤 측정 시작
+        measure_from[0] = time.perf_counter()
+        deadline[0] = measure_from[0] + duration
+
+    start_barrier = threading.Barrier(concurrency + 1, action=start_clock)
+
+    def worker():
+        passed_barrier = False
+        try:
+            session = make_session()
+            local_latencies = []
+            local_errors = {}
+            for _ in range(warmup):
+                try:
+                    scenario.request(route, session)
+                except Exception:
+                    pass
+            try:
+                start_barrier.wait()
+            except threading.BrokenBarrierError:
+                # 다른 스레드가 준비 중에 종료됨
+                return
+            passed_barrier = True
+            while time.perf_counter() < deadline[0]:
+                started = time.perf_counter()
+                try:
+                    response = scenario.request(route, session)
+                    key = None if response.ok else f"HTTP {response.status_code}"
+                except Exception as e:
+                    # 연결 오류 외에 응답 형식 오류(KeyError, ValueError 등)도 오류로 셈
+                    key = type(e).__name__
+                elapsed = time.perf_counter() - started
+                if key is None:
+                    local_latencies.append(elapsed * 1000)
+                else:
+                    local_errors[key] = local_errors.get(key, 0) + 1
+            session.close()
+            with lock:
+                latencies.extend(local_latencies)
+                for key, count in local_errors.items():
+                    errors[key] = errors.get(key, 0) + count
+        finally:
+            if not passed_barrier:
+                # 준비 중에 스레드가 끝나면 다른 스레드와 메인 스레드가 계속 기다리지 않도록
+                start_barrier.abort()
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    try:
+        start_barrier.wait()
+    except threading.BrokenBarrierError:
+        for thread in threads:
+            thread.join()
+        raise RuntimeError(f"{route}: 요청 스레드가 측정을 시작하기 전에 종료되었습니다")
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - measure_from[0]
+
+    latencies.sort()
+    result = {
+        'requests': len(latencies),
+        'errors': sum(errors.values()),
+        'error_kinds': errors,
+        'throughput_rps': len(latencies) / elapsed if elapsed else 0.0,
+        'mean_ms': sum(latencies) / len(latencies) if latencies else 0.0,
+        'max_ms': latencies[-1] if latencies else 0.0,
+    }
+    for pct in PERCENTILES:
+        result[f'p{pct}_ms'] = percentile(latencies, pct)
+    return result
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def app_version():
+    try:
+        with open(os.path.join(ROOT, 'package.json'), 'r', encoding='utf-8') as f:
+            return json.load(f).get('version')
+    except (OSError, ValueError):
+        return None
+
+
+def print_results(routes, baseline=None):
+    print(f"\n{'경로':<10} {'요청':>7} {'오류':>5} {'초당':>8} {'p50':>9} {'p95':>9} {'p99':>9}")
+    for route, result in routes.items():
+        print(f"{route:<10} {result['requests']:>7} {result['errors']:>5} {result['throughput_rps']:>8.1f} "
+              f"{result['p50_ms']:>7.1f}ms {result['p95_ms']:>7.1f}ms {result['p99_ms']:>7.1f}ms")
+        if baseline and route in baseline:
+            before = baseline[route]
+            changes = []
+            for key, label in (('throughput_rps', "초당"), ('p50_ms', "p50"), ('p95_ms', "p95"), ('p99_ms', "p99")):
+                if before.get(key):
+                    changes.append(f"{label} {(result[key] - before[key]) / before[key] * 100:+.0f}%")
+            print(f"{'':<10} 이전 결과 대비: {', '.join(changes)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 경로별 동시 요청 부하 테스트")
+    parser.add_argument('--url', help="측정할 서버 주소 (없으면 --dir의 서버를 직접 시작)")
+    parser.add_argument('--dir', default=ROOT, help="Next.js 프로젝트 폴더 (빌드 완료)")
+    parser.add_argument('--routes', default=','.join(READ_ROUTES + WRITE_ROUTES),
+                        help="측정할 경로 (projects,excel,save,upload)")
+    parser.add_argument('--writes', action='store_true', help="데이터를 바꾸는 save/upload도 측정")
+    parser.add_argument('--concurrency', type=int, default=20, help="동시 사용자(스레드) 수")
+    parser.add_argument('--duration', type=float, default=10.0, help="경로별 측정 시간(초)")
+    parser.add_argument('--warmup', type=int, default=2, help="측정 전 스레드별 요청 수")
+    parser.add_argument('--sample', default=DEFAULT_SAMPLE, help="업로드에 사용할 엑셀 파일")
+    parser.add_argument('--timeout', type=float, default=60.0, help="서버 시작 대기 시간(초)")
+    parser.add_argument('--json', help="결과를 저장할 JSON 파일")
+    parser.add_argument('--compare', help="비교할 이전 결과 JSON 파일")
+    args = parser.parse_args()
+
+    routes = [route.strip() for route in args.routes.split(',') if route.strip()]
+    unknown = set(routes) - set(READ_ROUTES + WRITE_ROUTES)
+    if unknown:
+        parser.error(f"알 수 없는 경로: {', '.join(sorted(unknown))}")
+    if not args.writes:
+        skipped = [route for route in routes if route in WRITE_ROUTES]
+        if skipped:
+            print(f"건너뜀 ({', '.join(skipped)}): 데이터를 바꾸므로 --writes를 줄 때만 측정합니다.")
+        routes = [route for route in routes if route not in WRITE_ROUTES]
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f).get('routes', {})
+
+    def measure(base_url):
+        scenario = RouteScenario(base_url, args.sample)
+        try:
+            results = {}
+            for route in scenario.prepare(routes):
+                print(f"측정 중: {route} (동시 {args.concurrency}, {args.duration:.0f}초)")
+                results[route] = run_route(scenario, route, args.concurrency, args.duration, args.warmup)
+            return results
+        finally:
+            scenario.cleanup()
+
+    if args.url:
+        results = measure(args.url)
+    else:
+        with LocalServer(os.path.abspath(args.dir), args.timeout) as server:
+            results = measure(server.url)
+
+    print_results(results, baseline)
+
+    if args.json:
+        document = {
+            'version': app_version(),
+            'revision': git_revision(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'concurrency': args.concurrency,
+            'duration': args.duration,
+            'routes': results,
+        }
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(document, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+서버 출력 디코딩 마이크로벤치마크
+기존 방식(텍스트 모드 readline + 줄마다 cp949 재인코딩/UTF-8 재디코딩)과
+manager.decoding.iter_lines(바이너리 청크 + 증분 디코더)의 MB당 처리 시간을 비교합니다.
+
+실행: python -m benchmarks.bench_log_decoding [--mb 8] [--repeat 5]
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from manager.decoding import iter_lines
+
+SAMPLE_LINES = [
+    "   ▲ Next.js 15.3.3",
+    "   - Local:        http://localhost:3000",
+    " ✓ Ready in 412ms",
+    "GET /api/projects 200 in 12ms",
+    "POST /api/excel 200 in 85ms",
+    "Excel 데이터 구조: [ [], [ '프로젝트명:', '강남 A현장' ], [ '현장(도시군구):', '서울 강남구' ] ]",
+    "원본 검수일자 데이터: 2025-06-03 타입: string",
+    "변환된 검수일자: 2025-06-03",
+]
+
+
+def make_payload(megabytes, encoding):
+    """지정한 크기의 서버 출력 바이트 생성"""
+    block = ("\n".join(SAMPLE_LINES) + "\n").encode(encoding, errors='replace')
+    repeat = max(1, int(megabytes * 1024 * 1024 / len(block)))
+    return block * repeat
+
+
+def legacy_reader(payload, locale_encoding):
+    """기존 monitor_server_output 방식"""
+    stream = io.TextIOWrapper(io.BytesIO(payload), encoding=locale_encoding, errors='replace')
+    count = 0
+    for output in iter(stream.readline, ''):
+        try:
+            decoded = output.encode(locale_encoding, errors='replace').decode('utf-8')
+        except UnicodeError:
+            decoded = output.encode(locale_encoding, errors='replace').decode(locale_encoding, errors='replace')
+        if decoded.strip():
+            count += 1
+    return count
+
+
+def chunked_reader(payload):
+    """바이너리 청크 + 증분 디코더"""
+    count = 0
+    for line in iter_lines(io.BufferedReader(io.BytesIO(payload))):
+        if line.strip():
+            count += 1
+    return count
+
+
+def measure(func, *args, repeat=5):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="서버 출력 디코딩 벤치마크")
+    parser.add_argument('--mb', type=float, default=8.0, help="출력 크기 (MB)")
+    parser.add_argument('--repeat', type=int, default=5, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    print(f"출력 크기: {args.mb:.1f}MB, 반복 {args.repeat}회 중 최솟값")
+    print(f"{'출력 인코딩':<12}{'방식':<28}{'ms/MB':>10}{'줄 수':>10}")
+
+    for encoding in ('utf-8', 'cp949'):
+        payload = make_payload(args.mb, encoding)
+        size_mb = len(payload) / (1024 * 1024)
+
+        legacy, legacy_lines = measure(legacy_reader, payload, 'cp949', repeat=args.repeat)
+        chunked, chunked_lines = measure(chunked_reader, payload, repeat=args.repeat)
+
+        print(f"{encoding:<12}{'기존 (readline + 재인코딩)':<28}{legacy / size_mb * 1000:>10.2f}{legacy_lines:>10}")
+        print(f"{encoding:<12}{'청크 + 증분 디코더':<28}{chunked / size_mb * 1000:>10.2f}{chunked_lines:>10}")
+        print(f"{'':<12}{'속도 향상':<28}{legacy / chunked:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
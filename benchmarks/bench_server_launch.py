@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+서버 실행 방식 비교
+npm start와 node 직접 실행(manager.launcher)의 시작 시간(첫 HTTP 응답까지)과
+안정 상태 메모리(프로세스 트리 RSS 합계), 프로세스 수, 중지 후 남은 프로세스 수를 비교합니다.
+Next.js 빌드(npm run build)가 끝난 프로젝트 폴더에서 실행해야 합니다.
+
+실행: python -m benchmarks.bench_server_launch [--dir .] [--repeat 5] [--settle 3] [--json 결과.json]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import psutil
+
+from manager.launcher import resolve_launch_command
+from manager.readiness import ReadinessProbe, STATE_READY
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def tree_of(pid):
+    try:
+        root = psutil.Process(pid)
+        return [root] + root.children(recursive=True)
+    except psutil.NoSuchProcess:
+        return []
+
+
+def tree_rss(procs):
+    total = 0
+    for proc in procs:
+        try:
+            total += proc.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return total
+
+
+def run_once(launch, work_dir, settle, timeout):
+    """한 번 실행해서 (시작 시간, RSS, 프로세스 수, 중지 후 남은 프로세스 수) 측정"""
+    port = free_port()
+    env = os.environ.copy()
+    env['PORT'] = str(port)
+    env['NODE_ENV'] = 'production'
+
+    start = time.perf_counter()
+    process = subprocess.Popen(launch.cmd, env=env, cwd=work_dir,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    probe = ReadinessProbe(f"http://127.0.0.1:{port}/", timeout=timeout, interval=0.05)
+    try:
+        state, _ = probe.wait(is_alive=lambda: process.poll() is None)
+    finally:
+        probe.close()
+    ready = time.perf_counter() - start
+
+    time.sleep(settle)
+    procs = tree_of(process.pid)
+    rss = tree_rss(procs)
+
+    # 관리자와 같은 방식으로 중지 (루트 프로세스만 terminate)
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+    time.sleep(0.5)
+    leftover = [proc for proc in procs[1:] if proc.is_running()
+                and proc.status() != psutil.STATUS_ZOMBIE]
+    for proc in leftover:
+        proc.kill()
+
+    if state != STATE_READY:
+        raise RuntimeError(f"{launch.describe()}: {timeout}초 안에 응답하지 않았습니다.")
+    return ready, rss, len(procs), len(leftover)
+
+
+def summarize(runs):
+    ready = [run[0] * 1000 for run in runs]
+    rss = [run[1] / (1024 * 1024) for run in runs]
+    return {
+        'ready_ms_median': statistics.median(ready),
+        'ready_ms_min': min(ready),
+        'rss_mb_median': statistics.median(rss),
+        'processes': runs[-1][2],
+        'leftover_processes': max(run[3] for run in runs),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="npm start / node 직접 실행 비교")
+    parser.add_argument('--dir', default='.', help="Next.js 프로젝트 폴더 (빌드 완료)")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--settle', type=float, default=3.0, help="메모리 측정 전 대기 시간(초)")
+    parser.add_argument('--timeout', type=float, default=60.0)
+    parser.add_argument('--json', help="결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    work_dir = os.path.abspath(args.dir)
+    node_path = shutil.which('node')
+    npm_path = shutil.which('npm') or shutil.which('npm.cmd')
+
+    launches = {
+        'npm': resolve_launch_command(work_dir, node_path, npm_path, 'npm'),
+        'node': resolve_launch_command(work_dir, node_path, npm_path, 'node'),
+    }
+
+    results = {}
+    for name, launch in launches.items():
+        runs = [run_once(launch, work_dir, args.settle, args.timeout) for _ in range(args.repeat)]
+        results[name] = {'command': launch.describe(), **summarize(runs)}
+
+    print(f"{'방식':<6} {'시작(중앙값)':>12} {'시작(최소)':>10} {'RSS':>10} {'프로세스':>8} {'남은 프로세스':>12}")
+    for name, result in results.items():
+        print(f"{name:<6} {result['ready_ms_median']:>10.0f}ms {result['ready_ms_min']:>8.0f}ms "
+              f"{result['rss_mb_median']:>8.1f}MB {result['processes']:>8} {result['leftover_processes']:>12}")
+
+    npm, node = results['npm'], results['node']
+    print(f"\nnode 직접 실행: 시작 {npm['ready_ms_median'] - node['ready_ms_median']:.0f}ms 단축, "
+          f"메모리 {npm['rss_mb_median'] - node['rss_mb_median']:.1f}MB 절약")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+검수 양식 읽기 비교
+/api/excel의 XLSX.read(스타일/수식/날짜/서식 전체 해석) + sheet_to_json 방식과
+manager.workbook.read_template(시트 XML iterparse)의 파일당 처리 시간을 비교하고,
+두 결과(data, projectInfo)가 같은지 확인합니다.
+
+Node 쪽은 프로젝트의 node_modules/xlsx를 사용하므로 npm install 후에 실행해야 합니다.
+(설치되어 있지 않으면 Python 쪽만 측정)
+
+실행: python -m benchmarks.bench_workbook_parse [--repeat 20] [--json 결과.json] [파일 ...]
+"""
+
+import argparse
+import glob
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+import zipfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from manager.workbook import read_template
+
+# /api/excel/route.js의 읽기/변환 부분 (응답 생성 제외)
+NODE_SCRIPT = r"""
+const XLSX = require(process.argv[1]);
+const fs = require('fs');
+const files = JSON.parse(process.argv[2]);
+const repeat = parseInt(process.argv[3]);
+
+function convert(buffer) {
+  const workbook = XLSX.read(buffer, {
+    cellStyles: true, cellFormulas: true, cellDates: true, cellNF: true, sheetStubs: true
+  });
+  const worksheet = workbook.Sheets[workbook.SheetNames[0]];
+  const jsonData = XLSX.utils.sheet_to_json(worksheet, { header: 1, defval: "", raw: false });
+  const headers = (jsonData[7] && jsonData[7][0] === "대분류") ? jsonData[7]
+    : ["대분류", "중분류", "소분류", "임무", "담당자", "점수", "점수 범위"];
+  const data = [headers.map(h => ({ value: h || "" }))];
+  let prev = "";
+  for (let i = 8; i < jsonData.length; i++) {
+    const row = jsonData[i];
+    if (!row || row.length === 0) continue;
+    if (row.every(cell => !cell || cell.toString().trim() === "")) continue;
+    if (row[0] && row[0].toString().trim() !== "") prev = row[0].toString().trim();
+    let maxScore = 1;
+    if (row[6]) {
+      const parts = row[6].toString().split('/');
+      if (parts.length === 2) maxScore = parseInt(parts[1]) || 1;
+    }
+    let score = 0;
+    if (row[5] !== undefined && row[5] !== "") score = parseInt(row[5]) || 0;
+    data.push([
+      { value: row[0] ? row[0].toString().trim() : prev },
+      { value: row[1] ? row[1].toString().trim() : "" },
+      { value: row[2] ? row[2].toString().trim() : "" },
+      { value: row[3] ? row[3].toString().trim() : "" },
+      { value: row[4] ? row[4].toString().trim() : "" },
+      { value: score },
+      { value: row[6] ? row[6].toString().trim() : "0/1" },
+      { value: maxScore }
+    ]);
+  }
+  return data;
+}
+
+const result = {};
+for (const file of files) {
+  const times = [];
+  let data = null;
+  for (let r = 0; r < repeat; r++) {
+    const start = process.hrtime.bigint();
+    data = convert(fs.readFileSync(file));
+    times.push(Number(process.hrtime.bigint() - start) / 1e6);
+  }
+  result[file] = { times, data };
+}
+process.stdout.write(JSON.stringify(result));
+"""
+
+
+def time_python(path, repeat):
+    times = []
+    data = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        data = read_template(path)
+        times.append((time.perf_counter() - start) * 1000)
+    return times, data
+
+
+def time_node(files, repeat):
+    """Node XLSX.read 측정 결과 {파일: {times, data}}, 실행할 수 없으면 None"""
+    node = shutil.which('node')
+    xlsx_module = os.path.join(ROOT, 'node_modules', 'xlsx')
+    if not node or not os.path.isdir(xlsx_module):
+        return None
+    output = subprocess.run(
+        [node, '-e', NODE_SCRIPT, xlsx_module, json.dumps(files), str(repeat)],
+        capture_output=True, check=True
+    ).stdout
+    return json.loads(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="XLSX.read / iterparse 양식 읽기 비교")
+    parser.add_argument('files', nargs='*', help="엑셀 파일 (기본: public/uploads/*.xlsx)")
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--json', help="결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    files = args.files or sorted(glob.glob(os.path.join(ROOT, 'public', 'uploads', '*.xlsx')))
+    valid = []
+    for path in files:
+        if zipfile.is_zipfile(path):
+            valid.append(os.path.abspath(path))
+        else:
+            print(f"건너뜀 (xlsx 파일이 아님): {os.path.basename(path)}")
+
+    node_results = time_node(valid, args.repeat)
+    if node_results is None:
+        print("node_modules/xlsx가 없어 Node 측정을 건너뜁니다. (npm install 후 다시 실행)")
+
+    results = {}
+    print(f"\n{'파일':<28} {'크기':>8} {'행':>5} {'Python':>10} {'XLSX.read':>10} {'배율':>6} {'결과 일치':>8}")
+    for path in valid:
+        py_times, data = time_python(path, args.repeat)
+        entry = {
+            'bytes': os.path.getsize(path),
+            'rows': len(data),
+            'python_ms': statistics.median(py_times),
+        }
+        node_text = ratio_text = match_text = "-"
+        if node_results is not None:
+            node = node_results[path]
+            entry['node_ms'] = statistics.median(node['times'])
+            entry['speedup'] = entry['node_ms'] / entry['python_ms']
+            entry['match'] = node['data'] == data.to_rows()
+            node_text = f"{entry['node_ms']:.2f}ms"
+            ratio_text = f"{entry['speedup']:.1f}x"
+            match_text = "예" if entry['match'] else "아니오"
+        results[os.path.basename(path)] = entry
+        print(f"{os.path.basename(path):<28} {entry['bytes'] / 1024:>6.1f}KB {entry['rows']:>5} "
+              f"{entry['python_ms']:>8.2f}ms {node_text:>10} {ratio_text:>6} {match_text:>8}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+검수 양식 엑셀 파일 대량 생성 (규모 테스트용)
+양식과 같은 구조의 xlsx 파일과 이 파일들을 가리키는 projects.json을 만듭니다.
+  2~6행 B열   프로젝트명, 현장, 총괄담당자, 검수자, 검수일자 (jsonData 인덱스 1~5)
+  8행         헤더 (jsonData 인덱스 7)
+  9행부터     대분류/중분류/소분류/임무/담당자/점수/점수 범위 (대분류는 병합 셀)
+
+파일마다 (seed, 번호)로 난수를 만들고 zip 시각을 고정하므로, 작업 프로세스 수와 관계없이
+같은 seed면 바이트 단위로 같은 파일이 만들어집니다.
+
+실행: python -m benchmarks.generate_workbooks --out public/uploads/synthetic [--count 1000]
+                                               [--rows 40-80] [--seed 1] [--workers 0]
+                                               [--url-prefix /uploads/synthetic/]
+                                               [--projects data/projects.json]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from xml.sax.saxutils import escape
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from manager.workbook import DEFAULT_HEADERS
+
+ZIP_DATE = (1980, 1, 1, 0, 0, 0)
+EXCEL_EPOCH = date(1899, 12, 30)
+
+# 실제 양식의 대분류 > 중분류 > (소분류, 임무)
+CATALOG = [
+    ("착공 전", [
+        ("현장 확인", [("현장 사진", "착공 전 현장 사진을 빠짐없이 촬영하였는가?"),
+                   ("민원 확인", "인근 민원 사항을 사전에 확인하였는가?")]),
+        ("", [("공정표", "공정표를 작성하여 발주처와 공유하였는가?")]),
+    ]),
+    ("현장실측", [
+        ("도면치수 정확도", [("", "실측이 정확히 되었는가?"),
+                        ("설비 위치", "설비/전기 위치를 도면에 표시하였는가?")]),
+    ]),
+    ("설계", [
+        ("", [("기본 도면(평면도, 바닥, 천장, 입면)", ""),
+              ("전기 도면", "전기 도면이 현장 조건과 일치하는가?")]),
+        ("SPEC", [("마감재 협의", "마감재 협의가 완료 되었는가?"),
+                  ("샘플 확인", "마감재 샘플을 발주처에 확인받았는가?")]),
+    ]),
+    ("시설협의", [
+        ("SPEC", [("스펙북-회의록/시방서 첨부", "스펙북에 회의록과 시방서를 첨부하였는가?")]),
+        ("건물 관리", [("공사 신고", "건물 관리실에 공사 신고를 완료하였는가?")]),
+    ]),
+    ("발주/제작관련", [
+        ("", [("치수", "도면을 지참하여 치수를 정확히 체크하였는가?"),
+              ("납기", "제작물 납기를 공정표와 맞추었는가?")]),
+    ]),
+    ("현장 공사", [
+        ("", [("스펙북 및 공정별 체크리스트", "스펙 및 공정별 체크리스트를 확인하여 공사에 차질 없이 준비하였는가?"),
+              ("현장 정리 정돈", "용역을 적절한 시점에 투입하여 현장 정리 정돈 및 관리가 잘 되었는가?"),
+              ("안전 관리", "안전 장비 착용과 안전 교육이 이루어졌는가?")]),
+        ("일정관리", [("현장 일정관리", "예정된 일정대로 잘 진행되었는가? 수정된 일정을 발주처에게 공유 및 확인을 받았는가?")]),
+        ("원가관리", [("실행달성", "예상 실행을 달성하였는가?")]),
+    ]),
+    ("준공 후 사후관리", [
+        ("프로젝트 회의", [("", "프로젝트 회의 자료를 성실히 준비하였는가?")]),
+        ("하자 보수", [("하자 접수", "하자 접수 후 일주일 안에 조치하였는가?")]),
+    ]),
+    ("평가", [
+        ("발주처 평가", [("만족도", "발주처 만족도 조사를 진행하였는가?")]),
+    ]),
+]
+
+# 실제 양식의 점수 범위 비율 (0/1이 대부분, 감점 항목 일부)
+SCORE_RANGES = [("0/1", 79), ("-1/1", 16), ("-1/3", 5)]
+
+CITIES = {
+    "서울": ["강남구", "서초구", "마포구", "송파구", "종로구", "영등포구"],
+    "경기": ["성남시 분당구", "수원시 영통구", "고양시 일산동구", "용인시 수지구"],
+    "부산": ["해운대구", "부산진구", "남구"],
+    "인천": ["연수구", "남동구"],
+    "대전": ["유성구", "서구"],
+}
+SITE_TYPES = ["사무실", "매장", "병원", "학원", "카페", "오피스텔", "물류센터"]
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN_NAMES = ["민준", "서연", "지훈", "하은", "도윤", "수아", "예준", "지우", "현우", "서윤", "건우", "유진"]
+
+
+def person(rng):
+    return rng.choice(SURNAMES) + rng.choice(GIVEN_NAMES)
+
+
+def column_letter(index):
+    return chr(ord('A') + index)
+
+
+class SheetWriter:
+    """공유 문자열을 쓰는 최소한의 시트 XML 작성"""
+
+    def __init__(self):
+        self.strings = []
+        self.string_index = {}
+        self.rows = []
+        self.merges = []
+
+    def text(self, value):
+        index = self.string_index.get(value)
+        if index is None:
+            index = self.string_index[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+    def add_row(self, number, cells):
+        """cells: [(열 인덱스, 값, 종류)] 종류 's'=문자열, 'n'=숫자, 'd'=날짜(일련번호)"""
+        parts = []
+        for col, value, kind in cells:
+            ref = f"{column_letter(col)}{number}"
+            if kind == 's':
+                if value == "":
+                    continue
+                parts.append(f'<c r="{ref}" t="s"><v>{self.text(value)}</v></c>')
+            elif kind == 'd':
+                parts.append(f'<c r="{ref}" s="1"><v>{value}</v></c>')
+            else:
+                parts.append(f'<c r="{ref}"><v>{value}</v></c>')
+        if parts:
+            self.rows.append(f'<row r="{number}">{"".join(parts)}</row>')
+
+    def sheet_xml(self):
+        merges = ""
+        if self.merges:
+            merges = (f'<mergeCells count="{len(self.merges)}">'
+                      + "".join(f'<mergeCell ref="{ref}"/>' for ref in self.merges) + '</mergeCells>')
+        return ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                f'<sheetData>{"".join(self.rows)}</sheetData>{merges}</worksheet>')
+
+    def shared_strings_xml(self):
+        items = "".join(f'<si><t xml:space="preserve">{escape(value)}</t></si>' for value in self.strings)
+        return ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+                '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+                f'count="{len(self.strings)}" uniqueCount="{len(self.strings)}">{items}</sst>')
+
+
+CONTENT_TYPES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types"><Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/><Default Extension="xml" ContentType="application/xml"/><Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/><Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/><Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/><Override PartName="/xl/sharedStrings.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/></Types>"""
+
+ROOT_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships"><Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/></Relationships>"""
+
+WORKBOOK = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"><sheets><sheet name="검수" sheetId="1" r:id="rId1"/></sheets></workbook>"""
+
+WORKBOOK_RELS = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships"><Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/><Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/><Relationship Id="rId3" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings" Target="sharedStrings.xml"/></Relationships>"""
+
+# 스타일 0: 기본, 1: 날짜(yyyy-mm-dd, numFmtId 14)
+STYLES = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><fonts count="1"><font><sz val="11"/><name val="맑은 고딕"/></font></fonts><fills count="1"><fill><patternFill patternType="none"/></fill></fills><borders count="1"><border/></borders><cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs><cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/><xf numFmtId="14" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/></cellXfs></styleSheet>"""
+
+
+def pick_score(rng):
+    """(점수, 점수 범위) 대부분 만점, 일부 감점"""
+    score_range = rng.choices([value for value, _ in SCORE_RANGES],
+                              weights=[weight for _, weight in SCORE_RANGES])[0]
+    low, high = (int(part) for part in score_range.split('/'))
+    score = high if rng.random() < 0.75 else rng.randint(low, high)
+    return score, score_range
+
+
+def make_items(rng, row_count, managers):
+    """대분류 순서대로 row_count개 항목 생성"""
+    weights = [len(middles) for _, middles in CATALOG]
+    counts = [1] * len(CATALOG)
+    for index in rng.choices(range(len(CATALOG)), weights=weights, k=max(0, row_count - len(CATALOG))):
+        counts[index] += 1
+    if row_count < len(CATALOG):
+        counts = [1 if i < row_count else 0 for i in range(len(CATALOG))]
+
+    items = []
+    for (major, middles), count in zip(CATALOG, counts):
+        for i in range(count):
+            middle, tasks = middles[i] if i < len(middles) else rng.choice(middles)
+            minor, task = rng.choice(tasks)
+            score, score_range = pick_score(rng)
+            items.append((major, middle, minor, task, rng.choice(managers), score, score_range))
+    return items
+
+
+def generate_one(job):
+    """
+    파일 하나 생성 (작업 프로세스에서 실행)
+    job: (번호, 경로, seed, 최소 행, 최대 행, 시작일, 기간(일))
+    반환값: 프로젝트 정보
+    """
+    index, path, seed, min_rows, max_rows, first_day, days = job
+    rng = random.Random(f"{seed}:{index}")
+
+    city = rng.choice(list(CITIES))
+    location = f"{city} {rng.choice(CITIES[city])}"
+    project_name = f"{location.split()[-1]} {rng.choice(SITE_TYPES)} 인테리어 {index + 1:05d}"
+    general_manager = person(rng)
+    inspector = person(rng)
+    managers = [person(rng) for _ in range(rng.randint(1, 4))]
+    inspection_date = date.fromordinal(first_day + rng.randrange(days))
+
+    sheet = SheetWriter()
+    info = [("프로젝트명:", project_name), ("현장(도시군구):", location),
+            ("총괄담당자:", general_manager), ("검수자:", inspector)]
+    for row, (label, value) in enumerate(info, start=2):
+        sheet.add_row(row, [(0, label, 's'), (1, value, 's')])
+    # 검수일자는 날짜 셀과 문자열을 섞어서 두 가지 읽기 경로를 모두 사용
+    if rng.random() < 0.7:
+        sheet.add_row(6, [(0, "검수일자:", 's'), (1, (inspection_date - EXCEL_EPOCH).days, 'd')])
+    else:
+        sheet.add_row(6, [(0, "검수일자:", 's'), (1, inspection_date.isoformat(), 's')])
+    sheet.add_row(8, [(col, header, 's') for col, header in enumerate(DEFAULT_HEADERS)])
+
+    items = make_items(rng, rng.randint(min_rows, max_rows), managers)
+    row = 9
+    group_start = None
+    previous_major = None
+    for major, middle, minor, task, manager, score, score_range in items:
+        if major != previous_major:
+            if group_start is not None and row - 1 > group_start:
+                sheet.merges.append(f"A{group_start}:A{row - 1}")
+            group_start = row
+            previous_major = major
+            major_cell = major
+        else:
+            major_cell = ""
+        sheet.add_row(row, [(0, major_cell, 's'), (1, middle, 's'), (2, minor, 's'), (3, task, 's'),
+                            (4, manager, 's'), (5, score, 'n'), (6, score_range, 's')])
+        row += 1
+    if group_start is not None and row - 1 > group_start:
+        sheet.merges.append(f"A{group_start}:A{row - 1}")
+
+    parts = [
+        ('[Content_Types].xml', CONTENT_TYPES),
+        ('_rels/.rels', ROOT_RELS),
+        ('xl/workbook.xml', WORKBOOK),
+        ('xl/_rels/workbook.xml.rels', WORKBOOK_RELS),
+        ('xl/styles.xml', STYLES),
+        ('xl/worksheets/sheet1.xml', sheet.sheet_xml()),
+        ('xl/sharedStrings.xml', sheet.shared_strings_xml()),
+    ]
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, content in parts:
+            info_entry = zipfile.ZipInfo(name, date_time=ZIP_DATE)
+            info_entry.compress_type = zipfile.ZIP_DEFLATED
+            archive.writestr(info_entry, content)
+
+    upload_date = inspection_date + timedelta(days=rng.randint(0, 7))
+    return {
+        'projectName': project_name,
+        'location': location,
+        'generalManager': general_manager,
+        'inspector': inspector,
+        'inspectionDate': inspection_date.isoformat(),
+        'uploadDate': upload_date.isoformat(),
+        'lastModified': upload_date.isoformat(),
+        'rows': len(items),
+        'bytes': os.path.getsize(path),
+    }
+
+
+def parse_rows(text):
+    """'57' 또는 '40-80' -> (최소, 최대)"""
+    low, _, high = text.partition('-')
+    low = int(low)
+    return low, int(high) if high else low
+
+
+def main():
+    parser = argparse.ArgumentParser(description="검수 양식 엑셀 파일 + projects.json 대량 생성")
+    parser.add_argument('--out', required=True, help="엑셀 파일을 만들 폴더")
+    parser.add_argument('--count', type=int, default=1000, help="파일 수")
+    parser.add_argument('--rows', default='40-80', help="파일당 검수 항목 수 (예: 57 또는 40-80)")
+    parser.add_argument('--seed', type=int, default=1, help="난수 seed (같으면 같은 파일)")
+    parser.add_argument('--workers', type=int, default=0, help="작업 프로세스 수 (0=CPU 수)")
+    parser.add_argument('--from', dest='date_from', default='2025-01-01', help="검수일자 시작")
+    parser.add_argument('--to', dest='date_to', default='2025-12-31', help="검수일자 끝")
+    parser.add_argument('--url-prefix', default=None,
+                        help="projects.json의 filePath 앞부분 (기본: /uploads/<out 폴더 이름>/)")
+    parser.add_argument('--projects', default=None, help="projects.json 경로 (기본: <out>/projects.json)")
+    args = parser.parse_args()
+
+    min_rows, max_rows = parse_rows(args.rows)
+    first_day = date.fromisoformat(args.date_from).toordinal()
+    days = date.fromisoformat(args.date_to).toordinal() - first_day + 1
+    out_dir = os.path.abspath(args.out)
+    os.makedirs(out_dir, exist_ok=True)
+    url_prefix = args.url_prefix or f"/uploads/{os.path.basename(out_dir)}/"
+    if not url_prefix.endswith('/'):
+        url_prefix += '/'
+    projects_file = args.projects or os.path.join(out_dir, 'projects.json')
+
+    names = [f"synthetic_{args.seed}_{index:06d}.xlsx" for index in range(args.count)]
+    jobs = [(index, os.path.join(out_dir, name), args.seed, min_rows, max_rows, first_day, days)
+            for index, name in enumerate(names)]
+
+    start = time.perf_counter()
+    workers = args.workers or os.cpu_count() or 1
+    if workers <= 1:
+        results = [generate_one(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(generate_one, jobs, chunksize=max(1, len(jobs) // (workers * 8))))
+    elapsed = time.perf_counter() - start
+
+    # id도 seed에서 정해지도록 (2025-01-01 00:00 UTC 밀리초 + seed 구간 + 번호)
+    base_id = 1735689600000 + args.seed * 10_000_000
+    projects = []
+    for index, (name, result) in enumerate(zip(names, results)):
+        projects.append({
+            'id': base_id + index,
+            'projectName': result['projectName'],
+            'location': result['location'],
+            'generalManager': result['generalManager'],
+            'inspector': result['inspector'],
+            'inspectionDate': result['inspectionDate'],
+            'uploadDate': result['uploadDate'],
+            'lastModified': result['lastModified'],
+            'filePath': url_prefix + name,
+        })
+    with open(projects_file, 'w', encoding='utf-8') as f:
+        json.dump(projects, f, ensure_ascii=False, indent=2)
+
+    total_bytes = sum(result['bytes'] for result in results)
+    total_rows = sum(result['rows'] for result in results)
+    print(f"파일 {len(results)}개 생성 ({out_dir}): 항목 {total_rows}개, {total_bytes / 1024 / 1024:.1f}MB, "
+          f"{elapsed:.2f}초 (초당 {len(results) / elapsed:.0f}개, 작업 프로세스 {workers}개)")
+    print(f"projects.json: {projects_file}")
+
+
+if __name__ == "__main__":
+    main()
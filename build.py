@@ -10,23 +10,402 @@ import subprocess
 import shutil
 import json
 import zipfile
+import hashlib
+import argparse
+import time
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
 import tempfile
 
+# 단계별 입력 지문/결과물을 저장하는 빌드 캐시
+BUILD_CACHE_DIR = Path(".build_cache")
+BUILD_CACHE_VERSION = 1
+
+# Next.js 빌드에 영향을 주는 파일/폴더
+NEXTJS_INPUTS = ['app', 'components', 'lib', 'public', 'package.json', 'package-lock.json',
+                 'next.config.mjs', 'postcss.config.mjs', 'tailwind.config.js', 'jsconfig.json']
+# EXE에 들어가는 Python 소스
+PYTHON_INPUTS = ['main.py', 'manager', 'requirements.txt']
+# 지문 계산에서 제외할 폴더
+FINGERPRINT_EXCLUDES = {'__pycache__', '.git'}
+
+APP_NAME = 'InspectionSystemManager'
+EXE_NAME = APP_NAME + '.exe' if sys.platform == "win32" else APP_NAME
+NODE_NAME = "node.exe" if sys.platform == "win32" else "node"
+
+# 패키징 방식 (manager/runtime.py 참고)
+#   onefile     exe 하나 (실행할 때마다 임시 폴더에 모두 풀림)
+#   onedir      exe + 폴더 (풀지 않음)
+#   persistent  작은 exe + 서버 파일 zip (사용자 폴더에 버전별로 한 번만 풀림)
+PACKAGE_MODES = ('onefile', 'onedir', 'persistent')
+DEFAULT_MODE = 'onedir'
+STANDALONE_DIR = Path('.next') / 'standalone'
+PAYLOAD_DIR = Path("build_payload")
+LAUNCH_TIMEOUT = 180
+
+# Node.js 런타임 (LTS 버전)
+NODE_VERSION = "v20.11.0"
+NODE_DIST_URL = "https://nodejs.org/dist"
+NODE_EXTRACT_MARKER = ".archive-sha256"
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+DOWNLOAD_REPORT_BYTES = 8 * 1024 * 1024
+DOWNLOAD_RETRIES = 4
+DOWNLOAD_TIMEOUT = 30
+
+# 동시에 실행할 빌드 단계 수 / 폴더 복사 스레드 수
+DEFAULT_JOBS = 4
+COPY_WORKERS = 8
+
+class PrefixedOutput:
+    """여러 단계가 동시에 출력할 때 줄마다 [단계] 접두어를 붙여 섞이지 않게 함"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+        self.lock = threading.Lock()
+    
+    def set_prefix(self, prefix):
+        """현재 스레드의 접두어 설정 (None이면 남은 출력을 내보내고 해제)"""
+        self.flush()
+        self.local.prefix = prefix
+        self.local.buffer = ''
+    
+    def write(self, text):
+        prefix = getattr(self.local, 'prefix', None)
+        if not prefix:
+            with self.lock:
+                return self.stream.write(text)
+        
+        *lines, self.local.buffer = (self.local.buffer + text).split('\n')
+        if lines:
+            with self.lock:
+                for line in lines:
+                    self.stream.write(f"[{prefix}] {line}\n")
+                self.stream.flush()
+        return len(text)
+    
+    def flush(self):
+        buffer = getattr(self.local, 'buffer', '')
+        if buffer:
+            self.local.buffer = ''
+            with self.lock:
+                self.stream.write(f"[{self.local.prefix}] {buffer}\n")
+        self.stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+# 실행 중인 외부 명령 (한 단계가 실패하면 나머지를 중단하기 위해)
+_running_processes = set()
+_running_lock = threading.Lock()
+
 def run_command(cmd, cwd=None, shell=True):
-    """명령어 실행"""
+    """명령어 실행 (출력을 줄 단위로 바로 표시)"""
     print(f"실행 중: {cmd}")
     try:
-        result = subprocess.run(cmd, shell=shell, cwd=cwd, check=True, 
-                              capture_output=True, text=True)
-        print(f"성공: {result.stdout}")
-        return True
-    except subprocess.CalledProcessError as e:
+        process = subprocess.Popen(cmd, shell=shell, cwd=cwd, stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT, text=True, errors='replace')
+    except OSError as e:
         print(f"오류: {e}")
-        print(f"출력: {e.stdout}")
-        print(f"에러: {e.stderr}")
         return False
+    
+    with _running_lock:
+        _running_processes.add(process)
+    try:
+        for line in process.stdout:
+            print(line.rstrip())
+        returncode = process.wait()
+    finally:
+        with _running_lock:
+            _running_processes.discard(process)
+    
+    if returncode != 0:
+        print(f"오류: {cmd} (종료 코드 {returncode})")
+        return False
+    print("성공")
+    return True
+
+def terminate_running_commands():
+    """실행 중인 외부 명령과 그 하위 프로세스 종료"""
+    with _running_lock:
+        processes = list(_running_processes)
+    for process in processes:
+        try:
+            import psutil
+            children = psutil.Process(process.pid).children(recursive=True)
+        except Exception:
+            children = []
+        for child in children:
+            try:
+                child.kill()
+            except Exception:
+                pass
+        try:
+            process.kill()
+        except OSError:
+            pass
+
+def copytree_parallel(source, target, workers=COPY_WORKERS):
+    """폴더 복사 (작은 파일이 많은 node_modules/lib용, 파일 복사를 스레드 풀에서 동시에 실행)"""
+    source, target = Path(source), Path(target)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = []
+        for root, dirs, files in os.walk(source):
+            target_root = target / Path(root).relative_to(source)
+            target_root.mkdir(parents=True, exist_ok=True)
+            for name in files:
+                futures.append(executor.submit(shutil.copy2, Path(root) / name, target_root / name))
+        for future in futures:
+            future.result()
+
+class BuildCache:
+    """
+    단계별 입력 지문(내용 해시) 캐시
+    입력 지문이 같고 이전 결과물이 그대로 있으면 그 단계를 건너뜁니다.
+    파일 해시는 크기/수정 시각이 같으면 다시 읽지 않습니다.
+    """
+    
+    def __init__(self, cache_dir=BUILD_CACHE_DIR, force=False):
+        self.cache_dir = Path(cache_dir)
+        self.state_file = self.cache_dir / "state.json"
+        self.force = force
+        self.state = {'version': BUILD_CACHE_VERSION, 'files': {}, 'stages': {}}
+        self.lock = threading.RLock()     # 여러 단계가 동시에 지문 계산/기록
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('version') == BUILD_CACHE_VERSION:
+                self.state = state
+        except (OSError, ValueError):
+            pass
+    
+    def digest_file(self, path):
+        """파일 내용 해시 (크기/수정 시각이 같으면 이전 값 사용)"""
+        stat = path.stat()
+        key = path.as_posix()
+        cached = self.state['files'].get(key)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+        
+        sha = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                sha.update(chunk)
+        digest = sha.hexdigest()
+        self.state['files'][key] = [stat.st_size, stat.st_mtime_ns, digest]
+        return digest
+    
+    def iter_files(self, inputs):
+        """입력 경로(파일/폴더)의 모든 파일 (정렬된 순서)"""
+        for item in inputs:
+            path = Path(item)
+            if path.is_file():
+                yield path
+            elif path.is_dir():
+                for root, dirs, files in os.walk(path):
+                    dirs[:] = sorted(d for d in dirs if d not in FINGERPRINT_EXCLUDES)
+                    for name in sorted(files):
+                        yield Path(root) / name
+    
+    def fingerprint(self, inputs=(), extra=()):
+        """입력 파일 내용 + 추가 값(버전, 설정 등)의 지문"""
+        sha = hashlib.sha256()
+        for value in extra:
+            sha.update(f"{value}\0".encode('utf-8'))
+        with self.lock:
+            for path in self.iter_files(inputs):
+                sha.update(f"{path.as_posix()}\0{self.digest_file(path)}\n".encode('utf-8'))
+        # 없는 입력도 지문에 반영 (생겼다 없어지는 경우)
+        missing = [str(item) for item in inputs if not Path(item).exists()]
+        sha.update(f"missing:{missing}".encode('utf-8'))
+        return sha.hexdigest()
+    
+    @staticmethod
+    def output_state(outputs):
+        """결과물 파일의 수정 시각 (없으면 None)"""
+        state = {}
+        for output in outputs:
+            try:
+                state[str(output)] = Path(output).stat().st_mtime_ns
+            except OSError:
+                return None
+        return state
+    
+    def is_fresh(self, stage, fingerprint, outputs):
+        """같은 입력으로 만든 결과물이 그대로 있는지"""
+        if self.force:
+            return False
+        entry = self.state['stages'].get(stage)
+        if not entry or entry.get('fingerprint') != fingerprint:
+            return False
+        return self.output_state(outputs) == entry.get('outputs')
+    
+    def record(self, stage, fingerprint, outputs):
+        with self.lock:
+            self.state['stages'][stage] = {
+                'fingerprint': fingerprint,
+                'outputs': self.output_state(outputs),
+            }
+            self.save()
+    
+    def stage_fingerprint(self, stage):
+        entry = self.state['stages'].get(stage)
+        return entry.get('fingerprint') if entry else None
+    
+    def save(self):
+        with self.lock:
+            self.cache_dir.mkdir(exist_ok=True)
+            temp_file = self.state_file.with_suffix('.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.state, f)
+            os.replace(temp_file, self.state_file)
+
+class BuildReport:
+    """단계별 시작 시각/소요 시간/캐시 적중 기록"""
+    
+    STATUS_LABELS = {'built': "실행", 'cached': "캐시", 'failed': "실패"}
+    REPORT_FILE = BUILD_CACHE_DIR / "last_report.json"
+    
+    def __init__(self, jobs=1):
+        self.start = time.perf_counter()
+        self.jobs = jobs
+        self.stages = []        # (단계, 상태, 시작(초), 소요 시간(초))
+        self.bundles = []       # 패키징 방식별 크기/실행 시간
+        self.lock = threading.Lock()
+        
+        # 이전 빌드 결과 (전체 시간 비교용)
+        self.previous = None
+        try:
+            with open(self.REPORT_FILE, 'r', encoding='utf-8') as f:
+                self.previous = json.load(f)
+        except (OSError, ValueError):
+            pass
+    
+    def add(self, stage, status, started, seconds):
+        with self.lock:
+            self.stages.append((stage, status, started - self.start, seconds))
+    
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self.start
+    
+    def print_table(self):
+        print("\n=== 빌드 단계별 소요 시간 ===")
+        for stage, status, offset, seconds in sorted(self.stages, key=lambda item: item[2]):
+            print(f"  {stage:<16} {self.STATUS_LABELS[status]:<4} +{offset:7.1f}초 {seconds:8.1f}초")
+        cached = sum(1 for stage in self.stages if stage[1] == 'cached')
+        busy = sum(stage[3] for stage in self.stages)
+        print(f"  전체 {self.elapsed:.1f}초 (단계 합계 {busy:.1f}초, 동시 실행 {self.jobs}개, "
+              f"캐시 적중 {cached}/{len(self.stages)}단계)")
+        if self.previous:
+            print(f"  이전 빌드 {self.previous['elapsed']:.1f}초 (동시 실행 {self.previous.get('jobs', 1)}개, "
+                  f"{self.previous['date']}) → 이번 빌드 {self.elapsed:.1f}초")
+    
+    def save(self, path=REPORT_FILE):
+        """다음 빌드와 비교할 수 있도록 저장"""
+        path.parent.mkdir(exist_ok=True)
+        report = {
+            'date': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'elapsed': round(self.elapsed, 2),
+            'jobs': self.jobs,
+            'stages': [{'stage': stage, 'status': status, 'start': round(offset, 2), 'seconds': round(seconds, 2)}
+                       for stage, status, offset, seconds in self.stages],
+            'bundles': self.bundles,
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+def run_stage(name, func, cache, report, inputs=(), extra=(), outputs=()):
+    """
+    입력 지문이 캐시와 같으면 건너뛰고, 아니면 func() 실행 후 지문 기록
+    (outputs가 없는 단계는 항상 실행)
+    반환값: func()의 결과 (건너뛴 경우 True)
+    """
+    start = time.perf_counter()
+    fingerprint = cache.fingerprint(inputs, extra) if outputs else None
+    if outputs and cache.is_fresh(name, fingerprint, outputs):
+        print(f"\n=== {name}: 입력 변경 없음, 캐시 사용 ===")
+        report.add(name, 'cached', start, time.perf_counter() - start)
+        return True
+    
+    try:
+        result = func()
+    except Exception as e:
+        print(f"❌ 예상치 못한 오류 발생: {e}")
+        result = None
+    report.add(name, 'built' if result else 'failed', start, time.perf_counter() - start)
+    if result and outputs:
+        cache.record(name, fingerprint, outputs)
+    return result
+
+class Stage:
+    """
+    빌드 단계 하나
+    func(results)는 앞 단계 결과(단계 이름 -> 반환값)를 받음, 실패하면 거짓 값 반환
+    inputs는 경로 목록 또는 inputs(results), extra(results)는 지문에 넣을 추가 값 (앞 단계가 끝난 뒤 계산)
+    """
+    
+    def __init__(self, name, func, deps=(), inputs=(), extra=None, outputs=(), failure=""):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.inputs = inputs
+        self.extra = extra or (lambda results: ())
+        self.outputs = outputs
+        self.failure = failure or f"{name} 오류"
+
+def run_stage_graph(stages, cache, report, jobs=DEFAULT_JOBS):
+    """
+    의존 관계가 끝난 단계부터 동시에 실행 (한 단계가 실패하면 새 단계를 시작하지 않고
+    실행 중인 외부 명령을 중단)
+    반환값: (단계 결과, 실패한 단계 또는 None)
+    """
+    pending = {stage.name: stage for stage in stages}
+    results = {}
+    running = {}
+    failed = None
+    output = sys.stdout if isinstance(sys.stdout, PrefixedOutput) else None
+    
+    def execute(stage):
+        if output:
+            output.set_prefix(stage.name)
+        try:
+            inputs = stage.inputs(results) if callable(stage.inputs) else stage.inputs
+            return run_stage(stage.name, lambda: stage.func(results), cache, report,
+                             inputs=inputs, extra=stage.extra(results), outputs=stage.outputs)
+        except Exception as e:
+            print(f"❌ 예상치 못한 오류 발생: {e}")
+            return None
+        finally:
+            if output:
+                output.set_prefix(None)
+    
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        try:
+            while running or (pending and failed is None):
+                if failed is None:
+                    for name, stage in list(pending.items()):
+                        if len(running) < jobs and all(dep in results for dep in stage.deps):
+                            del pending[name]
+                            running[executor.submit(execute, stage)] = stage
+                if not running:
+                    raise RuntimeError(f"실행할 수 없는 단계 (의존 관계 확인): {', '.join(pending)}")
+                
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    stage = running.pop(future)
+                    result = future.result()
+                    if result:
+                        results[stage.name] = result
+                    elif failed is None:
+                        failed = stage
+                        terminate_running_commands()
+        except KeyboardInterrupt:
+            terminate_running_commands()
+            raise
+    return results, failed
 
 def check_dependencies():
     """필요한 도구들이 설치되어 있는지 확인"""
@@ -70,84 +449,228 @@ def check_dependencies():
     
     return True
 
-def download_nodejs_portable():
-    """Node.js 포터블 버전 다운로드"""
-    print("\n=== Node.js 포터블 버전 다운로드 ===")
-    
-    # Node.js 버전 설정
-    node_version = "v20.11.0"  # LTS 버전
-    
-    # 플랫폼별 다운로드 URL
+def node_dist_info(node_version=NODE_VERSION):
+    """플랫폼별 Node.js 배포 파일 이름과 압축 해제 폴더 이름"""
     if sys.platform == "win32":
-        if sys.maxsize > 2**32:
-            # 64-bit
-            node_url = f"https://nodejs.org/dist/{node_version}/node-{node_version}-win-x64.zip"
-            node_folder = f"node-{node_version}-win-x64"
-        else:
-            # 32-bit
-            node_url = f"https://nodejs.org/dist/{node_version}/node-{node_version}-win-x86.zip"
-            node_folder = f"node-{node_version}-win-x86"
+        # 64-bit / 32-bit
+        arch = "win-x64" if sys.maxsize > 2**32 else "win-x86"
+        ext = ".zip"
     elif sys.platform == "darwin":
-        node_url = f"https://nodejs.org/dist/{node_version}/node-{node_version}-darwin-x64.tar.gz"
-        node_folder = f"node-{node_version}-darwin-x64"
+        arch, ext = "darwin-x64", ".tar.gz"
     else:
         # Linux
-        node_url = f"https://nodejs.org/dist/{node_version}/node-{node_version}-linux-x64.tar.xz"
-        node_folder = f"node-{node_version}-linux-x64"
+        arch, ext = "linux-x64", ".tar.xz"
+    node_folder = f"node-{node_version}-{arch}"
+    return node_folder + ext, node_folder
+
+def default_node_cache_dir():
+    """사용자별 Node.js 배포 파일 캐시 폴더 (여러 프로젝트/빌드에서 공유)"""
+    if os.environ.get('INSPECTION_BUILD_CACHE'):
+        return Path(os.environ['INSPECTION_BUILD_CACHE']) / "node"
+    if sys.platform == "win32":
+        base = Path(os.environ.get('LOCALAPPDATA') or Path.home() / "AppData" / "Local")
+        return base / "InspectionSystem" / "build-cache" / "node"
+    base = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / ".cache")
+    return base / "inspection-system" / "node"
+
+def file_sha256(path):
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+def parse_shasums(text):
+    """SHASUMS256.txt 내용 -> {파일 이름: sha256}"""
+    sums = {}
+    for line in text.splitlines():
+        parts = line.split()
+        if len(parts) == 2:
+            sums[parts[1].lstrip('*')] = parts[0].lower()
+    return sums
+
+def download_file(session, url, target, retries=DOWNLOAD_RETRIES):
+    """
+    이어받기 가능한 다운로드 (target.part에 받은 뒤 완료되면 target으로 이름 변경)
+    중간에 끊기면 Range 요청으로 받은 부분 이후만 다시 받음
+    """
+    target = Path(target)
+    part = target.with_name(target.name + ".part")
+    for attempt in range(1, retries + 1):
+        offset = part.stat().st_size if part.exists() else 0
+        headers = {'Range': f"bytes={offset}-"} if offset else {}
+        try:
+            with session.get(url, stream=True, headers=headers, timeout=DOWNLOAD_TIMEOUT) as response:
+                if response.status_code == 416:
+                    # 이미 끝까지 받은 경우
+                    break
+                response.raise_for_status()
+                if offset and response.status_code != 206:
+                    print("서버가 이어받기를 지원하지 않아 처음부터 다시 받습니다.")
+                    offset = 0
+                elif offset:
+                    print(f"이어받기: {offset / 1024 / 1024:.1f}MB부터")
+                
+                total = offset + int(response.headers.get('Content-Length', 0))
+                with open(part, 'ab' if offset else 'wb') as f:
+                    received = offset
+                    next_report = received + DOWNLOAD_REPORT_BYTES
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                        received += len(chunk)
+                        if received >= next_report:
+                            print(f"  {received / 1024 / 1024:.1f}MB / {total / 1024 / 1024:.1f}MB")
+                            next_report += DOWNLOAD_REPORT_BYTES
+            break
+        except requests.RequestException as e:
+            if attempt == retries:
+                raise
+            print(f"⚠️ 다운로드 오류 ({attempt}/{retries}), 다시 시도합니다: {e}")
+            time.sleep(2 ** attempt)
+    os.replace(part, target)
+    return target
+
+def fetch_node_archive(node_version=NODE_VERSION, cache_dir=None, mirror=None, offline=False):
+    """
+    검증된 Node.js 배포 파일 (사용자별 캐시 -> 로컬 미러 -> nodejs.org 순서), 반환값: (경로, sha256)
+    SHASUMS256.txt로 확인하며, 미러 폴더는 nodejs.org/dist와 같은 구조(버전/파일) 또는
+    파일을 바로 넣은 구조 모두 사용 가능
+    """
+    archive_name, _ = node_dist_info(node_version)
+    cache_dir = Path(cache_dir or default_node_cache_dir()) / node_version
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    archive = cache_dir / archive_name
+    shasums_file = cache_dir / "SHASUMS256.txt"
     
-    # 다운로드 디렉토리 생성
-    download_dir = Path("temp_nodejs")
-    download_dir.mkdir(exist_ok=True)
+    mirror_dirs = []
+    if mirror:
+        mirror_dirs = [Path(mirror) / node_version, Path(mirror)]
+        offline = True
+    
+    def find_in_mirror(name):
+        for directory in mirror_dirs:
+            if (directory / name).is_file():
+                return directory / name
+        return None
     
-    node_archive = download_dir / f"nodejs{Path(node_url).suffix}"
+    session = None
+    if not offline:
+        session = requests.Session()
     
-    # 이미 다운로드된 경우 건너뛰기
-    if node_archive.exists():
-        print(f"Node.js 아카이브가 이미 존재합니다: {node_archive}")
+    # 체크섬 목록 (한 번 받으면 캐시에 보관)
+    if not shasums_file.exists():
+        source = find_in_mirror("SHASUMS256.txt")
+        if source:
+            shutil.copy2(source, shasums_file)
+        elif session:
+            download_file(session, f"{NODE_DIST_URL}/{node_version}/SHASUMS256.txt", shasums_file)
+        else:
+            print(f"❌ 오프라인 모드: SHASUMS256.txt가 캐시/미러에 없습니다 ({cache_dir})")
+            return None, None
+    with open(shasums_file, 'r', encoding='utf-8') as f:
+        expected = parse_shasums(f.read()).get(archive_name)
+    if not expected:
+        print(f"❌ SHASUMS256.txt에 {archive_name}이(가) 없습니다.")
+        return None, None
+    
+    # 캐시에 있고 체크섬이 맞으면 그대로 사용
+    if archive.exists():
+        if file_sha256(archive) == expected:
+            print(f"✅ Node.js 캐시 사용: {archive}")
+            return archive, expected
+        print(f"⚠️ 캐시의 Node.js 파일이 손상되어 다시 받습니다: {archive}")
+        archive.unlink()
+    
+    source = find_in_mirror(archive_name)
+    if source:
+        print(f"Node.js 미러에서 복사 중: {source}")
+        shutil.copy2(source, archive.with_name(archive.name + ".part"))
+        os.replace(archive.with_name(archive.name + ".part"), archive)
+    elif session:
+        url = f"{NODE_DIST_URL}/{node_version}/{archive_name}"
+        print(f"Node.js 다운로드 중: {url}")
+        download_file(session, url, archive)
     else:
-        print(f"Node.js 다운로드 중: {node_url}")
-        try:
-            response = requests.get(node_url, stream=True)
-            response.raise_for_status()
-            
-            with open(node_archive, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            print(f"✅ Node.js 다운로드 완료: {node_archive}")
-        except Exception as e:
-            print(f"❌ Node.js 다운로드 실패: {e}")
-            return None
+        print(f"❌ 오프라인 모드: {archive_name}이(가) 캐시/미러에 없습니다.")
+        return None, None
+    
+    digest = file_sha256(archive)
+    if digest != expected:
+        archive.unlink()
+        print(f"❌ 체크섬 불일치: {archive_name} (예상 {expected}, 실제 {digest})")
+        return None, None
+    print(f"✅ Node.js 다운로드/확인 완료: {archive}")
+    return archive, digest
+
+def download_nodejs_portable(cache_dir=None, mirror=None, offline=False):
+    """Node.js 포터블 버전 준비 (검증된 배포 파일을 temp_nodejs에 압축 해제)"""
+    print("\n=== Node.js 포터블 버전 다운로드 ===")
+    
+    try:
+        node_archive, digest = fetch_node_archive(NODE_VERSION, cache_dir, mirror, offline)
+    except Exception as e:
+        print(f"❌ Node.js 다운로드 실패: {e}")
+        return None
+    if not node_archive:
+        return None
     
-    # 압축 해제
+    # 압축 해제 (완료 표시 파일의 체크섬이 같을 때만 기존 폴더 사용)
+    _, node_folder = node_dist_info(NODE_VERSION)
+    download_dir = Path("temp_nodejs")
+    download_dir.mkdir(exist_ok=True)
     extracted_dir = download_dir / node_folder
-    if extracted_dir.exists():
+    marker = extracted_dir / NODE_EXTRACT_MARKER
+    if marker.exists() and marker.read_text(encoding='utf-8').strip() == digest:
         print(f"Node.js가 이미 압축 해제되어 있습니다: {extracted_dir}")
-    else:
-        print("Node.js 압축 해제 중...")
-        try:
-            if node_archive.suffix == '.zip':
-                with zipfile.ZipFile(node_archive, 'r') as zip_ref:
-                    zip_ref.extractall(download_dir)
-            elif node_archive.suffix in ['.tar', '.gz', '.xz']:
-                import tarfile
-                with tarfile.open(node_archive, 'r:*') as tar_ref:
-                    tar_ref.extractall(download_dir)
-            print(f"✅ Node.js 압축 해제 완료: {extracted_dir}")
-        except Exception as e:
-            print(f"❌ Node.js 압축 해제 실패: {e}")
-            return None
+        return extracted_dir
+    
+    print("Node.js 압축 해제 중...")
+    staging_dir = download_dir / ".extracting"
+    try:
+        for directory in (staging_dir, extracted_dir):
+            if directory.exists():
+                shutil.rmtree(directory)
+        if node_archive.suffix == '.zip':
+            with zipfile.ZipFile(node_archive, 'r') as zip_ref:
+                zip_ref.extractall(staging_dir)
+        else:
+            import tarfile
+            with tarfile.open(node_archive, 'r:*') as tar_ref:
+                if hasattr(tarfile, 'data_filter'):
+                    tar_ref.extractall(staging_dir, filter='data')
+                else:
+                    tar_ref.extractall(staging_dir)
+        os.replace(staging_dir / node_folder, extracted_dir)
+        shutil.rmtree(staging_dir)
+        marker.write_text(digest, encoding='utf-8')
+        print(f"✅ Node.js 압축 해제 완료: {extracted_dir}")
+    except Exception as e:
+        print(f"❌ Node.js 압축 해제 실패: {e}")
+        return None
     
     return extracted_dir
 
-def prepare_nodejs_binaries(nodejs_dir):
-    """Node.js 바이너리 파일들을 빌드에 필요한 위치로 복사"""
+def prepare_nodejs_binaries(nodejs_dir, include_npm=False):
+    """
+    Node.js 바이너리 파일들을 빌드에 필요한 위치로 복사
+    서버는 node로 직접 실행하므로 include_npm이 아니면 node만 복사
+    """
     print("\n=== Node.js 바이너리 준비 ===")
     
-    # 빌드 디렉토리 생성
+    # 빌드 디렉토리 생성 (이전 빌드의 npm 파일이 섞이지 않도록 비움)
     build_bin_dir = Path("build_binaries")
-    build_bin_dir.mkdir(exist_ok=True)
+    if build_bin_dir.exists():
+        shutil.rmtree(build_bin_dir)
+    build_bin_dir.mkdir()
     
-    if sys.platform == "win32":
+    if not include_npm:
+        node_bin = nodejs_dir / NODE_NAME if sys.platform == "win32" else nodejs_dir / "bin" / "node"
+        if not node_bin.exists():
+            print(f"❌ {node_bin}을(를) 찾을 수 없습니다.")
+            return None
+        shutil.copy2(node_bin, build_bin_dir / NODE_NAME)
+        print(f"✅ {NODE_NAME} 복사됨 (npm 제외)")
+    elif sys.platform == "win32":
         # Windows
         node_exe = nodejs_dir / "node.exe"
         npm_cmd = nodejs_dir / "npm.cmd"
@@ -173,7 +696,7 @@ def prepare_nodejs_binaries(nodejs_dir):
             dest_node_modules = build_bin_dir / "node_modules"
             if dest_node_modules.exists():
                 shutil.rmtree(dest_node_modules)
-            shutil.copytree(node_modules, dest_node_modules)
+            copytree_parallel(node_modules, dest_node_modules)
             print(f"✅ node_modules 복사됨")
     
     else:
@@ -202,104 +725,156 @@ def prepare_nodejs_binaries(nodejs_dir):
             dest_lib = build_bin_dir / "lib"
             if dest_lib.exists():
                 shutil.rmtree(dest_lib)
-            shutil.copytree(lib_dir, dest_lib)
+            copytree_parallel(lib_dir, dest_lib)
             print(f"✅ lib 복사됨")
     
     return build_bin_dir
 
-def build_nextjs():
-    """Next.js 프로젝트 빌드"""
-    print("\n=== Next.js 프로젝트 빌드 ===")
+def install_npm_packages():
+    """npm 패키지 설치 (package-lock.json이 바뀐 경우에만 실행됨)"""
+    print("\n=== npm 패키지 설치 ===")
     
     # package.json 확인
     if not os.path.exists('package.json'):
         print("❌ package.json 파일을 찾을 수 없습니다.")
         return False
     
-    # node_modules 설치
-    if not os.path.exists('node_modules'):
-        print("npm 패키지 설치 중...")
-        if not run_command('npm install'):
-            return False
+    print("npm 패키지 설치 중...")
+    if not run_command('npm install'):
+        return False
+    
+    print("✅ npm 패키지 설치 완료")
+    return True
+
+def build_nextjs():
+    """Next.js 프로젝트 빌드"""
+    print("\n=== Next.js 프로젝트 빌드 ===")
     
     # Next.js 빌드
     print("Next.js 프로젝트 빌드 중...")
     if not run_command('npm run build'):
         return False
     
+    # standalone 서버는 .next/static과 public을 자기 폴더에서 제공하므로 함께 복사
+    if STANDALONE_DIR.exists():
+        copytree_parallel(Path('.next') / 'static', STANDALONE_DIR / '.next' / 'static')
+        if os.path.exists('public'):
+            copytree_parallel('public', STANDALONE_DIR / 'public')
+        print("✅ standalone 서버에 정적 파일 복사됨")
+    
     print("✅ Next.js 빌드 완료")
     return True
 
-def create_pyinstaller_spec(binaries_dir):
-    """PyInstaller spec 파일 생성"""
-    print("\n=== PyInstaller spec 파일 생성 ===")
+def server_files(binaries_dir, include_npm=False):
+    """
+    서버 실행에 필요한 파일 목록 [(원본, 넣을 위치)]
+    npm 없이 node로 실행하는 경우 node와 .next/standalone(정적 파일 포함)만 필요
+    """
+    files = [(binaries_dir / NODE_NAME, ".")]
+    if not include_npm:
+        files.append((STANDALONE_DIR, STANDALONE_DIR.as_posix()))
+        return [(source, target) for source, target in files if source.exists()]
     
-    # 플랫폼별 바이너리 파일 목록
+    # npm start를 위한 전체 구성 (기존 방식)
     if sys.platform == "win32":
-        node_files = [
-            (str(binaries_dir / "node.exe"), "."),
-            (str(binaries_dir / "npm.cmd"), "."),
-            (str(binaries_dir / "npx.cmd"), "."),
-        ]
-        # node_modules 폴더 추가
-        node_modules_dir = binaries_dir / "node_modules"
-        if node_modules_dir.exists():
-            node_files.append((str(node_modules_dir), "node_modules"))
+        files += [(binaries_dir / "npm.cmd", "."), (binaries_dir / "npx.cmd", "."),
+                  (binaries_dir / "node_modules", "node_modules")]
     else:
-        node_files = [
-            (str(binaries_dir / "node"), "."),
-            (str(binaries_dir / "npm"), "."),
-            (str(binaries_dir / "npx"), "."),
-        ]
-        # lib 폴더 추가
-        lib_dir = binaries_dir / "lib"
-        if lib_dir.exists():
-            node_files.append((str(lib_dir), "lib"))
+        files += [(binaries_dir / "npm", "."), (binaries_dir / "npx", "."), (binaries_dir / "lib", "lib")]
+    for item in ['.next', 'public', 'package.json', 'app', 'components',
+                 'next.config.mjs', 'postcss.config.mjs', 'tailwind.config.js']:
+        files.append((Path(item), item if Path(item).is_dir() else "."))
+    return [(source, target) for source, target in files if source.exists()]
+
+def render_pyinstaller_spec(binaries_dir, mode=DEFAULT_MODE, include_npm=False):
+    """PyInstaller spec 파일 내용"""
+    if mode == 'persistent':
+        # 서버 파일은 exe 밖의 zip으로 (exe에는 zip 정보만)
+        node_binaries = []
+        server_datas = [(str(PAYLOAD_DIR / "payload.json"), ".")]
+    else:
+        files = server_files(binaries_dir, include_npm)
+        node_binaries = [(str(source), target) for source, target in files if source.name == NODE_NAME]
+        server_datas = [(str(source), target) for source, target in files if source.name != NODE_NAME]
+    
+    if mode == 'onedir':
+        # 풀지 않고 exe 옆 폴더를 그대로 사용
+        package = f'''
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='{APP_NAME}',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=True,
+    console=False,  # GUI 앱이므로 콘솔 창 숨김
+    disable_windowed_traceback=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+)
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    name='{APP_NAME}',
+)
+'''
+    else:
+        package = f'''
+exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    [],
+    name='{APP_NAME}',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    runtime_tmpdir=None,
+    console=False,  # GUI 앱이므로 콘솔 창 숨김
+    disable_windowed_traceback=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+)
+'''
     
     spec_content = f'''# -*- mode: python ; coding: utf-8 -*-
+# build.py가 생성한 파일 (패키징 방식: {mode}, npm 포함: {include_npm})
 
 import sys  # sys 모듈 추가
-
-block_cipher = None
-
-# Next.js 프로젝트 파일들
-nextjs_files = []
-
-# .next 빌드 폴더
 import os
-if os.path.exists('.next'):
-    nextjs_files.append(('.next', '.next'))
-
-# public 폴더
-if os.path.exists('public'):
-    nextjs_files.append(('public', 'public'))
 
-# package.json
-if os.path.exists('package.json'):
-    nextjs_files.append(('package.json', '.'))
-
-# app 폴더
-if os.path.exists('app'):
-    nextjs_files.append(('app', 'app'))
+block_cipher = None
 
-# components 폴더
-if os.path.exists('components'):
-    nextjs_files.append(('components', 'components'))
+# Node.js 런타임과 서버 파일들
+node_binaries = {node_binaries}
+server_datas = {server_datas}
 
 # 설정 파일들
 config_files = []
-for config in ['next.config.mjs', 'postcss.config.mjs', 'tailwind.config.js', 'server_config.json']:
+for config in ['server_config.json']:
     if os.path.exists(config):
         config_files.append((config, '.'))
 
-# Node.js 바이너리들
-node_binaries = {node_files}
-
 a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=node_binaries,
-    datas=nextjs_files + config_files,
+    datas=server_datas + config_files,
     hiddenimports=[
         'tkinter',
         'tkinter.ttk',
@@ -318,51 +893,150 @@ a = Analysis(
 )
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
+{package}'''
+    return spec_content
 
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
-    [],
-    name='InspectionSystemManager',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console=False,  # GUI 앱이므로 콘솔 창 숨김
-    disable_windowed_traceback=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-)
-'''
+def spec_file(mode):
+    return f"standalone-{mode}.spec"
+
+def dist_dir(mode):
+    return Path('dist') / mode
+
+def exe_path(mode):
+    """빌드된 실행 파일 경로"""
+    if mode == 'onedir':
+        return dist_dir(mode) / APP_NAME / EXE_NAME
+    return dist_dir(mode) / EXE_NAME
+
+def create_pyinstaller_spec(binaries_dir, mode=DEFAULT_MODE, include_npm=False):
+    """PyInstaller spec 파일 생성 (내용이 같으면 다시 쓰지 않음)"""
+    print(f"\n=== PyInstaller spec 파일 생성 ({mode}) ===")
+    
+    spec_content = render_pyinstaller_spec(binaries_dir, mode, include_npm)
+    path = spec_file(mode)
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == spec_content:
+                print("✅ PyInstaller spec 파일 변경 없음")
+                return True
     
-    with open('standalone.spec', 'w', encoding='utf-8') as f:
+    with open(path, 'w', encoding='utf-8') as f:
         f.write(spec_content)
     
     print("✅ PyInstaller spec 파일 생성 완료")
     return True
 
-def build_exe():
-    """PyInstaller로 exe 파일 생성"""
-    print("\n=== EXE 파일 빌드 ===")
+def create_server_payload(binaries_dir, include_npm=False):
+    """
+    persistent 모드의 서버 파일 zip (dist/persistent/server-<버전>.zip)
+    버전은 zip 내용 해시라서 내용이 바뀐 빌드만 사용자 PC에서 다시 풀림
+    """
+    print("\n=== 서버 파일 zip 생성 (persistent) ===")
+    
+    target_dir = dist_dir('persistent')
+    target_dir.mkdir(parents=True, exist_ok=True)
+    temp_file = target_dir / "server.zip.tmp"
+    with zipfile.ZipFile(temp_file, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=6) as archive:
+        for source, target in server_files(binaries_dir, include_npm):
+            base = Path(target)
+            if source.is_dir():
+                for root, dirs, files in os.walk(source):
+                    dirs.sort()
+                    for name in sorted(files):
+                        path = Path(root) / name
+                        archive.write(path, (base / path.relative_to(source)).as_posix())
+            else:
+                archive.write(source, (base / source.name).as_posix())
+    
+    digest = file_sha256(temp_file)
+    version = digest[:16]
+    payload_name = f"server-{version}.zip"
+    for old in target_dir.glob("server-*.zip"):
+        old.unlink()
+    os.replace(temp_file, target_dir / payload_name)
+    
+    PAYLOAD_DIR.mkdir(exist_ok=True)
+    with open(PAYLOAD_DIR / "payload.json", 'w', encoding='utf-8') as f:
+        json.dump({'version': version, 'payload': payload_name, 'sha256': digest}, f, indent=2)
+    size = (target_dir / payload_name).stat().st_size
+    print(f"✅ 서버 파일 zip 생성 완료: {payload_name} ({size / 1024 / 1024:.1f}MB)")
+    return True
+
+def build_exe(mode=DEFAULT_MODE, clean=False):
+    """PyInstaller로 exe 파일 생성 (clean이 아니면 build/의 분석 결과 재사용)"""
+    print(f"\n=== EXE 파일 빌드 ({mode}) ===")
     
-    # PyInstaller 실행
-    if not run_command('pyinstaller standalone.spec --clean'):
+    # PyInstaller 실행 (방식마다 출력/작업 폴더를 나눠 동시에 빌드 가능)
+    command = (f'pyinstaller {spec_file(mode)} --noconfirm '
+               f'--distpath "{dist_dir(mode)}" --workpath "{Path("build") / mode}"')
+    if clean:
+        command += ' --clean'
+    if not run_command(command):
         return False
     
     print("✅ EXE 파일 생성 완료")
     return True
 
-def create_installer_script():
+def bundle_size(mode):
+    """배포할 파일 전체 크기 (설치 스크립트 제외)"""
+    total = 0
+    for root, dirs, files in os.walk(dist_dir(mode)):
+        total += sum(os.path.getsize(os.path.join(root, name)) for name in files if name != 'install.bat')
+    return total
+
+def measure_launch(mode, runs=2):
+    """
+    빌드된 exe를 헤드리스로 실행해 서버가 준비될 때까지의 시간 측정 (초 목록)
+    첫 번째는 처음 설치한 PC와 같은 상태 (persistent 모드의 서버 파일을 빈 폴더에 풂)
+    """
+    times = []
+    with tempfile.TemporaryDirectory(prefix="inspection-runtime-") as runtime_dir:
+        env = os.environ.copy()
+        env['INSPECTION_RUNTIME_DIR'] = runtime_dir
+        for _ in range(runs):
+            start = time.perf_counter()
+            try:
+                result = subprocess.run([str(exe_path(mode)), '--headless', '--exit-when-ready'],
+                                        env=env, capture_output=True, timeout=LAUNCH_TIMEOUT)
+            except (OSError, subprocess.TimeoutExpired) as e:
+                print(f"⚠️ {mode} 실행 시간 측정 실패: {e}")
+                return times
+            if result.returncode != 0:
+                print(f"⚠️ {mode} 실행 시간 측정 실패 (종료 코드 {result.returncode})")
+                return times
+            times.append(time.perf_counter() - start)
+    return times
+
+def print_bundle_report(modes, measure=False):
+    """방식별 배포 크기/실행 시간 표 (반환값: 보고서에 저장할 목록)"""
+    print("\n=== 패키징 방식별 크기/실행 시간 ===")
+    bundles = []
+    for mode in modes:
+        size = bundle_size(mode)
+        times = measure_launch(mode) if measure else []
+        line = f"  {mode:<11} {size / 1024 / 1024:8.1f}MB"
+        if times:
+            line += f"   첫 실행 {times[0]:6.1f}초"
+        if len(times) > 1:
+            line += f"   다시 실행 {times[1]:6.1f}초"
+        print(line)
+        bundles.append({'mode': mode, 'bytes': size, 'launch_seconds': [round(t, 2) for t in times]})
+    return bundles
+
+def create_installer_script(mode=DEFAULT_MODE):
     """간단한 설치 스크립트 생성"""
-    print("\n=== 설치 스크립트 생성 ===")
+    print(f"\n=== 설치 스크립트 생성 ({mode}) ===")
     
-    installer_script = '''@echo off
+    # 방식별 복사할 파일 (onedir는 폴더 전체, persistent는 exe + 서버 파일 zip)
+    if mode == 'onedir':
+        copy_files = 'xcopy /E /I /Y "InspectionSystemManager" "%PROGRAMFILES%\\InspectionSystem"'
+    elif mode == 'persistent':
+        copy_files = ('copy "InspectionSystemManager.exe" "%PROGRAMFILES%\\InspectionSystem\\"\n'
+                      'copy "server-*.zip" "%PROGRAMFILES%\\InspectionSystem\\"')
+    else:
+        copy_files = 'copy "InspectionSystemManager.exe" "%PROGRAMFILES%\\InspectionSystem\\"'
+    
+    installer_script = f'''@echo off
 echo 건축 현장 업무 검수 시스템 설치 중...
 
 :: 프로그램 폴더 생성
@@ -371,7 +1045,7 @@ if not exist "%PROGRAMFILES%\\InspectionSystem" (
 )
 
 :: 파일 복사
-copy "InspectionSystemManager.exe" "%PROGRAMFILES%\\InspectionSystem\\"
+{copy_files}
 
 :: 바탕화면 바로가기 생성
 powershell "$WshShell = New-Object -comObject WScript.Shell; $Shortcut = $WshShell.CreateShortcut('%USERPROFILE%\\Desktop\\건축 현장 업무 검수 시스템.lnk'); $Shortcut.TargetPath = '%PROGRAMFILES%\\InspectionSystem\\InspectionSystemManager.exe'; $Shortcut.Save()"
@@ -383,18 +1057,19 @@ echo 설치가 완료되었습니다!
 pause
 '''
     
-    os.makedirs('dist', exist_ok=True)
-    with open('dist/install.bat', 'w', encoding='cp949') as f:
+    os.makedirs(dist_dir(mode), exist_ok=True)
+    with open(dist_dir(mode) / 'install.bat', 'w', encoding='cp949') as f:
         f.write(installer_script)
     
     print("✅ 설치 스크립트 생성 완료")
+    return True
 
 def cleanup_temp_files():
     """임시 파일들 정리"""
     print("\n=== 임시 파일 정리 ===")
     
-    temp_dirs = ['temp_nodejs', 'build_binaries', 'build', '__pycache__']
-    temp_files = ['standalone.spec']
+    temp_dirs = ['temp_nodejs', 'build_binaries', str(PAYLOAD_DIR), 'build', '__pycache__']
+    temp_files = [spec_file(mode) for mode in PACKAGE_MODES]
     
     for temp_dir in temp_dirs:
         if os.path.exists(temp_dir):
@@ -412,52 +1087,125 @@ def cleanup_temp_files():
             except Exception as e:
                 print(f"⚠️ {temp_file} 삭제 실패: {e}")
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="건축 현장 업무 검수 시스템 스탠드얼론 빌드")
+    parser.add_argument('--force', action='store_true', help="빌드 캐시를 무시하고 모든 단계 실행")
+    parser.add_argument('--clean', action='store_true', help="PyInstaller 캐시도 지우고 빌드")
+    parser.add_argument('--jobs', type=int, default=DEFAULT_JOBS,
+                        help=f"동시에 실행할 단계 수 (기본 {DEFAULT_JOBS}, 1이면 순서대로)")
+    parser.add_argument('--node-cache', default=os.environ.get('NODE_ARCHIVE_CACHE'),
+                        help="Node.js 배포 파일 캐시 폴더 (기본: 사용자별 캐시 폴더)")
+    parser.add_argument('--node-mirror', default=os.environ.get('NODE_MIRROR_DIR'),
+                        help="Node.js 배포 파일 로컬 미러 폴더 (지정하면 네트워크를 쓰지 않음)")
+    parser.add_argument('--offline', action='store_true', help="네트워크 없이 캐시/미러만 사용")
+    parser.add_argument('--mode', default=DEFAULT_MODE,
+                        help=f"패키징 방식, 쉼표로 여러 개 ({', '.join(PACKAGE_MODES)}, all; 기본 {DEFAULT_MODE})")
+    parser.add_argument('--with-npm', action='store_true',
+                        help="npm과 전체 소스를 함께 넣음 (launch_mode 'npm'용, 기본은 node + standalone 빌드만)")
+    parser.add_argument('--measure-launch', action='store_true',
+                        help="빌드 후 방식별로 exe를 헤드리스로 실행해 서버 준비까지 걸린 시간 측정")
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """메인 빌드 프로세스"""
+    args = parse_args(argv)
     print("🏗️ 건축 현장 업무 검수 시스템 스탠드얼론 빌드 시작")
     print("=" * 60)
     
-    try:
+    modes = list(PACKAGE_MODES) if args.mode == 'all' else [mode.strip() for mode in args.mode.split(',')]
+    unknown = [mode for mode in modes if mode not in PACKAGE_MODES]
+    if unknown:
+        print(f"❌ 알 수 없는 패키징 방식: {', '.join(unknown)} ({', '.join(PACKAGE_MODES)}, all 중 선택)")
+        return False
+    
+    cache = BuildCache(force=args.force or args.clean)
+    report = BuildReport(jobs=args.jobs)
+    binaries_dir = Path("build_binaries")
+    include_npm = args.with_npm
+    
+    def pyinstaller_extra(mode):
+        def extra(results):
+            try:
+                import PyInstaller
+                pyinstaller_version = PyInstaller.__version__
+            except ImportError:
+                pyinstaller_version = None
+            fingerprints = [cache.stage_fingerprint('node_binaries'), cache.stage_fingerprint('nextjs_build')]
+            if mode == 'persistent':
+                fingerprints = [cache.stage_fingerprint('server_payload')]
+            return [sys.version, pyinstaller_version] + fingerprints
+        return extra
+    
+    # Node.js 다운로드/바이너리 준비와 npm 설치/Next.js 빌드는 서로 독립이라 동시에 실행
+    stages = [
         # 1. 의존성 확인
-        if not check_dependencies():
-            print("❌ 빌드 실패: 의존성 문제")
-            return False
-        
+        Stage('dependencies', lambda results: check_dependencies(), failure="의존성 문제"),
         # 2. Node.js 포터블 버전 다운로드
-        nodejs_dir = download_nodejs_portable()
-        if not nodejs_dir:
-            print("❌ 빌드 실패: Node.js 다운로드 오류")
-            return False
-        
-        # 3. Node.js 바이너리 준비
-        binaries_dir = prepare_nodejs_binaries(nodejs_dir)
-        if not binaries_dir:
-            print("❌ 빌드 실패: Node.js 바이너리 준비 오류")
-            return False
-        
-        # 4. Next.js 빌드
-        if not build_nextjs():
-            print("❌ 빌드 실패: Next.js 빌드 오류")
-            return False
-        
-        # 5. PyInstaller spec 파일 생성
-        if not create_pyinstaller_spec(binaries_dir):
-            print("❌ 빌드 실패: spec 파일 생성 오류")
-            return False
-        
-        # 6. EXE 파일 생성
-        if not build_exe():
-            print("❌ 빌드 실패: EXE 생성 오류")
+        Stage('node_download', lambda results: download_nodejs_portable(args.node_cache, args.node_mirror,
+                                                                         args.offline),
+              deps=['dependencies'],
+              failure="Node.js 다운로드 오류"),
+        # 3. Node.js 바이너리 준비 (Node.js 폴더 내용이 같으면 건너뜀)
+        Stage('node_binaries', lambda results: prepare_nodejs_binaries(results['node_download'], include_npm),
+              deps=['node_download'],
+              extra=lambda results: [sys.platform, include_npm,
+                                     (results['node_download'] / NODE_EXTRACT_MARKER).read_text(encoding='utf-8')],
+              outputs=[binaries_dir / NODE_NAME], failure="Node.js 바이너리 준비 오류"),
+        # 4. npm 패키지 설치 (package-lock.json이 같으면 건너뜀)
+        Stage('npm_install', lambda results: install_npm_packages(), deps=['dependencies'],
+              inputs=['package.json', 'package-lock.json'], extra=lambda results: [sys.platform],
+              outputs=[Path('node_modules') / '.package-lock.json'], failure="npm 패키지 설치 오류"),
+        # 5. Next.js 빌드 (소스/설정/의존성이 같으면 건너뜀)
+        Stage('nextjs_build', lambda results: build_nextjs(), deps=['npm_install'],
+              inputs=NEXTJS_INPUTS, extra=lambda results: [cache.stage_fingerprint('npm_install')],
+              outputs=[Path('.next') / 'BUILD_ID'], failure="Next.js 빌드 오류"),
+    ]
+    if 'persistent' in modes:
+        # 6. 서버 파일 zip (persistent 방식, node/Next.js 결과가 같으면 건너뜀)
+        stages.append(Stage(
+            'server_payload', lambda results: create_server_payload(binaries_dir, include_npm),
+            deps=['node_binaries', 'nextjs_build'],
+            extra=lambda results: [include_npm, cache.stage_fingerprint('node_binaries'),
+                                   cache.stage_fingerprint('nextjs_build')],
+            outputs=[PAYLOAD_DIR / "payload.json"], failure="서버 파일 zip 생성 오류"))
+    
+    for mode in modes:
+        payload_deps = ['server_payload'] if mode == 'persistent' else ['node_binaries', 'nextjs_build']
+        stages += [
+            # 7. PyInstaller spec 파일 생성 (내용이 같으면 파일을 건드리지 않음)
+            Stage(f'spec_{mode}', lambda results, mode=mode: create_pyinstaller_spec(binaries_dir, mode, include_npm),
+                  deps=payload_deps,
+                  extra=lambda results, mode=mode: [render_pyinstaller_spec(binaries_dir, mode, include_npm)],
+                  outputs=[spec_file(mode)], failure="spec 파일 생성 오류"),
+            # 8. EXE 파일 생성 (Python 소스, spec, 앞 단계 결과가 같으면 건너뜀)
+            Stage(f'pyinstaller_{mode}', lambda results, mode=mode: build_exe(mode, clean=args.clean),
+                  deps=[f'spec_{mode}'],
+                  inputs=PYTHON_INPUTS + [spec_file(mode), 'server_config.json'], extra=pyinstaller_extra(mode),
+                  outputs=[exe_path(mode)], failure="EXE 생성 오류"),
+            # 9. 설치 스크립트 생성
+            Stage(f'installer_{mode}', lambda results, mode=mode: create_installer_script(mode),
+                  deps=[f'pyinstaller_{mode}']),
+        ]
+    
+    stdout = sys.stdout
+    sys.stdout = PrefixedOutput(stdout)
+    try:
+        results, failed = run_stage_graph(stages, cache, report, jobs=args.jobs)
+        sys.stdout = stdout
+        if failed:
+            print(f"❌ 빌드 실패: {failed.failure}")
             return False
         
-        # 7. 설치 스크립트 생성
-        create_installer_script()
+        report.bundles = print_bundle_report(modes, measure=args.measure_launch)
         
         print("\n" + "=" * 60)
         print("🎉 스탠드얼론 빌드 완료!")
         print("📁 생성된 파일:")
-        print("   - dist/InspectionSystemManager.exe (Node.js 런타임 포함)")
-        print("   - dist/install.bat")
+        for mode in modes:
+            print(f"   - {exe_path(mode)} (Node.js 런타임 포함)")
+            if mode == 'persistent':
+                print(f"   - {dist_dir(mode)}/server-*.zip (처음 실행할 때 사용자 폴더에 한 번 풀림)")
+            print(f"   - {dist_dir(mode) / 'install.bat'}")
         print("\n✨ 특징:")
         print("   - Node.js 설치 불필요")
         print("   - 완전한 스탠드얼론 실행 파일")
@@ -469,12 +1217,19 @@ def main():
         return True
         
     except KeyboardInterrupt:
+        sys.stdout = stdout
         print("\n사용자에 의해 빌드가 중단되었습니다.")
         return False
     except Exception as e:
+        sys.stdout = stdout
         print(f"\n예상치 못한 오류 발생: {e}")
         return False
     finally:
+        sys.stdout = stdout
+        if report.stages:
+            report.print_table()
+            report.save()
+        
         # 임시 파일 정리 (선택사항)
         print("\n임시 파일을 정리하시겠습니까? (y/N): ", end="")
         try:
@@ -0,0 +1,44 @@
+import { createHash } from 'crypto';
+import { mkdir, writeFile, rename, utimes } from 'fs/promises';
+import path from 'path';
+import { uploadFilePath } from '@/lib/paths';
+
+// 업로드 파일 저장소 (내용 기준 중복 제거)
+// public/uploads/store/<해시 앞 2자리>/<sha256><확장자>에 같은 내용은 한 번만 저장
+// 서버 관리자의 manager/storage.py와 같은 구조
+// 참조하는 프로젝트가 없어진 파일은 여기서 지우지 않고, 서버 관리자가 잠금을 잡은 채
+// 일정 시간(유예 기간) 동안 수정 시각이 바뀌지 않은 파일만 정리함 (ContentStore.collect_garbage)
+export const STORE_URL = '/uploads/store/';
+
+// 파일 내용으로 저장소 경로(URL) 계산
+export function contentFilePath(buffer, originalName) {
+  const digest = createHash('sha256').update(buffer).digest('hex');
+  const ext = (path.extname(originalName || '') || '.xlsx').toLowerCase();
+  return `${STORE_URL}${digest.slice(0, 2)}/${digest}${ext}`;
+}
+
+// 저장소에 저장 (같은 내용이 이미 있으면 쓰지 않음), filePath 반환
+export async function storeContent(buffer, originalName) {
+  const filePath = contentFilePath(buffer, originalName);
+  const fullPath = uploadFilePath(filePath);
+  
+  // 이미 있으면 수정 시각만 갱신해서 정리 유예 기간 동안 지워지지 않게 함
+  const now = new Date();
+  try {
+    await utimes(fullPath, now, now);
+    return filePath;
+  } catch (error) {
+    if (error.code !== 'ENOENT') {
+      // 파일은 있지만 수정 시각을 바꿀 수 없는 경우 (권한 등) 그대로 사용
+      console.error('저장소 파일 수정 시각 갱신 오류:', error);
+      return filePath;
+    }
+    // 없으면 새로 저장
+  }
+  
+  await mkdir(path.dirname(fullPath), { recursive: true });
+  const tempPath = `${fullPath}.${process.pid}.tmp`;
+  await writeFile(tempPath, buffer);
+  await rename(tempPath, fullPath);
+  return filePath;
+}
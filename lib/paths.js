@@ -0,0 +1,16 @@
+import path from 'path';
+
+// 데이터/업로드 폴더
+// 서버 관리자가 DATA_PATH/UPLOADS_PATH 환경 변수로 설정과 같은 폴더를 알려 줌
+// (standalone 서버는 자기 폴더로 이동해서 실행되므로 process.cwd()는 관리자의 폴더와 다름)
+export const dataDir = process.env.DATA_PATH || path.join(process.cwd(), 'data');
+export const uploadsDir = process.env.UPLOADS_PATH || path.join(process.cwd(), 'public', 'uploads');
+
+// 프로젝트의 filePath(/uploads/...)를 실제 파일 경로로 변환 (manager/storage.py의 to_path와 같은 규칙)
+export function uploadFilePath(filePath) {
+  let relative = filePath.replace(/^\/+/, '');
+  if (relative.startsWith('uploads/')) {
+    relative = relative.slice('uploads/'.length);
+  }
+  return path.join(uploadsDir, ...relative.split('/'));
+}
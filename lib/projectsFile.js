@@ -0,0 +1,100 @@
+import { readFile, writeFile, rename, unlink, stat, mkdir, open } from 'fs/promises';
+import path from 'path';
+import { dataDir } from '@/lib/paths';
+
+// 프로젝트 목록 파일 (data/projects.json)
+// 서버 관리자(manager/projectsfile.py)와 같은 규칙으로 씀:
+// projects.json.lock 잠금 파일을 만든 뒤 최신 내용을 다시 읽어 바꾸고,
+// 읽은 뒤 파일이 바뀌지 않았을 때만 임시 파일로 교체
+export const projectsFile = path.join(dataDir, 'projects.json');
+const lockFile = `${projectsFile}.lock`;
+const LOCK_TIMEOUT_MS = 10000;
+const STALE_LOCK_MS = 30000;
+const LOCK_RETRY_MS = 50;
+const MAX_ATTEMPTS = 5;
+
+const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
+
+async function fileState(file) {
+  try {
+    const info = await stat(file, { bigint: true });
+    return `${info.size}:${info.mtimeNs}`;
+  } catch (error) {
+    if (error.code === 'ENOENT') {
+      return null;
+    }
+    throw error;
+  }
+}
+
+// 프로젝트 목록 읽기 (파일이 없으면 빈 배열)
+export async function readProjects() {
+  try {
+    return JSON.parse(await readFile(projectsFile, 'utf8'));
+  } catch (error) {
+    if (error.code === 'ENOENT') {
+      return [];
+    }
+    throw error;
+  }
+}
+
+async function acquireLock() {
+  const deadline = Date.now() + LOCK_TIMEOUT_MS;
+  for (;;) {
+    try {
+      const handle = await open(lockFile, 'wx');
+      await handle.writeFile(String(process.pid));
+      await handle.close();
+      return;
+    } catch (error) {
+      if (error.code !== 'EEXIST') {
+        throw error;
+      }
+    }
+    // 비정상 종료로 남은 잠금 파일 정리
+    try {
+      const info = await stat(lockFile);
+      if (Date.now() - info.mtimeMs > STALE_LOCK_MS) {
+        await unlink(lockFile);
+        continue;
+      }
+    } catch (error) {
+      continue;
+    }
+    if (Date.now() >= deadline) {
+      throw new Error('프로젝트 목록 잠금을 얻지 못했습니다');
+    }
+    await sleep(LOCK_RETRY_MS);
+  }
+}
+
+// 잠금을 잡고 최신 목록에 change(projects)를 적용해 저장
+// change는 배열을 직접 바꾸거나 새 배열을 반환, 반환값: 저장한 배열
+export async function updateProjects(change) {
+  await mkdir(dataDir, { recursive: true });
+  await acquireLock();
+  try {
+    for (let attempt = 0; attempt < MAX_ATTEMPTS; attempt++) {
+      const state = await fileState(projectsFile);
+      let projects = await readProjects();
+      const changed = await change(projects);
+      if (Array.isArray(changed)) {
+        projects = changed;
+      }
+
+      const tempFile = `${projectsFile}.${process.pid}.tmp`;
+      await writeFile(tempFile, JSON.stringify(projects, null, 2));
+      if (await fileState(projectsFile) !== state) {
+        // 읽은 뒤 다른 프로그램이 바꿨으면 다시 읽어서 적용
+        await unlink(tempFile);
+        continue;
+      }
+      await rename(tempFile, projectsFile);
+      return projects;
+    }
+    throw new Error('projects.json이 계속 바뀌어 저장하지 못했습니다');
+  } finally {
+    await unlink(lockFile).catch(() => {});
+  }
+}
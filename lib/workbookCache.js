@@ -0,0 +1,59 @@
+import { createHash } from 'crypto';
+import { readFile, writeFile, rename, stat, utimes, mkdir } from 'fs/promises';
+import path from 'path';
+import { dataDir } from '@/lib/paths';
+
+// 엑셀 파일 읽기 결과 캐시
+// data/cache/workbooks/<filePath의 sha256>.json (서버 관리자의 manager/cache.py와 같은 형식)
+// 원본 파일의 크기/수정 시각이 같으면 엑셀 파일을 다시 읽지 않음
+const cacheDir = path.join(dataDir, 'cache', 'workbooks');
+const CACHE_VERSION = 1;
+
+function cacheFile(filePath) {
+  const key = createHash('sha256').update(filePath, 'utf8').digest('hex');
+  return path.join(cacheDir, `${key}.json`);
+}
+
+// 원본 파일 상태 (나노초 수정 시각 비교용)
+export async function workbookStat(fullPath) {
+  return stat(fullPath, { bigint: true });
+}
+
+// 캐시된 응답 (없거나 원본이 바뀌었으면 null)
+export async function readCachedWorkbook(filePath, fileStat) {
+  const file = cacheFile(filePath);
+  try {
+    const entry = JSON.parse(await readFile(file, 'utf8'));
+    if (entry.version !== CACHE_VERSION ||
+        entry.size !== Number(fileStat.size) ||
+        entry.mtimeNs !== fileStat.mtimeNs.toString()) {
+      return null;
+    }
+    // 캐시 파일 수정 시각 = 마지막 사용 시각 (오래 사용하지 않은 것부터 삭제)
+    const now = new Date();
+    utimes(file, now, now).catch(() => {});
+    return entry.response;
+  } catch (error) {
+    return null;
+  }
+}
+
+// 읽기 결과 저장 (실패해도 응답에는 영향 없음)
+export async function writeCachedWorkbook(filePath, fileStat, buffer, response) {
+  const file = cacheFile(filePath);
+  const tempFile = `${file}.${process.pid}.tmp`;
+  try {
+    await mkdir(cacheDir, { recursive: true });
+    await writeFile(tempFile, JSON.stringify({
+      version: CACHE_VERSION,
+      filePath: filePath,
+      size: Number(fileStat.size),
+      mtimeNs: fileStat.mtimeNs.toString(),
+      digest: createHash('sha256').update(buffer).digest('hex'),
+      response: response
+    }));
+    await rename(tempFile, file);
+  } catch (error) {
+    console.warn('엑셀 캐시 저장 실패:', error.message);
+  }
+}
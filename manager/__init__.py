@@ -0,0 +1,4 @@
+"""
+건축 현장 업무 검수 시스템 - 서버 관리자 공용 모듈
+GUI(tkinter/pystray)에 의존하지 않는 서버 수명주기 관련 기능을 모아 둡니다.
+"""
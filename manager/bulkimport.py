@@ -0,0 +1,251 @@
+"""
+검수 양식 일괄 등록
+폴더의 엑셀 파일을 프로세스 풀에서 동시에 읽어 프로젝트 정보(2~6행)와 양식을 확인하고,
+통과한 파일을 업로드 저장소에 넣은 뒤 모든 프로젝트를 projects.json에 한 번에 등록합니다.
+(잠금을 잡고 최신 목록에 합치므로 그동안 웹 화면에서 추가한 프로젝트도 그대로 남음)
+(웹 화면의 파일 업로드와 같은 프로젝트 정보/기본값)
+
+실행: python -m manager.bulkimport [--config server_config.json] [--workers N] [--dry-run] 폴더
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from manager.projectsfile import load_projects, modify_projects, projects_path
+from manager.storage import ContentStore, file_digest
+from manager.watcher import is_workbook
+from manager.workbook import read_template
+
+# 웹 업로드(app/api/upload)와 같은 기본값
+DEFAULT_INFO = {
+    'location': "위치 미정",
+    'generalManager': "담당자 미정",
+    'inspector': "검수자 미정",
+}
+INFO_LABELS = {
+    'projectName': "프로젝트명",
+    'location': "현장",
+    'generalManager': "총괄담당자",
+    'inspector': "검수자",
+    'inspectionDate': "검수일자",
+}
+
+# 이 수보다 적으면 프로세스를 띄우지 않고 바로 읽음
+MIN_FILES_FOR_POOL = 4
+
+
+def scan_folder(folder, recursive=True):
+    """폴더의 엑셀 파일 목록 (이름순)"""
+    paths = []
+    for root, dirs, files in os.walk(folder):
+        dirs.sort()
+        paths.extend(os.path.join(root, name) for name in sorted(files) if is_workbook(name))
+        if not recursive:
+            break
+    return paths
+
+
+def inspect_workbook(path):
+    """
+    파일 하나 읽기/확인 (작업 프로세스에서 실행)
+    반환값: {'path', 'digest', 'info', 'rows', 'warnings', 'error'}
+    """
+    result = {'path': path, 'digest': None, 'info': {}, 'rows': 0, 'warnings': [], 'error': None}
+    try:
+        template = read_template(path)
+        result['digest'] = file_digest(path)
+    except (OSError, ValueError) as e:
+        result['error'] = str(e)
+        return result
+
+    if not template.header_found:
+        result['error'] = "8행에 양식 헤더(대분류, 중분류, ...)가 없습니다."
+        return result
+    if len(template) == 0:
+        result['error'] = "검수 항목(9행부터)이 없습니다."
+        return result
+
+    info = {key: str(value).strip() for key, value in template.project_info.items()}
+    missing = [INFO_LABELS[key] for key in INFO_LABELS if not info.get(key)]
+    if missing:
+        result['warnings'].append("비어 있는 항목: " + ", ".join(missing))
+    result['info'] = info
+    result['rows'] = len(template)
+    return result
+
+
+class ImportReport:
+    """일괄 등록 결과"""
+
+    def __init__(self, total):
+        self.total = total
+        self.imported = []      # (경로, 프로젝트)
+        self.skipped = []       # (경로, 사유)
+        self.failed = []        # (경로, 오류)
+        self.warnings = []      # (경로, 경고)
+        self.bytes = 0
+        self.elapsed = 0.0
+
+    @property
+    def throughput(self):
+        """초당 처리 파일 수"""
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+    def summary_text(self):
+        return (f"파일 {self.total}개: 등록 {len(self.imported)}개, 건너뜀 {len(self.skipped)}개, "
+                f"오류 {len(self.failed)}개 ({self.elapsed:.1f}초, 초당 {self.throughput:.1f}개)")
+
+    def lines(self, root=None):
+        """파일별 결과 (오류/건너뜀/경고)"""
+        def name(path):
+            return os.path.relpath(path, root) if root else path
+
+        lines = [self.summary_text()]
+        for path, error in self.failed:
+            lines.append(f"  [오류] {name(path)}: {error}")
+        for path, reason in self.skipped:
+            lines.append(f"  [건너뜀] {name(path)}: {reason}")
+        for path, warning in self.warnings:
+            lines.append(f"  [경고] {name(path)}: {warning}")
+        return lines
+
+
+class BulkImporter:
+    """폴더 일괄 등록"""
+
+    def __init__(self, uploads_path, data_path, workers=0, log=print):
+        self.store = ContentStore(uploads_path, data_path, log=log)
+        self.data_path = data_path
+        self.workers = workers or os.cpu_count() or 1
+        self.log = log
+
+    def inspect_all(self, paths, progress=None):
+        """모든 파일 읽기/확인, progress(완료 수, 전체 수, 결과)"""
+        results = []
+
+        def done(result):
+            results.append(result)
+            if progress:
+                progress(len(results), len(paths), result)
+
+        if self.workers <= 1 or len(paths) < MIN_FILES_FOR_POOL:
+            for path in paths:
+                done(inspect_workbook(path))
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(paths))) as executor:
+                futures = [executor.submit(inspect_workbook, path) for path in paths]
+                for future in as_completed(futures):
+                    done(future.result())
+
+        order = {path: i for i, path in enumerate(paths)}
+        results.sort(key=lambda result: order[result['path']])
+        return results
+
+    def run(self, folder, recursive=True, dry_run=False, allow_duplicates=False, progress=None):
+        """폴더의 엑셀 파일 등록, 반환값: ImportReport"""
+        start = time.perf_counter()
+        paths = scan_folder(folder, recursive)
+        report = ImportReport(len(paths))
+        results = self.inspect_all(paths, progress)
+
+        existing = load_projects(projects_path(self.data_path))
+        registered = set(self.store.refcounts(existing))
+        used_ids = {str(project.get('id')) for project in existing}
+
+        today = time.strftime('%Y-%m-%d')
+        next_id = int(time.time() * 1000)
+        new_projects = []
+        for result in results:
+            path = result['path']
+            if result['error']:
+                report.failed.append((path, result['error']))
+                continue
+
+            ext = os.path.splitext(path)[1] or '.xlsx'
+            file_url = self.store.to_url(self.store.blob_relpath(result['digest'], ext))
+            if file_url in registered and not allow_duplicates:
+                report.skipped.append((path, "같은 내용의 파일이 이미 등록되어 있습니다."))
+                continue
+            registered.add(file_url)
+
+            for warning in result['warnings']:
+                report.warnings.append((path, warning))
+
+            while str(next_id) in used_ids:
+                next_id += 1
+            used_ids.add(str(next_id))
+
+            info = result['info']
+            filename = os.path.basename(path).replace(" ", "_")
+            project = {
+                'id': next_id,
+                'projectName': info.get('projectName') or os.path.splitext(filename)[0],
+                'location': info.get('location') or DEFAULT_INFO['location'],
+                'generalManager': info.get('generalManager') or DEFAULT_INFO['generalManager'],
+                'inspector': info.get('inspector') or DEFAULT_INFO['inspector'],
+                'inspectionDate': info.get('inspectionDate', ""),
+                'uploadDate': today,
+                'lastModified': today,
+                'filePath': file_url,
+            }
+            if not dry_run:
+                self.store.put_file(path, digest=result['digest'])
+            report.imported.append((path, project))
+            report.bytes += os.path.getsize(path)
+            new_projects.append(project)
+
+        if new_projects and not dry_run:
+            def merge(projects):
+                # 파일을 읽은 뒤 웹 서버가 추가한 프로젝트와 id가 겹치면 다음 id 사용
+                used = {str(project.get('id')) for project in projects}
+                for project in new_projects:
+                    while str(project['id']) in used:
+                        project['id'] += 1
+                    used.add(str(project['id']))
+                return projects + new_projects
+
+            modify_projects(projects_path(self.data_path), merge)
+
+        report.elapsed = time.perf_counter() - start
+        return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="폴더의 검수 양식 엑셀 파일 일괄 등록")
+    parser.add_argument('folder', help="엑셀 파일이 있는 폴더")
+    parser.add_argument('--config', default='server_config.json', help="서버 관리자 설정 파일")
+    parser.add_argument('--workers', type=int, default=0, help="작업 프로세스 수 (0=CPU 수)")
+    parser.add_argument('--no-recursive', action='store_true', help="하위 폴더 제외")
+    parser.add_argument('--allow-duplicates', action='store_true', help="이미 등록된 내용의 파일도 등록")
+    parser.add_argument('--dry-run', action='store_true', help="등록하지 않고 확인만")
+    args = parser.parse_args(argv)
+
+    config = {}
+    if os.path.exists(args.config):
+        with open(args.config, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    importer = BulkImporter(
+        config.get('uploads_path', os.path.join(os.getcwd(), 'public', 'uploads')),
+        config.get('data_path', os.path.join(os.getcwd(), 'data')),
+        workers=args.workers
+    )
+
+    def progress(done, total, result):
+        status = "오류" if result['error'] else "확인"
+        print(f"\r[{done}/{total}] {status}: {os.path.basename(result['path'])}".ljust(80), end='', flush=True)
+
+    report = importer.run(args.folder, recursive=not args.no_recursive, dry_run=args.dry_run,
+                          allow_duplicates=args.allow_duplicates, progress=progress)
+    print()
+    if args.dry_run:
+        print("(미리 보기, 등록하지 않음)")
+    print("\n".join(report.lines(args.folder)))
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""
+엑셀 파일 읽기 결과 캐시
+웹 서버(lib/workbookCache.js)가 /api/excel 응답(data, projectInfo, sheetName)을
+data_path/cache/workbooks/<filePath의 SHA-256>.json에 저장하고, 원본 파일의 크기/수정 시각이
+같으면 엑셀 파일을 다시 읽지 않습니다.
+
+캐시 항목은 웹 서버만 만듭니다. (응답 형식과 날짜/헤더 처리 규칙을 한 곳에서만 관리)
+서버 관리자는 전체 크기를 관리하고, 미리 읽기(prewarm)도 웹 서버에 /api/excel을 요청해서 합니다.
+
+캐시 파일의 수정 시각을 마지막 사용 시각으로 써서 (웹 서버도 사용할 때 갱신)
+전체 크기가 예산을 넘으면 가장 오래 사용하지 않은 것부터 지웁니다.
+웹 서버가 새로 만든 캐시 파일도 예산에 포함되도록 start()의 백그라운드 스레드가
+주기적으로 폴더를 다시 읽고 정리합니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+from manager.storage import ContentStore, format_size
+
+CACHE_DIR = os.path.join('cache', 'workbooks')
+CACHE_VERSION = 1
+
+
+def cache_key(file_url):
+    """캐시 파일 이름 (filePath의 SHA-256, lib/workbookCache.js와 같은 계산)"""
+    return hashlib.sha256(file_url.encode('utf-8')).hexdigest()
+
+
+class WorkbookCache:
+    """엑셀 파일 읽기 결과 캐시 (바이트 예산 + LRU)"""
+
+    def __init__(self, data_path, uploads_path, budget_bytes=64 * 1024 * 1024, log=print):
+        self.cache_dir = os.path.join(data_path, CACHE_DIR)
+        self.store = ContentStore(uploads_path, data_path, log=log)
+        self.budget_bytes = budget_bytes
+        self.log = log
+
+        self.evictions = 0
+        self.total_bytes = 0
+        self._sizes = {}            # 캐시 파일 이름 -> 크기
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._scan()
+
+    def _scan(self):
+        """캐시 파일 목록 다시 읽기 (웹 서버가 만든 항목 포함), 반환값: [(마지막 사용 시각, 이름)]"""
+        used = []
+        self._sizes = {}
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.json'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                self._sizes[entry.name] = stat.st_size
+                used.append((stat.st_mtime_ns, entry.name))
+        self.total_bytes = sum(self._sizes.values())
+        return used
+
+    def _entry_path(self, file_url):
+        return os.path.join(self.cache_dir, cache_key(file_url) + '.json')
+
+    def _load_entry(self, path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry if entry.get('version') == CACHE_VERSION else None
+
+    def has_entry(self, file_url):
+        """원본 파일의 크기/수정 시각과 맞는 캐시 항목이 있는지 (웹 서버와 같은 기준)"""
+        try:
+            stat = os.stat(self.store.to_path(file_url))
+        except OSError:
+            return False
+        entry = self._load_entry(self._entry_path(file_url))
+        return (entry is not None and entry.get('size') == stat.st_size
+                and entry.get('mtimeNs') == str(stat.st_mtime_ns))
+
+    def _remove(self, name):
+        try:
+            os.remove(os.path.join(self.cache_dir, name))
+        except FileNotFoundError:
+            pass
+        self.total_bytes -= self._sizes.pop(name, 0)
+
+    def _evict(self):
+        """예산을 넘으면 마지막 사용 시각(캐시 파일 수정 시각)이 오래된 것부터 삭제"""
+        if self.total_bytes <= self.budget_bytes:
+            return
+        used = sorted(self._scan())
+        for _, name in used:
+            if self.total_bytes <= self.budget_bytes:
+                break
+            self._remove(name)
+            self.evictions += 1
+
+    def trim(self):
+        """캐시 폴더를 다시 읽고 (웹 서버가 만든 항목 포함) 예산을 넘으면 정리, 반환값: 삭제한 수"""
+        with self._lock:
+            evictions = self.evictions
+            self._scan()
+            self._evict()
+            return self.evictions - evictions
+
+    def start(self, interval=60.0):
+        """백그라운드 스레드에서 주기적으로 trim()"""
+        self._thread = threading.Thread(target=self._run, args=(interval,), name='cache-trim', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self, interval):
+        while not self._stop.wait(interval):
+            try:
+                removed = self.trim()
+                if removed:
+                    self.log(f"엑셀 캐시 정리: {removed}개 삭제 ({self.summary_text()})")
+            except OSError as e:
+                self.log(f"엑셀 캐시 정리 오류: {e}")
+
+    def invalidate(self, file_url):
+        """캐시 항목 삭제"""
+        with self._lock:
+            self._remove(cache_key(file_url) + '.json')
+
+    def invalidate_paths(self, paths):
+        """실제 파일 경로 목록의 캐시 삭제 (업로드 폴더 감시에서 사용), 반환값: 삭제한 수"""
+        root = os.path.abspath(self.store.uploads_path)
+        count = 0
+        for path in paths:
+            relative = os.path.relpath(os.path.abspath(path), root)
+            if relative.startswith('..'):
+                continue
+            name = cache_key('/uploads/' + relative.replace(os.sep, '/')) + '.json'
+            with self._lock:
+                if os.path.exists(os.path.join(self.cache_dir, name)):
+                    self._remove(name)
+                    count += 1
+        return count
+
+    def prewarm(self, projects, base_url, limit=20, timeout=30.0):
+        """
+        최근 수정된 프로젝트부터 limit개를 웹 서버(base_url)의 /api/excel로 미리 읽어 캐시
+        반환값: (새로 읽은 수, 이미 있던 수, 실패 수)
+        """
+        # requests는 로드 시간이 길어 미리 읽기를 할 때 가져옴
+        import requests
+
+        recent = sorted(projects, key=lambda project: (project.get('lastModified') or '',
+                                                        str(project.get('id'))), reverse=True)
+        loaded = cached = failed = 0
+        seen = set()
+        with requests.Session() as session:
+            for project in recent:
+                file_url = project.get('filePath')
+                if not file_url or file_url in seen:
+                    continue
+                seen.add(file_url)
+                if len(seen) > limit:
+                    break
+                if self.has_entry(file_url):
+                    cached += 1
+                    continue
+                try:
+                    response = session.post(f"{base_url}/api/excel", json={'filePath': file_url}, timeout=timeout)
+                    ok = response.ok and response.json().get('success')
+                except (requests.RequestException, ValueError):
+                    ok = False
+                if ok:
+                    loaded += 1
+                else:
+                    failed += 1
+        self.trim()
+        return loaded, cached, failed
+
+    def stats(self):
+        return {
+            'evictions': self.evictions,
+            'entries': len(self._sizes),
+            'bytes': self.total_bytes,
+            'budget_bytes': self.budget_bytes,
+        }
+
+    def summary_text(self):
+        stats = self.stats()
+        return (f"캐시 {stats['entries']}개 ({format_size(stats['bytes'])}/{format_size(stats['budget_bytes'])}), "
+                f"삭제 {stats['evictions']}")
@@ -0,0 +1,284 @@
+"""
+클러스터 모드
+Next.js 서버를 내부 포트에서 여러 개 실행하고, 설정된 서버 포트에서
+asyncio 리버스 프록시가 요청을 정상 상태의 워커들에게 나눠 줍니다.
+
+프록시는 요청마다 워커를 고르기 위해 업스트림/클라이언트 연결 모두
+"Connection: close"로 처리합니다 (로컬 연결이므로 비용이 작음).
+"""
+
+import asyncio
+import itertools
+import threading
+import time
+
+# 워커 수 자동 설정 시 최대값 (워커당 메모리 사용량 고려)
+MAX_AUTO_WORKERS = 4
+
+HOP_BY_HOP_HEADERS = {
+    b'connection', b'keep-alive', b'proxy-connection', b'te', b'trailer', b'upgrade',
+}
+
+
+def default_worker_count(cpu_count):
+    """CPU 코어 수로 워커 수 결정 (1 ~ MAX_AUTO_WORKERS)"""
+    return max(1, min(cpu_count or 1, MAX_AUTO_WORKERS))
+
+
+class Worker:
+    """Next.js 워커 프로세스 상태"""
+
+    def __init__(self, index, port):
+        self.index = index
+        self.port = port
+        self.process = None
+        self.started_at = None
+        self.healthy = False
+        self.active = 0             # 처리 중인 요청 수
+        self.requests = 0           # 처리한 요청 수
+        self.errors = 0             # 연결 실패 수
+        self.failed_checks = 0      # 연속 상태 확인 실패 수
+        self.last_check = None
+
+    @property
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def status_text(self):
+        if not self.alive:
+            state = "종료됨"
+        elif self.healthy:
+            state = "정상"
+        else:
+            state = "응답 없음"
+        return (f"워커 {self.index + 1} (포트 {self.port}): {state} · "
+                f"처리 중 {self.active} · 요청 {self.requests} · 오류 {self.errors}")
+
+
+class ClusterProxy:
+    """요청 단위 부하 분산 리버스 프록시 (별도 스레드의 asyncio 루프에서 실행)"""
+
+    def __init__(self, listen_port, workers, listen_host='0.0.0.0',
+                 health_interval=2.0, health_timeout=1.5, unhealthy_after=2,
+                 connect_timeout=2.0, header_timeout=30.0, log=print):
+        self.listen_host = listen_host
+        self.listen_port = listen_port
+        self.workers = workers
+        self.health_interval = health_interval
+        self.health_timeout = health_timeout
+        self.unhealthy_after = unhealthy_after
+        self.connect_timeout = connect_timeout
+        self.header_timeout = header_timeout
+        self.log = log
+
+        self._rr = itertools.count()
+        self._loop = None
+        self._thread = None
+        self._server = None
+        self._health_task = None
+        self._start_error = None
+
+    # ---- 수명주기 ----
+
+    def start(self, timeout=5.0):
+        """프록시 시작 (포트 바인딩에 실패하면 예외 발생)"""
+        self._loop = asyncio.new_event_loop()
+        ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(ready,),
+                                        name='cluster-proxy', daemon=True)
+        self._thread.start()
+        ready.wait(timeout)
+        if self._start_error:
+            raise self._start_error
+
+    def _run(self, ready):
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._server = self._loop.run_until_complete(
+                asyncio.start_server(self._handle_client, self.listen_host, self.listen_port)
+            )
+        except Exception as e:
+            self._start_error = e
+            ready.set()
+            self._loop.close()
+            return
+
+        self._health_task = self._loop.create_task(self._health_loop())
+        ready.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    def stop(self, timeout=5.0):
+        """프록시 중지"""
+        if not self._loop or self._loop.is_closed():
+            return
+        try:
+            future = asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop)
+            future.result(timeout)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+
+    async def _shutdown(self):
+        if self._health_task:
+            self._health_task.cancel()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+
+    def healthy_count(self):
+        return sum(1 for worker in self.workers if worker.healthy)
+
+    # ---- 상태 확인 ----
+
+    async def _health_loop(self):
+        while True:
+            await asyncio.gather(*(self._check_worker(worker) for worker in self.workers))
+            await asyncio.sleep(self.health_interval)
+
+    async def _check_worker(self, worker):
+        if not worker.alive:
+            self._set_healthy(worker, False)
+            return
+
+        ok = False
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection('127.0.0.1', worker.port), self.health_timeout)
+            try:
+                writer.write(b"HEAD / HTTP/1.1\r\nHost: 127.0.0.1\r\nConnection: close\r\n\r\n")
+                await writer.drain()
+                status_line = await asyncio.wait_for(reader.readline(), self.health_timeout)
+                parts = status_line.split()
+                ok = len(parts) >= 2 and parts[1].isdigit() and int(parts[1]) < 500
+            finally:
+                writer.close()
+        except (OSError, asyncio.TimeoutError):
+            ok = False
+
+        worker.last_check = time.time()
+        if ok:
+            worker.failed_checks = 0
+            self._set_healthy(worker, True)
+        else:
+            worker.failed_checks += 1
+            if worker.failed_checks >= self.unhealthy_after:
+                self._set_healthy(worker, False)
+
+    def _set_healthy(self, worker, healthy):
+        if worker.healthy != healthy:
+            worker.healthy = healthy
+            state = "정상" if healthy else "제외됨 (응답 없음)"
+            self.log(f"클러스터 워커 {worker.index + 1} (포트 {worker.port}): {state}")
+
+    # ---- 프록시 ----
+
+    def _candidates(self):
+        """요청을 보낼 워커 순서 (처리 중인 요청이 적은 순, 같으면 라운드 로빈)"""
+        healthy = [worker for worker in self.workers if worker.healthy]
+        if not healthy:
+            return []
+        start = next(self._rr) % len(healthy)
+        rotated = healthy[start:] + healthy[:start]
+        return sorted(rotated, key=lambda worker: worker.active)
+
+    def _rewrite_head(self, head, peer):
+        """요청 헤더 수정 (업스트림 연결은 요청마다 닫음)"""
+        lines = head.split(b'\r\n')
+        request_line, header_lines = lines[0], [line for line in lines[1:] if line]
+
+        names = [line.split(b':', 1)[0].strip().lower() for line in header_lines]
+        if b'upgrade' in names:
+            # 웹소켓 등 업그레이드 요청은 그대로 전달
+            return head
+
+        out = [request_line]
+        for name, line in zip(names, header_lines):
+            if name not in HOP_BY_HOP_HEADERS:
+                out.append(line)
+        client_ip = peer[0] if peer else ''
+        out.append(b'X-Forwarded-For: ' + client_ip.encode('ascii', 'ignore'))
+        out.append(b'X-Forwarded-Proto: http')
+        out.append(b'Connection: close')
+        return b'\r\n'.join(out) + b'\r\n\r\n'
+
+    async def _handle_client(self, reader, writer):
+        upstream_writer = None
+        worker = None
+        try:
+            try:
+                head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), self.header_timeout)
+            except asyncio.LimitOverrunError:
+                writer.write(_error_response(431, b'Request Header Fields Too Large'))
+                return
+            except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                return
+
+            head = self._rewrite_head(head, writer.get_extra_info('peername'))
+
+            upstream_reader = None
+            for candidate in self._candidates():
+                try:
+                    upstream_reader, upstream_writer = await asyncio.wait_for(
+                        asyncio.open_connection('127.0.0.1', candidate.port), self.connect_timeout)
+                    worker = candidate
+                    break
+                except (OSError, asyncio.TimeoutError):
+                    # 연결 실패한 워커는 다음 상태 확인까지 제외
+                    candidate.errors += 1
+                    self._set_healthy(candidate, False)
+
+            if worker is None:
+                writer.write(_error_response(503, b'Service Unavailable'))
+                return
+
+            worker.active += 1
+            worker.requests += 1
+            try:
+                upstream_writer.write(head)
+                upload = asyncio.ensure_future(_pipe(reader, upstream_writer))
+                try:
+                    await _pipe(upstream_reader, writer)
+                finally:
+                    upload.cancel()
+            finally:
+                worker.active -= 1
+        except Exception as e:
+            self.log(f"클러스터 프록시 오류: {e}")
+        finally:
+            for stream in (upstream_writer, writer):
+                if stream is not None:
+                    try:
+                        stream.close()
+                    except Exception:
+                        pass
+
+
+async def _pipe(reader, writer, chunk_size=64 * 1024):
+    """reader의 데이터를 EOF까지 writer로 복사"""
+    try:
+        while True:
+            data = await reader.read(chunk_size)
+            if not data:
+                break
+            writer.write(data)
+            await writer.drain()
+    except (ConnectionError, OSError):
+        pass
+
+
+def _error_response(status, reason):
+    body = reason + b'\n'
+    return (b'HTTP/1.1 %d %s\r\nContent-Type: text/plain\r\nContent-Length: %d\r\n'
+            b'Connection: close\r\n\r\n%s' % (status, reason, len(body), body))
+
+
+def worker_env(base_env, port):
+    """워커 프로세스 환경 변수 (내부 포트, 로컬 접속만 허용)"""
+    env = dict(base_env)
+    env['PORT'] = str(port)
+    env['HOSTNAME'] = '127.0.0.1'
+    return env
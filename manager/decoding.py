@@ -0,0 +1,103 @@
+"""
+서버 출력 디코딩
+Next.js 프로세스의 stdout 바이트를 큰 덩어리로 읽어 줄 단위로 나눕니다.
+처음으로 ASCII가 아닌 바이트가 나왔을 때 UTF-8/cp949 중 하나를 한 번만 판별하고
+이후로는 같은 인코딩의 증분 디코더를 계속 사용합니다.
+판별 근거가 부족해도 줄이 끝나면 그때까지의 근거로 결정하므로 줄 출력이 늦어지지 않습니다.
+"""
+
+import codecs
+
+READ_CHUNK_SIZE = 64 * 1024
+FALLBACK_ENCODING = 'cp949'
+
+# cp949 한글 2바이트 중 일부는 우연히 올바른 UTF-8이기도 하므로
+# ASCII 아닌 글자가 이만큼 나올 때까지(또는 판별 버퍼가 찰 때까지) 판별을 미룸
+MIN_DETECT_CHARS = 3
+MAX_DETECT_BYTES = 4096
+
+
+def detect_encoding(data, min_chars=MIN_DETECT_CHARS):
+    """
+    바이트열의 인코딩 판별
+    반환값: 'utf-8', 'cp949' 또는 아직 판별할 수 없으면 None
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')('strict')
+    try:
+        text = decoder.decode(data, final=False)
+    except UnicodeDecodeError:
+        return FALLBACK_ENCODING
+    non_ascii = sum(1 for ch in text if ord(ch) >= 0x80)
+    if non_ascii >= min_chars:
+        return 'utf-8'
+    return None
+
+
+class LineDecoder:
+    """바이트 스트림 -> 줄 단위 문자열"""
+
+    def __init__(self, encoding=None):
+        # encoding이 None이면 자동 판별
+        self.encoding = None
+        self._decoder = None
+        self._undecided = b''
+        self._partial = ''
+        if encoding:
+            self._set_encoding(encoding)
+
+    def _set_encoding(self, encoding):
+        self.encoding = encoding
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+
+    def _decode(self, data, final=False):
+        if self._decoder:
+            return self._decoder.decode(data, final)
+
+        data = self._undecided + data
+        self._undecided = b''
+        if data.isascii():
+            return data.decode('ascii')
+
+        encoding = detect_encoding(data)
+        if encoding is None and not final and len(data) < MAX_DETECT_BYTES:
+            cut = next(i for i, b in enumerate(data) if b >= 0x80)
+            line_end = data.rfind(b'\n')
+            if line_end < cut:
+                # 줄이 끝나지 않았으면 ASCII 부분만 먼저 처리하고 나머지는 보관
+                self._undecided = data[cut:]
+                return data[:cut].decode('ascii')
+            # 줄이 끝났으면 완성된 줄까지의 근거로 결정 (UTF-8로 읽히면 UTF-8)
+            encoding = detect_encoding(data[:line_end + 1], min_chars=1)
+
+        self._set_encoding(encoding or 'utf-8')
+        return self._decoder.decode(data, final)
+
+    def feed(self, data):
+        """바이트 덩어리를 넣고 완성된 줄 목록을 반환"""
+        text = self._partial + self._decode(data)
+        lines = text.split('\n')
+        self._partial = lines.pop()
+        return [line.rstrip('\r') for line in lines]
+
+    def flush(self):
+        """스트림 끝: 남아 있는 줄 목록 반환"""
+        text = self._partial + self._decode(b'', final=True)
+        self._partial = ''
+        if not text:
+            return []
+        lines = text.split('\n')
+        if not lines[-1]:
+            lines.pop()
+        return [line.rstrip('\r') for line in lines]
+
+
+def iter_lines(stream, encoding=None, chunk_size=READ_CHUNK_SIZE):
+    """바이너리 스트림에서 줄 단위로 읽기 (EOF까지)"""
+    decoder = LineDecoder(encoding)
+    read = getattr(stream, 'read1', stream.read)
+    while True:
+        data = read(chunk_size)
+        if not data:
+            break
+        yield from decoder.feed(data)
+    yield from decoder.flush()
@@ -0,0 +1,211 @@
+"""
+프로젝트 일괄 내보내기
+기간/현장으로 고른 프로젝트의 엑셀 파일을 zip 하나로 묶고 점수 요약 CSV를 함께 넣습니다.
+파일은 작은 조각 단위로 zip에 바로 써서 (임시 복사본 없이) 프로젝트 수와 관계없이
+메모리 사용량이 일정합니다. 프로젝트 목록은 웹 서버가 쓰는 projects.json을 바로 읽고,
+점수는 summary.json 집계를 사용합니다.
+
+실행: python -m manager.export [--config server_config.json] [--from 2025-06-01] [--to 2025-06-30]
+                              [--location 현장] -o 내보내기.zip   (-o - 이면 표준 출력)
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import re
+import shutil
+import sys
+import time
+import zipfile
+
+from manager.projectsfile import load_projects, projects_path
+from manager.rollup import RollupStore
+from manager.storage import ContentStore, format_size
+
+COPY_CHUNK_SIZE = 256 * 1024
+SUMMARY_CSV = 'summary.csv'
+CSV_COLUMNS = [
+    ('id', "ID"),
+    ('projectName', "프로젝트명"),
+    ('location', "현장"),
+    ('generalManager', "총괄담당자"),
+    ('inspector', "검수자"),
+    ('inspectionDate', "검수일자"),
+    ('items', "항목 수"),
+    ('total', "점수"),
+    ('max', "최대점수"),
+    ('rate', "달성률(%)"),
+    ('file', "파일"),
+]
+
+_UNSAFE_NAME = re.compile(r'[\\/:*?"<>|\x00-\x1f]+')
+
+
+def safe_name(text):
+    """zip 안의 파일 이름으로 쓸 수 있게 정리"""
+    return _UNSAFE_NAME.sub('_', str(text)).strip(' .') or "이름없음"
+
+
+def archive_name(project):
+    """zip 안의 엑셀 파일 이름 (검수일자_프로젝트명_ID.xlsx)"""
+    ext = os.path.splitext(project.get('filePath', ''))[1] or '.xlsx'
+    parts = [project.get('inspectionDate') or "날짜없음", project.get('projectName', ''), project.get('id')]
+    return safe_name("_".join(str(part) for part in parts)) + ext
+
+
+class ExportResult:
+    """내보내기 결과"""
+
+    def __init__(self):
+        self.projects = 0
+        self.files = 0
+        self.bytes = 0
+        self.missing = []       # (프로젝트, 오류)
+        self.elapsed = 0.0
+
+    def summary_text(self):
+        text = (f"프로젝트 {self.projects}개, 엑셀 파일 {self.files}개 "
+                f"({format_size(self.bytes)}, {self.elapsed:.1f}초)")
+        if self.missing:
+            text += f", 파일 없음 {len(self.missing)}개"
+        return text
+
+
+class ProjectExporter:
+    """선택한 프로젝트를 zip으로 내보내기"""
+
+    def __init__(self, uploads_path, data_path, log=print, rollups=None):
+        """rollups: 서버 관리자가 이미 실행 중인 집계 (없으면 새로 만듦)"""
+        self.store = ContentStore(uploads_path, data_path, log=log)
+        self.projects_file = projects_path(data_path)
+        self.rollups = rollups or RollupStore(data_path, uploads_path, log=log)
+        self.log = log
+
+    def select(self, date_from=None, date_to=None, location=None):
+        """기간(검수일자, 'YYYY-MM-DD' 문자열 비교)/현장으로 프로젝트 선택 (projects.json 순서)"""
+        selected = []
+        for project in load_projects(self.projects_file):
+            inspection_date = str(project.get('inspectionDate') or '')
+            if location and project.get('location') != location:
+                continue
+            if date_from and inspection_date < date_from:
+                continue
+            if date_to and inspection_date > date_to:
+                continue
+            selected.append(project)
+        return selected
+
+    def summary_rows(self, projects, names):
+        """프로젝트별 점수 요약 (summary.json 집계, 바뀐 프로젝트만 다시 계산)"""
+        self.rollups.update()
+        try:
+            with open(self.rollups.summary_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f).get('projects', {})
+        except (OSError, ValueError):
+            entries = {}
+
+        for project, name in zip(projects, names):
+            entry = entries.get(str(project.get('id')), {})
+            total, max_score = entry.get('total', 0), entry.get('max', 0)
+            row = {key: project.get(key, '') for key, _ in CSV_COLUMNS}
+            row.update({
+                'items': entry.get('items', 0),
+                'total': total,
+                'max': max_score,
+                'rate': round(total / max_score * 100, 1) if max_score else 0,
+                'file': name,
+            })
+            yield row
+
+    def write_archive(self, projects, output, progress=None):
+        """
+        zip 쓰기 (output: 파일 경로 또는 쓰기 가능한 바이너리 스트림)
+        progress(완료 수, 전체 수, 프로젝트)
+        """
+        start = time.perf_counter()
+        result = ExportResult()
+        result.projects = len(projects)
+        names, used_names = [], set()
+        for index, project in enumerate(projects, 1):
+            name = archive_name(project)
+            if name in used_names:
+                base, ext = os.path.splitext(name)
+                name = f"{base}_{index}{ext}"
+            used_names.add(name)
+            names.append(name)
+
+        with zipfile.ZipFile(output, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            for index, (project, name) in enumerate(zip(projects, names), 1):
+                try:
+                    self._add_file(archive, self.store.to_path(project.get('filePath', '')), name)
+                    result.files += 1
+                    result.bytes += archive.getinfo(name).file_size
+                except OSError as e:
+                    result.missing.append((project, str(e)))
+                    self.log(f"내보내기: 파일 없음 ({project.get('projectName', '')}): {e}")
+                if progress:
+                    progress(index, len(projects), project)
+
+            # 엑셀에서 바로 열 수 있도록 BOM이 있는 UTF-8
+            info = zipfile.ZipInfo(SUMMARY_CSV, date_time=time.localtime()[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            with archive.open(info, 'w') as raw:
+                text = io.TextIOWrapper(raw, encoding='utf-8-sig', newline='')
+                writer = csv.writer(text)
+                writer.writerow([label for _, label in CSV_COLUMNS])
+                for row in self.summary_rows(projects, names):
+                    writer.writerow([row[key] for key, _ in CSV_COLUMNS])
+                text.flush()
+                text.detach()
+
+        result.elapsed = time.perf_counter() - start
+        return result
+
+    @staticmethod
+    def _add_file(archive, path, name):
+        """파일을 조각 단위로 zip에 복사 (xlsx는 이미 압축되어 있으므로 저장만)"""
+        with open(path, 'rb') as source:
+            info = zipfile.ZipInfo(name, date_time=time.localtime(os.fstat(source.fileno()).st_mtime)[:6])
+            info.compress_type = zipfile.ZIP_STORED
+            with archive.open(info, 'w', force_zip64=True) as target:
+                shutil.copyfileobj(source, target, COPY_CHUNK_SIZE)
+
+    def export(self, output, date_from=None, date_to=None, location=None, progress=None):
+        """선택 + zip 쓰기"""
+        projects = self.select(date_from, date_to, location)
+        return self.write_archive(projects, output, progress)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="프로젝트 엑셀 파일 + 점수 요약 CSV를 zip으로 내보내기")
+    parser.add_argument('--config', default='server_config.json', help="서버 관리자 설정 파일")
+    parser.add_argument('--from', dest='date_from', help="검수일자 시작 (YYYY-MM-DD)")
+    parser.add_argument('--to', dest='date_to', help="검수일자 끝 (YYYY-MM-DD)")
+    parser.add_argument('--location', help="현장")
+    parser.add_argument('-o', '--output', required=True, help="zip 파일 경로 (- 이면 표준 출력)")
+    args = parser.parse_args(argv)
+
+    config = {}
+    if os.path.exists(args.config):
+        with open(args.config, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+
+    # 표준 출력으로 내보낼 때는 로그를 표준 오류로
+    def log(message):
+        print(message, file=sys.stderr)
+
+    exporter = ProjectExporter(
+        config.get('uploads_path', os.path.join(os.getcwd(), 'public', 'uploads')),
+        config.get('data_path', os.path.join(os.getcwd(), 'data')),
+        log=log
+    )
+    output = sys.stdout.buffer if args.output == '-' else args.output
+    result = exporter.export(output, args.date_from, args.date_to, args.location)
+    log(f"내보내기 완료: {result.summary_text()}")
+    return 1 if result.missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,802 @@
+"""
+서버 관리자 GUI
+tkinter 창과 시스템 트레이로 ServerController를 조작합니다.
+PIL/pystray는 트레이로 최소화할 때 처음 가져옵니다.
+"""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+
+from manager.server import ServerController
+from manager.readiness import STATE_READY, STATE_FAILED
+from manager.logfile import LogFileIndex, parse_time_filter
+from manager.watchdog import format_duration
+
+# 로그 화면 갱신 주기 (밀리초)와 한 번에 표시할 최대 줄 수
+LOG_DRAIN_INTERVAL_MS = 100
+LOG_DRAIN_BATCH = 500
+
+
+class LogViewer:
+    """로그 파일 보기 창 (페이지 단위로 필요한 부분만 읽음)"""
+    
+    def __init__(self, parent, log_dir):
+        self.index = LogFileIndex(log_dir)
+        self.page = 0
+        # 검색 모드: 페이지별 시작 위치 목록 (이전 페이지로 돌아가기용)
+        self.cursors = []
+        self.next_cursor = None
+        self.filters = None
+        
+        self.window = tk.Toplevel(parent)
+        self.window.title("상세 로그")
+        self.window.geometry("900x650")
+        
+        # 필터 영역
+        filter_frame = ttk.Frame(self.window, padding="5")
+        filter_frame.pack(side=tk.TOP, fill=tk.X)
+        
+        ttk.Label(filter_frame, text="검색어:").pack(side=tk.LEFT)
+        self.text_var = tk.StringVar()
+        text_entry = ttk.Entry(filter_frame, textvariable=self.text_var, width=20)
+        text_entry.pack(side=tk.LEFT, padx=(2, 8))
+        text_entry.bind('<Return>', lambda e: self.apply_filter())
+        
+        ttk.Label(filter_frame, text="시작:").pack(side=tk.LEFT)
+        self.start_var = tk.StringVar()
+        ttk.Entry(filter_frame, textvariable=self.start_var, width=16).pack(side=tk.LEFT, padx=(2, 8))
+        
+        ttk.Label(filter_frame, text="종료:").pack(side=tk.LEFT)
+        self.end_var = tk.StringVar()
+        ttk.Entry(filter_frame, textvariable=self.end_var, width=16).pack(side=tk.LEFT, padx=(2, 8))
+        
+        ttk.Button(filter_frame, text="검색", command=self.apply_filter).pack(side=tk.LEFT)
+        ttk.Button(filter_frame, text="초기화", command=self.clear_filter).pack(side=tk.LEFT, padx=(5, 0))
+        
+        # 페이지 이동 영역
+        nav_frame = ttk.Frame(self.window, padding="5")
+        nav_frame.pack(side=tk.BOTTOM, fill=tk.X)
+        
+        ttk.Button(nav_frame, text="◀ 이전", command=self.prev_page).pack(side=tk.LEFT)
+        ttk.Button(nav_frame, text="다음 ▶", command=self.next_page).pack(side=tk.LEFT, padx=5)
+        ttk.Button(nav_frame, text="새로고침", command=self.reload).pack(side=tk.LEFT, padx=5)
+        self.page_label = ttk.Label(nav_frame, text="")
+        self.page_label.pack(side=tk.LEFT, padx=10)
+        
+        # 로그 내용
+        text_frame = ttk.Frame(self.window)
+        text_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        
+        self.log_text = tk.Text(text_frame, wrap=tk.NONE)
+        scrollbar = ttk.Scrollbar(text_frame, orient="vertical", command=self.log_text.yview)
+        self.log_text.configure(yscrollcommand=scrollbar.set)
+        
+        self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        self.reload()
+    
+    def reload(self):
+        """색인을 다시 읽고 마지막 페이지 표시"""
+        start = time.perf_counter()
+        count = self.index.refresh()
+        elapsed = (time.perf_counter() - start) * 1000
+        
+        if self.filters:
+            self.run_search()
+        else:
+            self.page = max(count - 1, 0)
+            self.show_page()
+        self.page_label.config(text=f"{self.page_label.cget('text')} · 색인 {elapsed:.0f}ms")
+    
+    def show_lines(self, lines):
+        self.log_text.config(state="normal")
+        self.log_text.delete('1.0', tk.END)
+        self.log_text.insert(tk.END, "\n".join(lines))
+        self.log_text.see(tk.END if not self.filters else '1.0')
+        self.log_text.config(state="disabled")
+    
+    def show_page(self):
+        """전체 로그 모드: 현재 페이지 표시"""
+        self.show_lines(self.index.read_page(self.page))
+        total = self.index.page_count()
+        self.page_label.config(text=f"페이지 {self.page + 1 if total else 0} / {total}")
+    
+    def apply_filter(self):
+        """검색 조건 적용"""
+        try:
+            start = parse_time_filter(self.start_var.get())
+            end = parse_time_filter(self.end_var.get())
+        except ValueError as e:
+            messagebox.showerror("오류", str(e), parent=self.window)
+            return
+        
+        text = self.text_var.get().strip()
+        if not (text or start or end):
+            self.clear_filter()
+            return
+        
+        self.filters = (text, start, end)
+        self.cursors = [(0, 0)]
+        self.run_search()
+    
+    def clear_filter(self):
+        self.text_var.set("")
+        self.start_var.set("")
+        self.end_var.set("")
+        self.filters = None
+        self.reload()
+    
+    def run_search(self):
+        """검색 모드: 현재 위치부터 한 페이지 분량 검색"""
+        text, start, end = self.filters
+        lines, self.next_cursor = self.index.search(text, start, end, cursor=self.cursors[-1])
+        self.show_lines(lines)
+        more = " (다음 있음)" if self.next_cursor else ""
+        self.page_label.config(text=f"검색 결과 {len(self.cursors)}페이지 · {len(lines)}줄{more}")
+    
+    def prev_page(self):
+        if self.filters:
+            if len(self.cursors) > 1:
+                self.cursors.pop()
+                self.run_search()
+        elif self.page > 0:
+            self.page -= 1
+            self.show_page()
+    
+    def next_page(self):
+        if self.filters:
+            if self.next_cursor:
+                self.cursors.append(self.next_cursor)
+                self.run_search()
+        elif self.page + 1 < self.index.page_count():
+            self.page += 1
+            self.show_page()
+
+
+class InspectionServerManager(ServerController):
+    def __init__(self, launch_time=None, profiler=None):
+        super().__init__(launch_time=launch_time, profiler=profiler)
+        
+        # 트레이 아이콘 (창을 숨길 때 생성)
+        self.tray_icon = None
+        
+        # GUI 설정
+        with self.profiler.phase('setup_gui'):
+            self.setup_gui()
+        
+        # 자동 시작 체크
+        if self.config.get('auto_start', False):
+            self.start_server()
+
+    def schedule(self, delay_ms, callback, *args):
+        """delay_ms 후 GUI 스레드에서 callback 실행"""
+        return self.root.after(delay_ms, callback, *args)
+
+    def cancel_schedule(self, handle):
+        self.root.after_cancel(handle)
+
+    def show_error(self, title, message):
+        messagebox.showerror(title, message)
+
+    def notify(self, message):
+        """트레이 알림 (트레이로 최소화된 경우)"""
+        if self.tray_icon:
+            try:
+                self.tray_icon.notify(message, "건축 현장 업무 검수 시스템")
+            except Exception:
+                pass
+
+    def setup_gui(self):
+        """GUI 설정"""
+        self.root = tk.Tk()
+        self.root.title("건축 현장 업무 검수 시스템 - 서버 관리자")
+        self.root.geometry("600x700")
+        self.root.resizable(True, True)
+        
+        # 윈도우 닫기 이벤트 처리
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+        
+        # 메인 프레임
+        main_frame = ttk.Frame(self.root, padding="10")
+        main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        # 서버 상태 프레임
+        status_frame = ttk.LabelFrame(main_frame, text="서버 상태", padding="10")
+        status_frame.grid(row=0, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
+        
+        self.status_label = ttk.Label(status_frame, text="서버 중지됨", font=("Arial", 12, "bold"))
+        self.status_label.grid(row=0, column=0, sticky=tk.W)
+        
+        self.port_label = ttk.Label(status_frame, text=f"포트: {self.config['server_port']}")
+        self.port_label.grid(row=1, column=0, sticky=tk.W)
+        
+        # Node.js 상태 표시
+        node_path, npm_path = self.get_node_paths()
+        if node_path and os.path.exists(node_path):
+            self.node_label = ttk.Label(status_frame, text="✓ Node.js 사용 가능", foreground="green")
+        else:
+            self.node_label = ttk.Label(status_frame, text="✗ Node.js 없음", foreground="red")
+        self.node_label.grid(row=2, column=0, sticky=tk.W)
+        
+        # 클러스터 워커 상태 표시
+        self.cluster_label = ttk.Label(status_frame, text="", justify=tk.LEFT)
+        self.cluster_label.grid(row=3, column=0, sticky=tk.W)
+        
+        # 자동 재시작 기록 요약
+        self.watchdog_label = ttk.Label(status_frame, text=self.watchdog.summary_text(), foreground="gray")
+        self.watchdog_label.grid(row=4, column=0, sticky=tk.W)
+        
+        # 리소스 사용량 (최근 추이)
+        self.telemetry_label = ttk.Label(status_frame, text="", font=("Consolas", 9), justify=tk.LEFT)
+        self.telemetry_label.grid(row=5, column=0, sticky=tk.W, pady=(5, 0))
+        
+        # 서버 제어 버튼
+        button_frame = ttk.Frame(main_frame)
+        button_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
+        
+        self.start_button = ttk.Button(button_frame, text="서버 시작", command=self.start_server)
+        self.start_button.grid(row=0, column=0, padx=(0, 5))
+        
+        self.stop_button = ttk.Button(button_frame, text="서버 중지", command=self.stop_server, state="disabled")
+        self.stop_button.grid(row=0, column=1, padx=5)
+        
+        self.restart_button = ttk.Button(button_frame, text="서버 재시작", command=self.restart_server, state="disabled")
+        self.restart_button.grid(row=0, column=2, padx=5)
+        
+        self.browser_button = ttk.Button(button_frame, text="브라우저 열기", command=self.open_browser)
+        self.browser_button.grid(row=0, column=3, padx=(5, 0))
+        
+        # 설정 프레임
+        config_frame = ttk.LabelFrame(main_frame, text="설정", padding="10")
+        config_frame.grid(row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
+        
+        # 포트 설정
+        ttk.Label(config_frame, text="서버 포트:").grid(row=0, column=0, sticky=tk.W, pady=2)
+        self.port_var = tk.StringVar(value=str(self.config['server_port']))
+        port_entry = ttk.Entry(config_frame, textvariable=self.port_var, width=10)
+        port_entry.grid(row=0, column=1, sticky=tk.W, padx=(10, 0), pady=2)
+        
+        # 업로드 폴더 설정
+        ttk.Label(config_frame, text="업로드 폴더:").grid(row=1, column=0, sticky=tk.W, pady=2)
+        self.uploads_var = tk.StringVar(value=self.config['uploads_path'])
+        uploads_entry = ttk.Entry(config_frame, textvariable=self.uploads_var, width=40)
+        uploads_entry.grid(row=1, column=1, sticky=(tk.W, tk.E), padx=(10, 5), pady=2)
+        
+        uploads_button = ttk.Button(config_frame, text="찾아보기", 
+                                  command=lambda: self.browse_folder(self.uploads_var))
+        uploads_button.grid(row=1, column=2, padx=(0, 0), pady=2)
+        
+        # 데이터 폴더 설정
+        ttk.Label(config_frame, text="데이터 폴더:").grid(row=2, column=0, sticky=tk.W, pady=2)
+        self.data_var = tk.StringVar(value=self.config['data_path'])
+        data_entry = ttk.Entry(config_frame, textvariable=self.data_var, width=40)
+        data_entry.grid(row=2, column=1, sticky=(tk.W, tk.E), padx=(10, 5), pady=2)
+        
+        data_button = ttk.Button(config_frame, text="찾아보기", 
+                               command=lambda: self.browse_folder(self.data_var))
+        data_button.grid(row=2, column=2, padx=(0, 0), pady=2)
+        
+        # 체크박스 옵션들
+        self.auto_start_var = tk.BooleanVar(value=self.config['auto_start'])
+        auto_start_check = ttk.Checkbutton(config_frame, text="프로그램 시작 시 서버 자동 시작", 
+                                         variable=self.auto_start_var)
+        auto_start_check.grid(row=3, column=0, columnspan=3, sticky=tk.W, pady=5)
+        
+        self.minimize_tray_var = tk.BooleanVar(value=self.config['minimize_to_tray'])
+        minimize_check = ttk.Checkbutton(config_frame, text="닫기 버튼 클릭 시 트레이로 최소화", 
+                                       variable=self.minimize_tray_var)
+        minimize_check.grid(row=4, column=0, columnspan=3, sticky=tk.W, pady=2)
+        
+        self.auto_browser_var = tk.BooleanVar(value=self.config['auto_open_browser'])
+        browser_check = ttk.Checkbutton(config_frame, text="서버 시작 시 자동으로 브라우저 열기", 
+                                      variable=self.auto_browser_var)
+        browser_check.grid(row=5, column=0, columnspan=3, sticky=tk.W, pady=2)
+        
+        self.auto_restart_var = tk.BooleanVar(value=self.config['auto_restart'])
+        auto_restart_check = ttk.Checkbutton(config_frame, text="서버 비정상 종료 시 자동 재시작", 
+                                           variable=self.auto_restart_var)
+        auto_restart_check.grid(row=6, column=0, columnspan=3, sticky=tk.W, pady=2)
+        
+        # 클러스터 모드 설정
+        cluster_frame = ttk.Frame(config_frame)
+        cluster_frame.grid(row=7, column=0, columnspan=3, sticky=tk.W, pady=2)
+        
+        self.cluster_mode_var = tk.BooleanVar(value=self.config['cluster_mode'])
+        ttk.Checkbutton(cluster_frame, text="클러스터 모드 (여러 서버 워커 실행)",
+                        variable=self.cluster_mode_var).grid(row=0, column=0, sticky=tk.W)
+        
+        ttk.Label(cluster_frame, text="워커 수 (0=자동):").grid(row=0, column=1, sticky=tk.W, padx=(15, 0))
+        self.cluster_workers_var = tk.StringVar(value=str(self.config['cluster_workers']))
+        ttk.Entry(cluster_frame, textvariable=self.cluster_workers_var, width=5).grid(row=0, column=2, padx=(5, 0))
+        
+        # 설정 저장 버튼
+        save_config_button = ttk.Button(config_frame, text="설정 저장", command=self.save_settings)
+        save_config_button.grid(row=8, column=0, columnspan=3, pady=(10, 0))
+        
+        # 파일 관리 프레임
+        file_frame = ttk.LabelFrame(main_frame, text="파일 관리", padding="10")
+        file_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10))
+        
+        ttk.Button(file_frame, text="업로드 폴더 열기", 
+                  command=self.open_uploads_folder).grid(row=0, column=0, padx=(0, 5), pady=2)
+        
+        ttk.Button(file_frame, text="데이터 폴더 열기", 
+                  command=self.open_data_folder).grid(row=0, column=1, padx=5, pady=2)
+        
+        ttk.Button(file_frame, text="로그 보기", 
+                  command=self.show_logs).grid(row=0, column=2, padx=5, pady=2)
+        
+        ttk.Button(file_frame, text="재시작 기록", 
+                  command=self.show_restart_history).grid(row=0, column=3, padx=(5, 0), pady=2)
+        
+        ttk.Button(file_frame, text="엑셀 일괄 등록", 
+                  command=self.bulk_import).grid(row=1, column=0, padx=(0, 5), pady=2)
+        
+        ttk.Button(file_frame, text="프로젝트 내보내기", 
+                  command=self.export_projects).grid(row=1, column=1, padx=5, pady=2)
+        
+        ttk.Button(file_frame, text="시작 시간 분석", 
+                  command=self.show_startup_report).grid(row=1, column=2, padx=5, pady=2)
+        
+        # 로그 출력 영역
+        log_frame = ttk.LabelFrame(main_frame, text="로그", padding="10")
+        log_frame.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(0, 10))
+        
+        # 스크롤바가 있는 텍스트 위젯
+        log_text_frame = ttk.Frame(log_frame)
+        log_text_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        
+        self.log_text = tk.Text(log_text_frame, height=15, wrap=tk.WORD)
+        scrollbar = ttk.Scrollbar(log_text_frame, orient="vertical", command=self.log_text.yview)
+        self.log_text.configure(yscrollcommand=scrollbar.set)
+        
+        self.log_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        
+        # 로그 버퍼 통계
+        self.log_stats_label = ttk.Label(log_frame, text="", foreground="gray")
+        self.log_stats_label.grid(row=1, column=0, sticky=tk.W, pady=(5, 0))
+        
+        # 그리드 가중치 설정
+        self.root.columnconfigure(0, weight=1)
+        self.root.rowconfigure(0, weight=1)
+        main_frame.columnconfigure(1, weight=1)
+        main_frame.rowconfigure(4, weight=1)
+        config_frame.columnconfigure(1, weight=1)
+        log_frame.columnconfigure(0, weight=1)
+        log_frame.rowconfigure(0, weight=1)
+        log_text_frame.columnconfigure(0, weight=1)
+        log_text_frame.rowconfigure(0, weight=1)
+        
+        # 초기 로그 메시지
+        self.log_message("서버 관리자가 시작되었습니다.")
+        
+        # 로그 버퍼를 주기적으로 화면에 반영
+        self.root.after(LOG_DRAIN_INTERVAL_MS, self.process_log_queue)
+        
+        # 클러스터 워커 상태 주기적 갱신
+        self.root.after(1000, self.refresh_cluster_status)
+        
+        # 리소스 사용량 주기적 갱신
+        self.root.after(1000, self.refresh_telemetry)
+
+    def setup_tray(self):
+        """시스템 트레이 설정 (트레이로 최소화할 때 처음 호출)"""
+        try:
+            # PIL/pystray는 로드 시간이 길어 실제로 트레이를 사용할 때 가져옴
+            from PIL import Image
+            import pystray
+            from pystray import MenuItem as item
+            
+            # 간단한 아이콘 생성
+            image = Image.new('RGB', (64, 64), color='blue')
+            
+            menu = pystray.Menu(
+                item(lambda item: self.get_status_text(), lambda: None, enabled=False),
+                item(lambda item: self.watchdog.summary_text(), lambda: None, enabled=False),
+                pystray.Menu.SEPARATOR,
+                item('서버 시작', self.start_server, enabled=lambda item: not self.server_running),
+                item('서버 중지', self.stop_server, enabled=lambda item: self.server_running),
+                item('브라우저 열기', self.open_browser),
+                pystray.Menu.SEPARATOR,
+                item('창 보이기', self.show_window),
+                item('종료', self.quit_app)
+            )
+            
+            self.tray_icon = pystray.Icon("inspection_system", image, "건축 현장 업무 검수 시스템", menu)
+        except Exception as e:
+            print(f"트레이 아이콘 설정 오류: {e}")
+            self.tray_icon = None
+
+    def process_log_queue(self):
+        """버퍼에 쌓인 로그를 한꺼번에 화면에 표시 (GUI 스레드)"""
+        try:
+            lines = self.log_sink.drain(LOG_DRAIN_BATCH)
+            if lines:
+                self.log_text.insert(tk.END, "\n".join(lines) + "\n")
+                
+                # 최대 줄 수를 넘으면 앞부분 삭제
+                max_lines = int(self.config.get('log_max_lines', 2000))
+                line_count = int(self.log_text.index('end-1c').split('.')[0]) - 1
+                if line_count > max_lines:
+                    self.log_text.delete('1.0', f"{line_count - max_lines + 1}.0")
+                
+                self.log_text.see(tk.END)
+            
+            stats = self.log_sink.stats()
+            self.log_stats_label.config(
+                text=f"전체 {stats['total']}줄 · 대기 {stats['buffered']}줄 · 누락 {stats['dropped']}줄"
+            )
+        except tk.TclError:
+            # 창이 닫히는 중
+            return
+        
+        # 남은 로그가 있으면 바로 다음 배치 처리
+        delay = 1 if self.log_sink.buffered else LOG_DRAIN_INTERVAL_MS
+        self.root.after(delay, self.process_log_queue)
+
+    def refresh_cluster_status(self):
+        """클러스터 워커 상태 표시 갱신 (GUI 스레드)"""
+        try:
+            if self.cluster_workers:
+                lines = [worker.status_text() for worker in self.cluster_workers]
+                self.cluster_label.config(text="\n".join(lines))
+            else:
+                self.cluster_label.config(text="")
+        except tk.TclError:
+            return
+        self.root.after(1000, self.refresh_cluster_status)
+
+    def refresh_telemetry(self):
+        """리소스 사용량 표시 갱신 (GUI 스레드)"""
+        if self.telemetry is None:
+            # 서버를 처음 시작하기 전에는 측정하지 않음 (start_services)
+            self.root.after(1000, self.refresh_telemetry)
+            return
+        from manager.telemetry import sparkline, format_bytes
+        try:
+            data = self.telemetry.snapshot(last=40)
+            if data['timestamp'] and (self.server_running or any(data['processes'])):
+                summary = self.telemetry.summary()
+                cpu = data['cpu_percent']
+                rss = data['rss_bytes']
+                lines = [
+                    f"CPU    {sparkline(cpu, 40):<40} {cpu[-1]:5.1f}% (최대 {summary['cpu_percent']['max']:.0f}%)",
+                    f"메모리 {sparkline(rss, 40):<40} {format_bytes(rss[-1])} (최대 {format_bytes(summary['rss_bytes']['max'])})",
+                    f"핸들 {data['handles'][-1]:.0f} · 스레드 {data['threads'][-1]:.0f} · 프로세스 {data['processes'][-1]:.0f}",
+                ]
+                self.telemetry_label.config(text="\n".join(lines))
+            else:
+                self.telemetry_label.config(text="")
+        except tk.TclError:
+            return
+        except Exception as e:
+            print(f"리소스 표시 오류: {e}")
+        self.root.after(int(self.telemetry.interval * 1000), self.refresh_telemetry)
+
+    def show_restart_history(self):
+        """재시작 기록 창 표시"""
+        history_window = tk.Toplevel(self.root)
+        history_window.title("재시작 기록")
+        history_window.geometry("600x400")
+        
+        ttk.Label(history_window, text=self.watchdog.summary_text(), padding="5").pack(side=tk.TOP, fill=tk.X)
+        
+        history_text = tk.Text(history_window, wrap=tk.NONE)
+        history_text.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        
+        if not self.watchdog.history:
+            history_text.insert(tk.END, "기록이 없습니다.")
+        for entry in reversed(self.watchdog.history):
+            when = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(entry['time']))
+            delay = "재시작 중단" if entry.get('delay') is None else f"{entry['delay']}초 후 재시작"
+            history_text.insert(
+                tk.END,
+                f"{when}  {entry.get('source', 'server')}  종료 코드 {entry['exit_code']}  "
+                f"실행 {format_duration(entry.get('uptime', 0))}  → {delay}\n"
+            )
+        history_text.config(state="disabled")
+
+    def show_startup_report(self):
+        """시작 단계별 소요 시간 창 표시 (다른 릴리스의 최근 기록과 비교)"""
+        from manager.startup import format_report, load_history, previous_release_report
+        
+        report = self.profiler.report or self.profiler.to_dict(self.get_release_info())
+        previous = previous_release_report(load_history(self.config['data_path']), report)
+        
+        report_window = tk.Toplevel(self.root)
+        report_window.title("시작 시간 분석")
+        report_window.geometry("700x450")
+        
+        status = "서버 준비 시점에 저장된 보고서" if self.profiler.report else "서버가 아직 준비되지 않음 (현재까지 기록)"
+        ttk.Label(report_window, text=status, padding="5").pack(side=tk.TOP, fill=tk.X)
+        
+        report_text = tk.Text(report_window, wrap=tk.NONE, font=("Courier", 10))
+        report_text.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        report_text.insert(tk.END, "\n".join(format_report(report, previous)))
+        report_text.config(state="disabled")
+
+    def bulk_import(self):
+        """폴더의 엑셀 파일 일괄 등록 (작업 스레드에서 실행, 진행 상황 창 표시)"""
+        folder = filedialog.askdirectory(title="일괄 등록할 엑셀 파일 폴더 선택")
+        if not folder:
+            return
+        
+        import_window = tk.Toplevel(self.root)
+        import_window.title("엑셀 일괄 등록")
+        import_window.geometry("700x400")
+        
+        status_var = tk.StringVar(value="파일을 찾는 중...")
+        ttk.Label(import_window, textvariable=status_var, padding="5").pack(side=tk.TOP, fill=tk.X)
+        progress_bar = ttk.Progressbar(import_window, mode='determinate')
+        progress_bar.pack(side=tk.TOP, fill=tk.X, padx=5)
+        result_text = tk.Text(import_window, wrap=tk.NONE)
+        result_text.pack(side=tk.TOP, fill=tk.BOTH, expand=True, pady=(5, 0))
+        
+        from manager.bulkimport import BulkImporter
+        importer = BulkImporter(self.config['uploads_path'], self.config['data_path'],
+                                log=self.log_message)
+        start = time.perf_counter()
+        
+        def show_progress(done, total, result):
+            if not import_window.winfo_exists():
+                return
+            rate = done / max(time.perf_counter() - start, 1e-6)
+            progress_bar.config(maximum=total, value=done)
+            status_var.set(f"{done}/{total} 확인 중 (초당 {rate:.1f}개): {os.path.basename(result['path'])}")
+            if result['error']:
+                result_text.insert(tk.END, f"[오류] {os.path.relpath(result['path'], folder)}: {result['error']}\n")
+        
+        def show_report(report):
+            self.log_message(f"엑셀 일괄 등록 ({folder}): {report.summary_text()}")
+            if self.rollups:
+                self.rollups.request_update()
+            if not import_window.winfo_exists():
+                return
+            status_var.set(report.summary_text())
+            result_text.delete("1.0", tk.END)
+            result_text.insert(tk.END, "\n".join(report.lines(folder)[1:]) or "모든 파일을 등록했습니다.")
+            result_text.config(state="disabled")
+        
+        def run_import():
+            try:
+                report = importer.run(
+                    folder, progress=lambda *args: self.schedule(0, show_progress, *args))
+            except Exception as e:
+                self.log_message(f"엑셀 일괄 등록 오류: {e}")
+                self.schedule(0, self.show_error, "오류", f"일괄 등록에 실패했습니다: {e}")
+                return
+            self.schedule(0, show_report, report)
+        
+        threading.Thread(target=run_import, daemon=True).start()
+
+    def export_projects(self):
+        """기간/현장으로 고른 프로젝트를 zip(엑셀 파일 + 점수 요약 CSV)으로 내보내기"""
+        from manager.export import ProjectExporter
+        
+        export_window = tk.Toplevel(self.root)
+        export_window.title("프로젝트 내보내기")
+        export_window.resizable(False, False)
+        
+        form = ttk.Frame(export_window, padding="10")
+        form.pack(fill=tk.BOTH, expand=True)
+        
+        ttk.Label(form, text="검수일자 시작:").grid(row=0, column=0, sticky=tk.W, pady=2)
+        from_var = tk.StringVar()
+        ttk.Entry(form, textvariable=from_var, width=14).grid(row=0, column=1, sticky=tk.W, padx=(5, 0))
+        ttk.Label(form, text="끝:").grid(row=0, column=2, sticky=tk.W, padx=(10, 0))
+        to_var = tk.StringVar()
+        ttk.Entry(form, textvariable=to_var, width=14).grid(row=0, column=3, sticky=tk.W, padx=(5, 0))
+        ttk.Label(form, text="(YYYY-MM-DD, 비우면 전체)").grid(row=0, column=4, sticky=tk.W, padx=(5, 0))
+        
+        ttk.Label(form, text="현장:").grid(row=1, column=0, sticky=tk.W, pady=2)
+        location_var = tk.StringVar()
+        ttk.Entry(form, textvariable=location_var, width=30).grid(row=1, column=1, columnspan=3,
+                                                                 sticky=tk.W, padx=(5, 0))
+        
+        status_var = tk.StringVar()
+        progress_bar = ttk.Progressbar(form, mode='determinate')
+        progress_bar.grid(row=3, column=0, columnspan=5, sticky=(tk.W, tk.E), pady=(10, 0))
+        ttk.Label(form, textvariable=status_var).grid(row=4, column=0, columnspan=5, sticky=tk.W, pady=(5, 0))
+        
+        def show_progress(done, total, project):
+            if export_window.winfo_exists():
+                progress_bar.config(maximum=total, value=done)
+                status_var.set(f"{done}/{total} {project.get('projectName', '')}")
+        
+        def show_result(output, result):
+            self.log_message(f"프로젝트 내보내기 ({output}): {result.summary_text()}")
+            if export_window.winfo_exists():
+                status_var.set(result.summary_text())
+                export_button.config(state="normal")
+        
+        def show_failure(error):
+            self.log_message(f"프로젝트 내보내기 오류: {error}")
+            self.show_error("오류", f"내보내기에 실패했습니다: {error}")
+            if export_window.winfo_exists():
+                status_var.set("")
+                export_button.config(state="normal")
+        
+        def start_export():
+            output = filedialog.asksaveasfilename(
+                parent=export_window, title="내보낼 파일", defaultextension=".zip",
+                initialfile=f"검수_{time.strftime('%Y%m%d')}.zip", filetypes=[("zip 파일", "*.zip")]
+            )
+            if not output:
+                return
+            export_button.config(state="disabled")
+            status_var.set("프로젝트를 고르는 중...")
+            date_from, date_to, location = from_var.get().strip(), to_var.get().strip(), location_var.get().strip()
+            
+            def run_export():
+                try:
+                    exporter = ProjectExporter(self.config['uploads_path'], self.config['data_path'],
+                                               log=self.log_message, rollups=self.rollups)
+                    result = exporter.export(
+                        output, date_from or None, date_to or None, location or None,
+                        progress=lambda *args: self.schedule(0, show_progress, *args))
+                except Exception as e:
+                    self.schedule(0, show_failure, e)
+                    return
+                self.schedule(0, show_result, output, result)
+            
+            threading.Thread(target=run_export, daemon=True).start()
+        
+        export_button = ttk.Button(form, text="내보내기", command=start_export)
+        export_button.grid(row=2, column=0, columnspan=5, sticky=tk.E, pady=(10, 0))
+
+    def update_ui_status(self):
+        """UI 상태 업데이트"""
+        if self.server_running:
+            if self.server_state == STATE_READY:
+                self.status_label.config(text=self.get_status_text(), foreground="green")
+            elif self.server_state == STATE_FAILED:
+                self.status_label.config(text=self.get_status_text(), foreground="red")
+            else:
+                self.status_label.config(text=self.get_status_text(), foreground="orange")
+            self.start_button.config(state="disabled")
+            self.stop_button.config(state="normal")
+            self.restart_button.config(state="normal")
+        else:
+            self.status_label.config(text=self.get_status_text(), foreground="red")
+            self.start_button.config(state="normal")
+            self.stop_button.config(state="disabled")
+            self.restart_button.config(state="disabled")
+        
+        port_text = f"포트: {self.server_port}"
+        if self.server_port != self.config['server_port']:
+            port_text += f" (설정 포트 {self.config['server_port']} 사용 중)"
+        if self.cluster_workers:
+            port_text += f" (클러스터 워커 {len(self.cluster_workers)}개)"
+        self.port_label.config(text=port_text)
+        
+        self.watchdog_label.config(text=self.watchdog.summary_text())
+        
+        # 트레이 메뉴/툴팁 갱신
+        if self.tray_icon:
+            try:
+                self.tray_icon.title = f"건축 현장 업무 검수 시스템 - {self.get_status_text()}"
+                self.tray_icon.update_menu()
+            except Exception:
+                pass
+
+    def browse_folder(self, var):
+        """폴더 선택 다이얼로그"""
+        folder = filedialog.askdirectory(initialdir=var.get())
+        if folder:
+            var.set(folder)
+
+    def save_settings(self):
+        """설정 저장"""
+        try:
+            # 포트 유효성 검사
+            port = int(self.port_var.get())
+            if not (1 <= port <= 65535):
+                raise ValueError("포트는 1-65535 사이의 값이어야 합니다.")
+            
+            cluster_workers = int(self.cluster_workers_var.get())
+            if cluster_workers < 0:
+                raise ValueError("워커 수는 0 이상이어야 합니다. (0=자동)")
+            
+            # 설정 업데이트
+            self.config['server_port'] = port
+            if not self.server_running:
+                self.server_port = port
+            self.config['uploads_path'] = self.uploads_var.get()
+            self.config['data_path'] = self.data_var.get()
+            self.config['auto_start'] = self.auto_start_var.get()
+            self.config['minimize_to_tray'] = self.minimize_tray_var.get()
+            self.config['auto_open_browser'] = self.auto_browser_var.get()
+            self.config['auto_restart'] = self.auto_restart_var.get()
+            self.config['cluster_mode'] = self.cluster_mode_var.get()
+            self.config['cluster_workers'] = cluster_workers
+            
+            # 폴더 생성
+            os.makedirs(self.config['uploads_path'], exist_ok=True)
+            os.makedirs(self.config['data_path'], exist_ok=True)
+            
+            self.save_config()
+            self.update_ui_status()
+            
+            self.log_message("설정이 저장되었습니다.")
+            messagebox.showinfo("성공", "설정이 저장되었습니다.")
+            
+        except ValueError as e:
+            messagebox.showerror("오류", f"설정 오류: {e}")
+        except Exception as e:
+            self.log_message(f"설정 저장 오류: {e}")
+            messagebox.showerror("오류", f"설정 저장에 실패했습니다: {e}")
+
+    def open_uploads_folder(self):
+        """업로드 폴더 열기"""
+        try:
+            os.makedirs(self.config['uploads_path'], exist_ok=True)
+            if sys.platform == "win32":
+                os.startfile(self.config['uploads_path'])
+            elif sys.platform == "darwin":
+                subprocess.run(["open", self.config['uploads_path']])
+            else:
+                subprocess.run(["xdg-open", self.config['uploads_path']])
+        except Exception as e:
+            self.log_message(f"폴더 열기 오류: {e}")
+            messagebox.showerror("오류", f"폴더를 열 수 없습니다: {e}")
+
+    def open_data_folder(self):
+        """데이터 폴더 열기"""
+        try:
+            os.makedirs(self.config['data_path'], exist_ok=True)
+            if sys.platform == "win32":
+                os.startfile(self.config['data_path'])
+            elif sys.platform == "darwin":
+                subprocess.run(["open", self.config['data_path']])
+            else:
+                subprocess.run(["xdg-open", self.config['data_path']])
+        except Exception as e:
+            self.log_message(f"폴더 열기 오류: {e}")
+            messagebox.showerror("오류", f"폴더를 열 수 없습니다: {e}")
+
+    def show_logs(self):
+        """로그 창 표시 (저장된 로그 파일 조회)"""
+        LogViewer(self.root, self.log_dir)
+
+    def on_closing(self):
+        """창 닫기 이벤트 처리"""
+        if self.config['minimize_to_tray']:
+            # 트레이 아이콘은 한 번 중지하면 다시 실행할 수 없으므로 숨길 때마다 새로 만듦
+            self.setup_tray()
+        if self.config['minimize_to_tray'] and self.tray_icon:
+            self.root.withdraw()  # 창 숨기기
+            threading.Thread(target=self.tray_icon.run, daemon=True).start()
+        else:
+            self.quit_app()
+
+    def show_window(self):
+        """창 보이기"""
+        self.root.after(0, self.root.deiconify)
+        self.root.after(0, self.root.lift)
+        if self.tray_icon:
+            self.tray_icon.stop()
+            self.tray_icon = None
+
+    def quit_app(self):
+        """애플리케이션 종료"""
+        if self.tray_icon:
+            self.tray_icon.stop()
+            self.tray_icon = None
+        
+        self.shutdown()
+        
+        self.root.quit()
+        self.root.destroy()
+
+    def run(self):
+        """메인 실행 함수"""
+        # 창이 처음 그려진 시점 (메인 루프가 첫 작업을 처리할 때)
+        self.root.after(0, self.profiler.mark, 'window_shown')
+        self.root.mainloop()
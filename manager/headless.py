@@ -0,0 +1,100 @@
+"""
+헤드리스 모드
+GUI 없이 설정 파일대로 서버를 실행합니다 (현장 PC, 서비스 래퍼용).
+tkinter/PIL/pystray를 가져오지 않으며, 로그는 콘솔과 로그 파일에만 기록합니다.
+"""
+
+import json
+import queue
+import signal
+import threading
+
+from manager.server import ServerController
+from manager.readiness import STATE_READY, STATE_FAILED
+
+# 메인 루프가 예약 작업/종료 신호를 확인하는 주기 (초)
+POLL_INTERVAL = 0.2
+
+
+class HeadlessServer(ServerController):
+    """GUI 없는 서버 관리자"""
+    
+    opens_browser = False
+    
+    def __init__(self, launch_time=None, profiler=None):
+        super().__init__(launch_time=launch_time, profiler=profiler)
+        # 백그라운드 스레드 -> 메인 스레드로 넘길 작업 (GUI 모드의 root.after 역할)
+        self.tasks = queue.Queue()
+        self.stop_event = threading.Event()
+        self.final_state = None
+    
+    def schedule(self, delay_ms, callback, *args):
+        """delay_ms 후 메인 스레드에서 callback 실행"""
+        timer = threading.Timer(delay_ms / 1000, self.tasks.put, args=((callback, args),))
+        timer.daemon = True
+        timer.start()
+        return timer
+    
+    def cancel_schedule(self, handle):
+        handle.cancel()
+    
+    def request_stop(self, *_):
+        """종료 요청 (시그널 핸들러에서 호출)"""
+        self.stop_event.set()
+    
+    def run(self, exit_when_ready=False):
+        """
+        서버를 시작하고 종료 요청이 올 때까지 예약 작업 처리
+        exit_when_ready: 서버가 준비되면(또는 실패하면) 바로 종료 (시작 시간 측정용)
+        반환값: 종료 코드
+        """
+        signal.signal(signal.SIGINT, self.request_stop)
+        signal.signal(signal.SIGTERM, self.request_stop)
+        
+        # 시작 시간만 측정하는 경우 백그라운드 작업(리소스 측정, 집계, 캐시, 감시, 업로드 정리)은 시작하지 않음
+        self.run_services = not exit_when_ready
+        self.start_server()
+        
+        exit_code = 0
+        while not self.stop_event.is_set():
+            try:
+                callback, args = self.tasks.get(timeout=POLL_INTERVAL)
+                callback(*args)
+            except queue.Empty:
+                pass
+            # 화면이 없으므로 버퍼에 쌓인 로그는 버림 (콘솔/파일에는 이미 기록됨)
+            self.log_sink.drain()
+            
+            if not self.server_running and self.restart_after_id is None and not self.exit_pending:
+                # 서버가 정상 종료(코드 0)했거나, 시작 실패 또는 자동 재시작 중단
+                # (종료 처리가 예약된 동안은 기다림)
+                exit_code = 0 if self.last_exit_code == 0 else 1
+                break
+            if exit_when_ready and self.server_state in (STATE_READY, STATE_FAILED):
+                exit_code = 0 if self.server_state == STATE_READY else 1
+                break
+        
+        # 서버를 중지하면 상태가 바뀌므로 종료 직전 상태를 보관
+        self.final_state = self.server_state
+        self.shutdown()
+        return exit_code
+    
+    def startup_report(self):
+        """시작 시간 측정 결과 (--exit-when-ready)"""
+        return {
+            'mode': 'headless',
+            'state': self.final_state,
+            'cold_start_seconds': self.cold_start_time,
+            'server_ready_seconds': self.startup_time,
+            'port': self.server_port,
+            'phases': self.profiler.to_dict()['phases'],
+        }
+
+
+def run_headless(launch_time=None, exit_when_ready=False, profiler=None):
+    """헤드리스 모드 실행, 종료 코드 반환"""
+    app = HeadlessServer(launch_time=launch_time, profiler=profiler)
+    exit_code = app.run(exit_when_ready=exit_when_ready)
+    if exit_when_ready:
+        print(json.dumps(app.startup_report(), ensure_ascii=False))
+    return exit_code
@@ -0,0 +1,77 @@
+"""
+Next.js 서버 실행 명령 결정
+npm을 거치지 않고 node로 빌드된 서버를 직접 실행합니다.
+(npm CLI 프로세스가 빠지므로 시작이 빠르고, 프로세스가 하나 줄며, 종료 시 자식 프로세스가 남지 않음)
+
+우선순위 (launch_mode 'auto'):
+  1. .next/standalone/server.js  (next.config의 output: 'standalone' 빌드)
+  2. node_modules/next/dist/bin/next start  (.next 빌드만 있는 경우)
+  3. npm start  (위 두 가지를 찾지 못한 경우)
+"""
+
+import os
+
+LAUNCH_MODES = ('auto', 'node', 'npm')
+
+STANDALONE_ENTRY = os.path.join('.next', 'standalone', 'server.js')
+NEXT_CLI_ENTRY = os.path.join('node_modules', 'next', 'dist', 'bin', 'next')
+BUILD_ID_FILE = os.path.join('.next', 'BUILD_ID')
+
+
+class LaunchCommand:
+    """서버 실행 명령"""
+
+    def __init__(self, kind, cmd, entry=None):
+        self.kind = kind        # 'standalone', 'next-start', 'npm'
+        self.cmd = cmd
+        self.entry = entry
+
+    @property
+    def uses_npm(self):
+        return self.kind == 'npm'
+
+    def describe(self):
+        if self.kind == 'standalone':
+            return f"node 직접 실행 ({self.entry})"
+        if self.kind == 'next-start':
+            return "node 직접 실행 (next start)"
+        return "npm start"
+
+
+def find_node_entry(work_dir):
+    """node로 직접 실행할 수 있는 서버 진입점 (kind, 경로), 없으면 (None, None)"""
+    standalone = os.path.join(work_dir, STANDALONE_ENTRY)
+    if os.path.isfile(standalone):
+        return 'standalone', STANDALONE_ENTRY
+
+    next_cli = os.path.join(work_dir, NEXT_CLI_ENTRY)
+    if os.path.isfile(next_cli) and os.path.isfile(os.path.join(work_dir, BUILD_ID_FILE)):
+        return 'next-start', NEXT_CLI_ENTRY
+
+    return None, None
+
+
+def resolve_launch_command(work_dir, node_path, npm_path, mode='auto'):
+    """
+    실행 명령 결정
+    mode: 'auto' (node 우선, 없으면 npm), 'node' (node만), 'npm' (기존 방식)
+    반환값: LaunchCommand, 실행할 수 없으면 ValueError 발생
+    """
+    if mode not in LAUNCH_MODES:
+        raise ValueError(f"알 수 없는 실행 방식입니다: {mode} ({', '.join(LAUNCH_MODES)} 중 하나)")
+
+    if mode != 'npm' and node_path:
+        kind, entry = find_node_entry(work_dir)
+        if kind == 'standalone':
+            return LaunchCommand(kind, [node_path, entry], entry)
+        if kind == 'next-start':
+            return LaunchCommand(kind, [node_path, entry, 'start'], entry)
+        if mode == 'node':
+            raise ValueError(
+                f"node로 실행할 서버 빌드를 찾을 수 없습니다. "
+                f"({STANDALONE_ENTRY} 또는 {NEXT_CLI_ENTRY}) 'npm run build'를 먼저 실행하세요."
+            )
+
+    if not npm_path:
+        raise ValueError("npm을 찾을 수 없습니다.")
+    return LaunchCommand('npm', [npm_path, 'start'])
@@ -0,0 +1,279 @@
+"""
+서버 로그 파일 저장 및 조회
+- RotatingLogWriter: 백그라운드 스레드에서 로그를 파일로 기록 (크기/날짜 기준 교체)
+- LogFileIndex: 로그 파일을 페이지 단위로 나눠 필요한 부분만 읽음
+
+로그 파일(server-YYYYmmdd-HHMMSS.log) 옆에는 같은 이름의 .idx 파일이 있으며,
+PAGE_LINES 줄마다 "바이트 오프셋<TAB>첫 줄 시각" 한 줄이 기록됩니다.
+"""
+
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+
+PAGE_LINES = 500
+LOG_PREFIX = 'server-'
+LOG_SUFFIX = '.log'
+INDEX_SUFFIX = '.idx'
+
+_STOP = object()
+
+
+def _line_timestamp(line):
+    """'[YYYY-mm-dd HH:MM:SS] ...' 형식의 줄에서 시각 문자열 추출"""
+    if line.startswith('[') and len(line) >= 21 and line[20] == ']':
+        return line[1:20]
+    return ''
+
+
+def _list_log_files(log_dir):
+    """로그 파일 이름을 생성 순서대로 반환 (같은 초에 만든 파일은 -1, -2 ... 순)"""
+    def sort_key(name):
+        stem = name[len(LOG_PREFIX):-len(LOG_SUFFIX)]
+        parts = stem.split('-')
+        counter = int(parts[2]) if len(parts) > 2 and parts[2].isdigit() else 0
+        return ('-'.join(parts[:2]), counter)
+
+    if not os.path.isdir(log_dir):
+        return []
+    names = [name for name in os.listdir(log_dir)
+             if name.startswith(LOG_PREFIX) and name.endswith(LOG_SUFFIX)]
+    return sorted(names, key=sort_key)
+
+
+def _normalize_bound(value, upper):
+    """사용자가 입력한 날짜/시각을 'YYYY-mm-dd HH:MM:SS' 비교용 문자열로 변환"""
+    value = (value or '').strip()
+    if not value:
+        return None
+    if len(value) == 10:        # YYYY-mm-dd
+        return value + (' 23:59:59' if upper else ' 00:00:00')
+    if len(value) == 16:        # YYYY-mm-dd HH:MM
+        return value + (':59' if upper else ':00')
+    return value
+
+
+class RotatingLogWriter:
+    """로그 파일 기록기 (백그라운드 스레드)"""
+
+    def __init__(self, log_dir, max_bytes=5 * 1024 * 1024, max_files=50, queue_size=10000):
+        self.log_dir = log_dir
+        self.max_bytes = max_bytes
+        self.max_files = max_files
+        self.dropped = 0
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._file = None
+        self._index = None
+        self._day = None
+        self._lines = 0
+
+        os.makedirs(self.log_dir, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name='log-writer', daemon=True)
+        self._thread.start()
+
+    def write(self, line):
+        """로그 한 줄 기록 요청 (대기열이 가득 차면 버림)"""
+        try:
+            self._queue.put_nowait(line)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self, timeout=2.0):
+        """남은 로그를 기록하고 종료"""
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                while item is not _STOP:
+                    self._write_line(item)
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                # 대기열이 빌 때마다 디스크에 반영
+                if self._file:
+                    self._file.flush()
+                    self._index.flush()
+            except Exception as e:
+                print(f"로그 파일 기록 오류: {e}")
+            if item is _STOP:
+                self._close_file()
+                return
+
+    def _write_line(self, line):
+        data = (line.replace('\r', ' ').replace('\n', ' ') + '\n').encode('utf-8')
+
+        today = time.strftime('%Y%m%d')
+        if (self._file is None or today != self._day or
+                self._file.tell() + len(data) > self.max_bytes):
+            self._rotate(today)
+
+        # PAGE_LINES 줄마다 오프셋 기록
+        if self._lines % PAGE_LINES == 0:
+            self._index.write(f"{self._file.tell()}\t{_line_timestamp(line)}\n".encode('utf-8'))
+        self._file.write(data)
+        self._lines += 1
+
+    def _rotate(self, today):
+        self._close_file()
+
+        base = os.path.join(self.log_dir, f"{LOG_PREFIX}{time.strftime('%Y%m%d-%H%M%S')}")
+        path = base + LOG_SUFFIX
+        counter = 1
+        while os.path.exists(path):
+            path = f"{base}-{counter}{LOG_SUFFIX}"
+            counter += 1
+
+        self._file = open(path, 'ab')
+        self._index = open(path + INDEX_SUFFIX, 'ab')
+        self._day = today
+        self._lines = 0
+        self._remove_old_files()
+
+    def _close_file(self):
+        if self._file:
+            self._file.close()
+            self._index.close()
+            self._file = None
+            self._index = None
+
+    def _remove_old_files(self):
+        logs = _list_log_files(self.log_dir)
+        for name in logs[:-self.max_files] if self.max_files > 0 else []:
+            for path in (name, name + INDEX_SUFFIX):
+                try:
+                    os.remove(os.path.join(self.log_dir, path))
+                except OSError:
+                    pass
+
+
+class LogFileIndex:
+    """로그 파일 페이지 색인 (필요한 페이지만 디스크에서 읽음)"""
+
+    def __init__(self, log_dir, page_lines=PAGE_LINES):
+        self.log_dir = log_dir
+        self.page_lines = page_lines
+        self.pages = []     # (파일 경로, 바이트 오프셋, 첫 줄 시각)
+
+    def refresh(self):
+        """파일 목록과 .idx 파일을 다시 읽음"""
+        pages = []
+        for name in _list_log_files(self.log_dir):
+            path = os.path.join(self.log_dir, name)
+            try:
+                pages.extend((path, offset, ts) for offset, ts in self._load_index(path))
+            except OSError:
+                # 읽는 도중 삭제된 파일
+                continue
+        self.pages = pages
+        return len(pages)
+
+    def _load_index(self, path):
+        index_path = path + INDEX_SUFFIX
+        if not os.path.exists(index_path):
+            if os.path.getsize(path) == 0:
+                return []
+            self._rebuild_index(path)
+
+        entries = []
+        with open(index_path, 'rb') as f:
+            for raw in f:
+                parts = raw.decode('utf-8', errors='replace').rstrip('\n').split('\t', 1)
+                if len(parts) == 2 and parts[0].isdigit():
+                    entries.append((int(parts[0]), parts[1]))
+        return entries
+
+    def _rebuild_index(self, path):
+        """.idx 파일이 없는 로그 파일의 색인 재생성"""
+        with open(path, 'rb') as f, open(path + INDEX_SUFFIX, 'wb') as out:
+            offset = 0
+            for number, raw in enumerate(f):
+                if number % self.page_lines == 0:
+                    ts = _line_timestamp(raw.decode('utf-8', errors='replace'))
+                    out.write(f"{offset}\t{ts}\n".encode('utf-8'))
+                offset += len(raw)
+
+    def page_count(self):
+        return len(self.pages)
+
+    def read_page(self, page):
+        """페이지 하나(최대 page_lines 줄) 읽기"""
+        if not 0 <= page < len(self.pages):
+            return []
+        path, offset, _ = self.pages[page]
+        lines = []
+        try:
+            with open(path, 'rb') as f:
+                f.seek(offset)
+                for _ in range(self.page_lines):
+                    raw = f.readline()
+                    if not raw:
+                        break
+                    lines.append(raw.decode('utf-8', errors='replace').rstrip('\r\n'))
+        except OSError:
+            pass
+        return lines
+
+    def _page_overlaps(self, page, start, end):
+        """페이지 시간 범위가 필터와 겹치는지 확인"""
+        first = self.pages[page][2]
+        last = self.pages[page + 1][2] if page + 1 < len(self.pages) else ''
+        if end and first and first > end:
+            return False
+        if start and last and last < start:
+            return False
+        return True
+
+    def search(self, text=None, start=None, end=None, cursor=(0, 0), limit=PAGE_LINES):
+        """
+        조건에 맞는 줄 검색
+        cursor: (페이지, 페이지 안의 줄 번호)에서부터 검색
+        반환값: (찾은 줄 목록, 다음 검색 위치 또는 None)
+        """
+        start = _normalize_bound(start, upper=False)
+        end = _normalize_bound(end, upper=True)
+        needle = text.lower() if text else None
+
+        results = []
+        page, skip = cursor
+        while page < len(self.pages):
+            if self._page_overlaps(page, start, end):
+                lines = self.read_page(page)
+                for number in range(skip, len(lines)):
+                    line = lines[number]
+                    ts = _line_timestamp(line)
+                    if start and ts and ts < start:
+                        continue
+                    if end and ts and ts > end:
+                        continue
+                    if needle and needle not in line.lower():
+                        continue
+                    results.append(line)
+                    if len(results) >= limit:
+                        return results, (page, number + 1)
+            page += 1
+            skip = 0
+        return results, None
+
+
+def parse_time_filter(value):
+    """시간 필터 입력값 검증 (빈 값 허용)"""
+    value = (value or '').strip()
+    if not value:
+        return ''
+    for fmt in ('%Y-%m-%d', '%Y-%m-%d %H:%M', '%Y-%m-%d %H:%M:%S'):
+        try:
+            datetime.strptime(value, fmt)
+            return value
+        except ValueError:
+            continue
+    raise ValueError(f"시간 형식이 올바르지 않습니다: {value} (예: 2025-06-03 또는 2025-06-03 14:30)")
@@ -0,0 +1,49 @@
+"""
+로그 버퍼
+백그라운드 스레드에서 들어오는 로그를 고정 크기 링 버퍼에 모아 두고,
+GUI 스레드가 주기적으로 한꺼번에 가져가도록 합니다.
+"""
+
+import threading
+from collections import deque
+
+
+class LogSink:
+    """스레드 안전한 고정 크기 로그 버퍼"""
+
+    def __init__(self, capacity=5000):
+        self.capacity = capacity
+        self._buffer = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+        # 통계
+        self.total = 0      # 지금까지 들어온 줄 수
+        self.dropped = 0    # 버퍼가 가득 차서 버려진 줄 수
+
+    def put(self, line):
+        """로그 한 줄 추가 (가득 차면 가장 오래된 줄을 버림)"""
+        with self._lock:
+            if len(self._buffer) == self.capacity:
+                self.dropped += 1
+            self._buffer.append(line)
+            self.total += 1
+
+    def drain(self, max_items=500):
+        """최대 max_items 줄을 꺼내서 반환"""
+        with self._lock:
+            count = min(max_items, len(self._buffer))
+            return [self._buffer.popleft() for _ in range(count)]
+
+    @property
+    def buffered(self):
+        """아직 화면에 표시되지 않은 줄 수"""
+        return len(self._buffer)
+
+    def stats(self):
+        """통계 정보"""
+        with self._lock:
+            return {
+                'total': self.total,
+                'dropped': self.dropped,
+                'buffered': len(self._buffer),
+            }
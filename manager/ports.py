@@ -0,0 +1,86 @@
+"""
+서버 포트 사전 확인
+서버를 시작하기 전에 포트가 비어 있는지 소켓 bind 한 번으로 확인하고,
+사용 중이면 psutil.net_connections 한 번으로 어느 프로세스가 쓰고 있는지 찾습니다.
+(전체 프로세스를 돌며 연결 목록을 읽는 방식보다 빠르고 AccessDenied가 적음)
+"""
+
+import socket
+import sys
+
+
+class PortOwner:
+    """포트를 사용 중인 프로세스"""
+
+    def __init__(self, pid, name=None, cmdline=None):
+        self.pid = pid
+        self.name = name
+        self.cmdline = cmdline
+
+    def describe(self):
+        if self.pid is None:
+            return "알 수 없는 프로세스 (권한 부족)"
+        text = f"PID {self.pid}"
+        if self.name:
+            text += f" ({self.name})"
+        return text
+
+
+def is_port_free(port, host=''):
+    """포트에 바로 bind할 수 있는지 확인 (Node와 같은 조건)"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        if sys.platform == 'win32':
+            # 다른 프로세스가 같은 포트를 공유하고 있어도 사용 중으로 판단
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+        else:
+            # TIME_WAIT 상태의 이전 연결은 무시 (Node도 SO_REUSEADDR로 bind)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((host, port))
+        return True
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+
+def find_port_owner(port):
+    """
+    포트에서 LISTEN 중인 프로세스 (net_connections 한 번)
+    반환값: PortOwner, 찾지 못하면 None (권한이 없으면 pid가 None인 PortOwner)
+    """
+    import psutil
+
+    try:
+        connections = psutil.net_connections(kind='tcp')
+    except psutil.AccessDenied:
+        return PortOwner(None)
+
+    for conn in connections:
+        if conn.status != psutil.CONN_LISTEN or not conn.laddr or conn.laddr.port != port:
+            continue
+        if conn.pid is None:
+            return PortOwner(None)
+        owner = PortOwner(conn.pid)
+        try:
+            process = psutil.Process(conn.pid)
+            owner.name = process.name()
+            owner.cmdline = process.cmdline()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+        return owner
+    return None
+
+
+def find_free_port(start, attempts=20, exclude=(), companions=None):
+    """
+    start부터 차례로 비어 있는 포트 찾기, 없으면 None
+    companions(port): 그 포트와 함께 비어 있어야 하는 포트 목록 (클러스터 워커 포트)
+    """
+    for port in range(start, min(start + attempts, 65536)):
+        if port in exclude or not is_port_free(port):
+            continue
+        others = companions(port) if companions else []
+        if all(other != port and other < 65536 and is_port_free(other) for other in others):
+            return port
+    return None
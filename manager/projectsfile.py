@@ -0,0 +1,106 @@
+"""
+프로젝트 목록 파일 (data_path/projects.json)
+웹 서버(app/api/projects)와 서버 관리자(일괄 등록, 업로드 정리)가 함께 쓰는 원본입니다.
+쓰는 쪽은 모두 projects.json.lock 잠금 파일을 만든 뒤 최신 내용을 다시 읽어 바꾸고,
+읽은 뒤 파일이 바뀌지 않았을 때만 임시 파일로 교체합니다. (웹 서버의 lib/projectsFile.js와 같은 규칙)
+"""
+
+import json
+import os
+import time
+
+PROJECTS_FILE = 'projects.json'
+LOCK_SUFFIX = '.lock'
+# 잠금을 기다리는 최대 시간과, 이보다 오래된 잠금 파일은 비정상 종료로 남은 것으로 보고 지움 (초)
+LOCK_TIMEOUT = 10.0
+STALE_LOCK_SECONDS = 30.0
+LOCK_RETRY_INTERVAL = 0.05
+# 잠금 없이 쓰는 프로그램 때문에 읽은 뒤 파일이 바뀐 경우 다시 시도하는 횟수
+MAX_ATTEMPTS = 5
+
+
+def projects_path(data_path):
+    return os.path.join(data_path, PROJECTS_FILE)
+
+
+def file_state(path):
+    """파일 크기/수정 시각 (없으면 None)"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def load_projects(path):
+    """프로젝트 목록 (파일이 없으면 빈 목록)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            projects = json.load(f)
+    except FileNotFoundError:
+        return []
+    if not isinstance(projects, list):
+        raise ValueError(f"프로젝트 목록 형식이 아닙니다: {path}")
+    return projects
+
+
+class ProjectsFileLock:
+    """projects.json.lock 잠금 파일 (프로세스 사이 쓰기 잠금)"""
+
+    def __init__(self, path, timeout=LOCK_TIMEOUT):
+        self.lock_file = path + LOCK_SUFFIX
+        self.timeout = timeout
+
+    def __enter__(self):
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                fd = os.open(self.lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                self._remove_stale()
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"프로젝트 목록 잠금을 얻지 못했습니다: {self.lock_file}")
+                time.sleep(LOCK_RETRY_INTERVAL)
+                continue
+            with os.fdopen(fd, 'w') as f:
+                f.write(str(os.getpid()))
+            return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            os.remove(self.lock_file)
+        except FileNotFoundError:
+            pass
+        return False
+
+    def _remove_stale(self):
+        try:
+            if time.time() - os.path.getmtime(self.lock_file) > STALE_LOCK_SECONDS:
+                os.remove(self.lock_file)
+        except OSError:
+            pass
+
+
+def modify_projects(path, change):
+    """
+    잠금을 잡고 최신 projects.json에 change(projects)를 적용해 저장
+    change는 목록을 직접 바꾸거나 새 목록을 반환, 반환값: 저장한 목록
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with ProjectsFileLock(path):
+        for _ in range(MAX_ATTEMPTS):
+            state = file_state(path)
+            projects = load_projects(path)
+            result = change(projects)
+            projects = projects if result is None else result
+
+            temp_file = f"{path}.{os.getpid()}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(projects, f, ensure_ascii=False, indent=2)
+            if file_state(path) != state:
+                # 읽은 뒤 다른 프로그램이 바꿨으면 다시 읽어서 적용
+                os.remove(temp_file)
+                continue
+            os.replace(temp_file, path)
+            return projects
+    raise RuntimeError(f"projects.json이 계속 바뀌어 저장하지 못했습니다: {path}")
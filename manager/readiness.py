@@ -0,0 +1,84 @@
+"""
+서버 준비 상태 확인
+설정된 포트로 HTTP 요청을 반복해서 보내 Next.js 서버가 실제로 응답할 때까지 기다립니다.
+"""
+
+import time
+
+# 준비 상태
+STATE_STOPPED = 'stopped'
+STATE_STARTING = 'starting'
+STATE_READY = 'ready'
+STATE_FAILED = 'failed'
+
+
+class ReadinessProbe:
+    """HTTP 준비 상태 확인기"""
+
+    def __init__(self, url, timeout=60.0, interval=0.25, request_timeout=2.0):
+        self.url = url
+        self.timeout = timeout
+        self.interval = interval
+        self.request_timeout = request_timeout
+
+        self.state = STATE_STOPPED
+        self.elapsed = None
+        self.attempts = 0
+        self.last_error = None
+
+        # requests는 로드 시간이 길어 실제로 확인할 때 가져옴
+        import requests
+        from requests.adapters import HTTPAdapter
+        self._request_error = requests.RequestException
+
+        # 같은 연결을 재사용하도록 풀 크기 1의 세션 사용
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0)
+        self.session.mount('http://', adapter)
+
+    def check_once(self):
+        """한 번 요청해서 서버가 응답하는지 확인"""
+        self.attempts += 1
+        try:
+            response = self.session.get(self.url, timeout=self.request_timeout,
+                                        allow_redirects=False)
+            response.close()
+            # 5xx는 아직 준비 중인 것으로 간주
+            return response.status_code < 500
+        except self._request_error as e:
+            self.last_error = e
+            return False
+
+    def wait(self, is_alive=None):
+        """
+        서버가 준비될 때까지 대기
+        is_alive: 서버 프로세스가 살아 있는지 확인하는 함수 (False를 반환하면 즉시 실패)
+        반환값: (상태, 걸린 시간(초))
+        """
+        self.state = STATE_STARTING
+        self.attempts = 0
+        self.last_error = None
+        start = time.perf_counter()
+        deadline = start + self.timeout
+
+        while True:
+            if is_alive is not None and not is_alive():
+                self.state = STATE_FAILED
+                break
+
+            if self.check_once():
+                self.state = STATE_READY
+                break
+
+            if time.perf_counter() >= deadline:
+                self.state = STATE_FAILED
+                break
+
+            time.sleep(self.interval)
+
+        self.elapsed = time.perf_counter() - start
+        return self.state, self.elapsed
+
+    def close(self):
+        """세션 정리"""
+        self.session.close()
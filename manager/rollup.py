@@ -0,0 +1,299 @@
+"""
+전체 프로젝트 점수 집계
+각 프로젝트 엑셀 파일의 대분류/중분류/소분류/담당자별 점수 합계를 미리 계산해
+data_path/summary.json에 저장합니다. 파일이 바뀐 프로젝트만 다시 계산하고,
+나머지는 이전 결과를 그대로 사용합니다.
+
+집계 구조는 app/summary/page.js의 calculateSummary와 같습니다.
+(담당자목록/프로젝트목록은 Set 대신 목록)
+"""
+
+import json
+import os
+import threading
+import time
+
+from manager.workbook import read_template
+
+SUMMARY_FILE = 'summary.json'
+PROJECTS_FILE = 'projects.json'
+SUMMARY_VERSION = 1
+
+# 합산하지 않고 합집합으로 합치는 항목
+SET_KEYS = ('담당자목록', '프로젝트목록')
+
+
+def _number(value, default):
+    """JavaScript Number()처럼 변환 (빈 값/숫자가 아니면 기본값)"""
+    if value is None or value == '':
+        return default
+    if isinstance(value, (int, float)):
+        return value
+    text = str(value).strip()
+    if not text:
+        return 0
+    try:
+        number = float(text)
+    except ValueError:
+        return default
+    return int(number) if number.is_integer() else number
+
+
+def parse_score_range(value):
+    """'최소/최대' 점수 범위 -> (최소, 최대), 형식이 다르면 (0, 1)"""
+    text = str(value or '').strip()
+    parts = text.split('/')
+    if len(parts) != 2:
+        return 0, 1
+    return _number(parts[0], 0), _number(parts[1], 1)
+
+
+def _node(tree, key, **children):
+    """집계 노드 가져오기 (없으면 생성)"""
+    node = tree.get(key)
+    if node is None:
+        node = {'점수합': 0, '최대점수합': 0}
+        node.update(children)
+        tree[key] = node
+    return node
+
+
+def _add(node, score, max_score, count=False):
+    node['점수합'] += score
+    node['최대점수합'] += max_score
+    if count:
+        node['항목수'] += 1
+
+
+def empty_summary():
+    return {'대분류별': {}, '중분류별': {}, '담당자별': {}}
+
+
+def summarize_items(items, summary=None):
+    """항목 목록을 calculateSummary와 같은 구조로 집계"""
+    summary = summary or empty_summary()
+    for item in items:
+        major, middle, minor = item['대분류'], item['중분류'], item['소분류']
+        manager, project = item['담당자'], item['project']
+        score, max_score = item['점수'], item['최대점수']
+
+        # 대분류 > 중분류 > 소분류
+        category = _node(summary['대분류별'], major, 항목수=0, 담당자목록=[], 중분류={})
+        _add(category, score, max_score, count=True)
+        if manager not in category['담당자목록']:
+            category['담당자목록'].append(manager)
+        sub = _node(category['중분류'], middle, 항목수=0, 소분류={})
+        _add(sub, score, max_score, count=True)
+        if minor:
+            _add(_node(sub['소분류'], minor, 항목수=0), score, max_score, count=True)
+
+        # 담당자 > 대분류 > 중분류 > 소분류
+        person = _node(summary['담당자별'], manager, 항목수=0, 프로젝트목록=[], 대분류별={}, 프로젝트별={})
+        _add(person, score, max_score, count=True)
+        if project not in person['프로젝트목록']:
+            person['프로젝트목록'].append(project)
+        person_major = _node(person['대분류별'], major, 중분류별={}, 프로젝트별={})
+        _add(person_major, score, max_score)
+        person_middle = _node(person_major['중분류별'], middle, 소분류별={})
+        _add(person_middle, score, max_score)
+        if minor:
+            _add(_node(person_middle['소분류별'], minor), score, max_score)
+
+        # 담당자 > 프로젝트 > 대분류 > 중분류 > 소분류
+        per_project = person['프로젝트별'].setdefault(project, {'대분류별': {}})
+        project_major = _node(per_project['대분류별'], major, 중분류별={})
+        _add(project_major, score, max_score)
+        project_middle = _node(project_major['중분류별'], middle, 소분류별={})
+        _add(project_middle, score, max_score)
+        if minor:
+            _add(_node(project_middle['소분류별'], minor), score, max_score)
+    return summary
+
+
+def merge_summary(target, source):
+    """source 집계를 target에 더하기 (합계는 합산, 목록은 합집합)"""
+    for key, value in source.items():
+        if isinstance(value, dict):
+            merge_summary(target.setdefault(key, {}), value)
+        elif key in SET_KEYS:
+            existing = target.setdefault(key, [])
+            existing.extend(v for v in value if v not in existing)
+        else:
+            target[key] = target.get(key, 0) + value
+    return target
+
+
+def project_items(project, template):
+    """엑셀 데이터 -> 집계용 항목 목록 (summary 페이지의 allData와 같은 값)"""
+    name = template.project_info.get('projectName') or project.get('projectName', '')
+    columns = template.columns
+    items = []
+    for i in range(len(template)):
+        _, max_score = parse_score_range(template.score_ranges[i])
+        items.append({
+            'project': name,
+            '대분류': columns['대분류'][i],
+            '중분류': columns['중분류'][i],
+            '소분류': columns['소분류'][i],
+            '담당자': columns['담당자'][i],
+            '점수': template.scores[i],
+            '최대점수': max_score,
+        })
+    return items
+
+
+def _fingerprint(entries):
+    return [(key, entry.get('signature'), entry.get('inspectionDate'), entry.get('filePath'))
+            for key, entry in entries.items()]
+
+
+class RollupStore:
+    """summary.json 관리 (바뀐 프로젝트만 다시 계산)"""
+
+    def __init__(self, data_path, uploads_path, log=print):
+        self.data_path = data_path
+        self.uploads_path = uploads_path
+        self.log = log
+        self.summary_file = os.path.join(data_path, SUMMARY_FILE)
+        self.projects_file = os.path.join(data_path, PROJECTS_FILE)
+        self.last_stats = None
+        
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self, interval=30.0):
+        """백그라운드 스레드에서 주기적으로 갱신 (바뀐 것이 없으면 파일 상태만 확인)"""
+        self.interval = interval
+        self._thread = threading.Thread(target=self._run, name='rollup', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def request_update(self):
+        """다음 주기를 기다리지 않고 바로 갱신"""
+        self._wake.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                stats = self.update()
+                if stats['recomputed'] or stats['failed'] or stats['removed']:
+                    self.log(f"점수 집계 갱신: 다시 계산 {stats['recomputed']}개, 재사용 {stats['reused']}개, "
+                             f"삭제 {stats['removed']}개, 실패 {stats['failed']}개 ({stats['elapsed'] * 1000:.0f}ms)")
+            except Exception as e:
+                self.log(f"점수 집계 오류: {e}")
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def resolve_file(self, file_path):
+        """프로젝트의 filePath(/uploads/...)를 실제 파일 경로로 변환"""
+        relative = file_path.lstrip('/')
+        if relative.startswith('uploads/'):
+            return os.path.join(self.uploads_path, relative[len('uploads/'):])
+        return os.path.join(os.path.dirname(self.uploads_path), relative)
+
+    def _load(self, path, default):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return default
+        except (OSError, ValueError) as e:
+            self.log(f"집계 파일 읽기 오류 ({os.path.basename(path)}): {e}")
+            return default
+
+    def _load_projects(self):
+        return self._load(self.projects_file, [])
+
+    def _signature(self, project):
+        """다시 계산할지 판단하는 값 (파일 크기/수정 시각 + 집계에 쓰는 프로젝트 정보)"""
+        try:
+            stat = os.stat(self.resolve_file(project.get('filePath', '')))
+            file_sig = [stat.st_size, stat.st_mtime_ns]
+        except OSError:
+            file_sig = None
+        return [project.get('filePath'), project.get('projectName'), file_sig]
+
+    def update(self, force=False):
+        """
+        summary.json 갱신
+        반환값: {'recomputed', 'reused', 'removed', 'failed', 'elapsed'}
+        """
+        with self._lock:
+            return self._update(force)
+
+    def _update(self, force):
+        start = time.perf_counter()
+        projects = self._load_projects()
+        previous = {} if force else self._load(self.summary_file, {})
+        if previous.get('version') != SUMMARY_VERSION:
+            previous = {}
+        cached = previous.get('projects', {})
+        before = _fingerprint(cached)
+
+        entries = {}
+        stats = {'recomputed': 0, 'reused': 0, 'removed': 0, 'failed': 0}
+        for project in projects:
+            key = str(project.get('id'))
+            signature = self._signature(project)
+            entry = cached.get(key)
+            if entry is not None and entry.get('signature') == signature:
+                stats['reused'] += 1
+            else:
+                entry = self._compute(project, signature)
+                if entry.get('error'):
+                    stats['failed'] += 1
+                else:
+                    stats['recomputed'] += 1
+            # 기간 필터용 값은 다시 계산하지 않아도 항상 최신으로
+            entry['inspectionDate'] = project.get('inspectionDate', '')
+            entry['filePath'] = project.get('filePath', '')
+            entries[key] = entry
+        stats['removed'] = len(set(cached) - set(entries))
+
+        if not previous or _fingerprint(entries) != before:
+            self._write(entries)
+
+        stats['elapsed'] = time.perf_counter() - start
+        self.last_stats = stats
+        return stats
+
+    def _compute(self, project, signature):
+        """프로젝트 하나 집계"""
+        entry = {'signature': signature, 'total': 0, 'max': 0, 'items': 0, 'summary': empty_summary()}
+        try:
+            template = read_template(self.resolve_file(project.get('filePath', '')))
+        except (OSError, ValueError) as e:
+            entry['error'] = str(e)
+            return entry
+        items = project_items(project, template)
+        entry['summary'] = summarize_items(items)
+        entry['total'] = sum(item['점수'] for item in items)
+        entry['max'] = sum(item['최대점수'] for item in items)
+        entry['items'] = len(items)
+        return entry
+
+    def _write(self, entries):
+        total = empty_summary()
+        total_score = total_max = 0
+        for entry in entries.values():
+            merge_summary(total, entry['summary'])
+            total_score += entry['total']
+            total_max += entry['max']
+
+        document = {
+            'version': SUMMARY_VERSION,
+            'generatedAt': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'total': {**total, '전체점수': {'total': total_score, 'max': total_max}},
+            'projects': entries,
+        }
+        os.makedirs(self.data_path, exist_ok=True)
+        # 같은 프로세스의 다른 RollupStore나 다른 프로세스와 임시 파일이 겹치지 않도록 이름을 구분
+        temp_file = f"{self.summary_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(document, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temp_file, self.summary_file)
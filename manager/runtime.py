@@ -0,0 +1,178 @@
+"""
+exe 실행 환경 (PyInstaller) 경로
+빌드 방식(build.py --mode)에 따라 Node.js 런타임과 서버 빌드가 있는 위치가 다릅니다.
+
+  onefile     exe 하나, 실행할 때마다 임시 폴더(_MEIPASS)에 모두 풀림
+  onedir      exe 옆 폴더를 그대로 사용 (풀지 않음)
+  persistent  exe 옆의 서버 파일(server-<버전>.zip)을 사용자 폴더에 버전별로 한 번만 풀어서 사용
+              (임시 폴더가 아니므로 업로드/데이터가 다음 실행에도 남고, 새 버전으로 옮겨짐)
+
+업로드/데이터 폴더의 기본 위치는 default_data_root()이고, 서버 관리자가 같은 경로를
+웹 서버에 DATA_PATH/UPLOADS_PATH로 넘기므로 두 프로그램이 같은 폴더를 사용합니다.
+"""
+
+import json
+import os
+import shutil
+import sys
+import threading
+import zipfile
+
+# exe에 함께 들어가는 서버 파일 정보 (build.py가 persistent 모드에서 생성)
+PAYLOAD_MANIFEST = 'payload.json'
+COMPLETE_MARKER = '.complete'
+# 새 버전으로 옮길 사용자 데이터 (서버 폴더 기준, 이전 위치 -> 새 위치)
+# .next/standalone 아래는 웹 서버가 작업 디렉토리 기준으로 쓰던 이전 빌드의 위치
+USER_DATA_DIRS = [
+    (os.path.join('public', 'uploads'), os.path.join('public', 'uploads')),
+    ('data', 'data'),
+    (os.path.join('.next', 'standalone', 'public', 'uploads'), os.path.join('public', 'uploads')),
+    (os.path.join('.next', 'standalone', 'data'), 'data'),
+]
+
+_server_root = None
+_server_root_lock = threading.Lock()
+
+
+def is_frozen():
+    return getattr(sys, 'frozen', False)
+
+
+def bundle_dir():
+    """exe에 들어 있는 파일 위치 (개발 환경에서는 현재 폴더)"""
+    return getattr(sys, '_MEIPASS', None) or os.path.abspath(".")
+
+
+def default_runtime_root():
+    """서버 파일을 풀어 둘 사용자별 폴더"""
+    if os.environ.get('INSPECTION_RUNTIME_DIR'):
+        return os.environ['INSPECTION_RUNTIME_DIR']
+    if sys.platform == "win32":
+        base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), 'AppData', 'Local')
+        return os.path.join(base, 'InspectionSystem', 'runtime')
+    base = os.environ.get('XDG_DATA_HOME') or os.path.join(os.path.expanduser('~'), '.local', 'share')
+    return os.path.join(base, 'inspection-system', 'runtime')
+
+
+def default_data_root():
+    """
+    설정에 경로가 없을 때 업로드(public/uploads)/데이터(data) 폴더의 기준 위치
+    개발 환경은 현재 폴더, persistent는 서버 파일을 푼 폴더 (새 버전으로 옮겨짐),
+    onefile/onedir는 exe가 있는 폴더 (onefile의 임시 폴더는 종료하면 지워지므로 사용하지 않음)
+    """
+    if not is_frozen():
+        return os.getcwd()
+    if load_payload_manifest():
+        return server_root()
+    return os.path.dirname(os.path.abspath(sys.executable))
+
+
+def load_payload_manifest():
+    """persistent 모드의 서버 파일 정보 {'version', 'payload', 'sha256'}, 다른 모드면 None"""
+    path = os.path.join(bundle_dir(), PAYLOAD_MANIFEST)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def extract_payload(payload, target):
+    """zip을 임시 폴더에 푼 뒤 이름 변경 (중간에 끊겨도 반쯤 풀린 폴더를 쓰지 않음)"""
+    staging = target + '.extracting'
+    if os.path.exists(staging):
+        shutil.rmtree(staging)
+    with zipfile.ZipFile(payload) as archive:
+        for info in archive.infolist():
+            path = archive.extract(info, staging)
+            # zip에 기록된 실행 권한 복원 (node 실행 파일)
+            mode = info.external_attr >> 16
+            if mode and not info.is_dir():
+                os.chmod(path, mode & 0o777)
+    with open(os.path.join(staging, COMPLETE_MARKER), 'w', encoding='utf-8') as f:
+        f.write(os.path.basename(payload))
+    os.replace(staging, target)
+
+
+def has_user_data(path):
+    """버전 폴더에 옮기지 않은 사용자 데이터가 남아 있는지"""
+    for relative, _ in USER_DATA_DIRS:
+        folder = os.path.join(path, relative)
+        if os.path.isdir(folder) and os.listdir(folder):
+            return True
+    return False
+
+
+def migrate_user_data(root, target, log=print):
+    """가장 최근 이전 버전 폴더의 업로드/데이터를 새 버전 폴더로 옮김 (옮기지 못한 폴더는 그대로 둠)"""
+    previous = []
+    for name in os.listdir(root):
+        path = os.path.join(root, name)
+        if path != target and os.path.exists(os.path.join(path, COMPLETE_MARKER)):
+            previous.append((os.path.getmtime(os.path.join(path, COMPLETE_MARKER)), path))
+    if not previous:
+        return
+    source_root = max(previous)[1]
+    moved = set()
+    for relative, new_relative in USER_DATA_DIRS:
+        source = os.path.join(source_root, relative)
+        if not os.path.isdir(source) or new_relative in moved:
+            # 같은 위치로 이미 옮긴 데이터가 있으면 덮어쓰지 않음 (남은 폴더는 지우지 않고 둠)
+            continue
+        destination = os.path.join(target, new_relative)
+        try:
+            if os.path.isdir(destination):
+                # 새 버전에 들어 있던 기본 파일은 이전 버전 사용자 파일로 교체
+                shutil.rmtree(destination)
+            os.makedirs(os.path.dirname(destination), exist_ok=True)
+            shutil.move(source, destination)
+        except OSError as e:
+            log(f"이전 버전의 사용자 데이터를 옮기지 못했습니다 ({relative}): {e}")
+            continue
+        moved.add(new_relative)
+        log(f"이전 버전의 사용자 데이터를 옮겼습니다: {relative}")
+
+
+def ensure_payload(manifest, root=None, log=print):
+    """서버 파일을 버전별 폴더에 한 번만 풀고 그 경로 반환"""
+    root = root or default_runtime_root()
+    target = os.path.join(root, manifest['version'])
+    if os.path.exists(os.path.join(target, COMPLETE_MARKER)):
+        return target
+
+    payload = os.path.join(os.path.dirname(os.path.abspath(sys.executable)), manifest['payload'])
+    if not os.path.exists(payload):
+        raise FileNotFoundError(f"서버 파일을 찾을 수 없습니다: {payload}")
+
+    log(f"서버 파일을 처음 한 번 푸는 중... ({target})")
+    os.makedirs(root, exist_ok=True)
+    if os.path.exists(target):
+        shutil.rmtree(target)
+    extract_payload(payload, target)
+    migrate_user_data(root, target, log)
+    remove_old_versions(root, target, log)
+    return target
+
+
+def remove_old_versions(root, keep, log=print):
+    """
+    이전 버전 폴더 삭제 (사용자 데이터를 모두 옮긴 폴더와 데이터가 없던 폴더만)
+    옮기지 못한 데이터가 남은 폴더는 지우지 않음, 사용 중인 파일이 있으면 다음 기회에
+    """
+    for name in os.listdir(root):
+        path = os.path.join(root, name)
+        if path == keep or not os.path.isdir(path):
+            continue
+        if has_user_data(path):
+            log(f"사용자 데이터가 남아 있어 이전 버전 폴더를 지우지 않았습니다: {path}")
+            continue
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def server_root(log=print):
+    """Node.js 런타임과 서버 빌드가 있는 폴더 (처음 호출할 때 결정)"""
+    global _server_root
+    with _server_root_lock:
+        if _server_root is None:
+            manifest = load_payload_manifest() if is_frozen() else None
+            _server_root = ensure_payload(manifest, log=log) if manifest else bundle_dir()
+        return _server_root
@@ -0,0 +1,980 @@
+"""
+서버 수명주기 관리
+설정 로드, Next.js 서버 시작/중지, 준비 상태 확인, 출력 모니터링, 자동 재시작,
+클러스터 모드, 리소스 측정을 담당합니다. GUI 모듈(tkinter/PIL/pystray)을 가져오지 않으므로
+GUI 관리자(manager.gui)와 헤드리스 모드(manager.headless)가 함께 사용합니다.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+
+from manager.readiness import STATE_STOPPED, STATE_STARTING, STATE_READY, STATE_FAILED
+from manager.logsink import LogSink
+from manager.logfile import RotatingLogWriter
+from manager.decoding import iter_lines
+from manager.watchdog import CrashWatchdog, format_duration
+from manager.ports import is_port_free, find_port_owner, find_free_port
+
+
+class ServerController:
+    """Next.js 서버 수명주기 관리 (GUI 없음)"""
+    
+    # 서버 준비 후 브라우저를 자동으로 열지 여부 (헤드리스 모드에서는 False)
+    opens_browser = True
+    # 서버를 시작할 때 백그라운드 작업(리소스 측정, DB, 집계, 캐시, 감시)도 시작할지 여부
+    # (헤드리스 시작 시간 측정에서는 False)
+    run_services = True
+    
+    def __init__(self, config_file="server_config.json", launch_time=None, profiler=None):
+        # 프로세스 시작 시각 (콜드 스타트 측정용)
+        self.launch_time = launch_time if launch_time is not None else time.perf_counter()
+        self.cold_start_reported = False
+        self.cold_start_time = None
+        # 시작 단계별 소요 시간 (첫 서버 준비 시 data_path/startup/에 저장)
+        if profiler is None:
+            from manager.startup import StartupProfiler
+            profiler = StartupProfiler(self.launch_time)
+        self.profiler = profiler
+        
+        # 기본 설정
+        self.config_file = config_file
+        with self.profiler.phase('load_config'):
+            self.load_config()
+        controller_start = time.perf_counter()
+        
+        # 로그 버퍼 (백그라운드 스레드 -> GUI 스레드)
+        self.log_sink = LogSink(capacity=int(self.config.get('log_buffer_size', 5000)))
+        
+        # 로그 파일 기록 (data_path/logs)
+        self.log_dir = os.path.join(self.config['data_path'], 'logs')
+        try:
+            self.log_writer = RotatingLogWriter(
+                self.log_dir,
+                max_bytes=int(self.config.get('log_file_max_mb', 5)) * 1024 * 1024,
+                max_files=int(self.config.get('log_file_max_count', 50))
+            )
+        except Exception as e:
+            print(f"로그 파일 초기화 오류: {e}")
+            self.log_writer = None
+        
+        # 서버 상태
+        self.server_process = None
+        self.server_running = False
+        self.server_state = STATE_STOPPED
+        self.startup_time = None
+        self.launch_kind = None
+        # 실제로 사용 중인 포트 (설정 포트가 사용 중이면 대체 포트)
+        self.server_port = self.config['server_port']
+        # 시작/중지할 때마다 증가 (이전 실행의 백그라운드 스레드 결과 무시용)
+        self.server_run_id = 0
+        
+        # 클러스터 모드 상태
+        self.cluster_proxy = None
+        self.cluster_workers = []
+        self.cluster_launch = None
+        
+        # 비정상 종료 감시 (자동 재시작)
+        self.watchdog = CrashWatchdog(
+            max_delay=float(self.config.get('restart_max_delay', 60)),
+            loop_limit=int(self.config.get('crash_loop_limit', 5)),
+            loop_window=float(self.config.get('crash_loop_window', 300)),
+            history_file=os.path.join(self.config['data_path'], 'restart_history.jsonl')
+        )
+        self.restart_after_id = None
+        self.auto_restarting = False
+        # 서버가 종료되어 handle_server_exit가 예약되었지만 아직 처리되지 않음
+        # (server_running이 False여도 곧 재시작할 수 있으므로 헤드리스 루프가 끝나지 않도록)
+        self.exit_pending = False
+        # 마지막으로 종료된 서버 프로세스의 종료 코드 (실행 중이거나 시작하지 못했으면 None)
+        self.last_exit_code = None
+        
+        # 백그라운드 작업 (서버를 처음 시작할 때 start_services에서 생성)
+        self.services_started = False
+        self.telemetry = None
+        self.rollups = None
+        self.workbook_cache = None
+        self.cache_prewarmed = False
+        self.upload_watcher = None
+        self.content_store = None
+        self.metrics_server = None
+        self.profiler.record('init_controller', controller_start, time.perf_counter())
+    
+    def start_services(self):
+        """
+        백그라운드 작업 시작 (서버를 처음 시작할 때 한 번)
+        psutil 등은 여기서 처음 가져오므로 창 표시/헤드리스 시작이 늦어지지 않음
+        """
+        if self.services_started or not self.run_services:
+            return
+        self.services_started = True
+        
+        with self.profiler.phase('start_services'):
+            from manager.telemetry import ProcessTreeSampler
+            from manager.rollup import RollupStore
+            from manager.cache import WorkbookCache
+            
+            # 프로세스 트리 리소스 측정
+            self.telemetry = ProcessTreeSampler(
+                self.get_server_pids,
+                interval=float(self.config.get('telemetry_interval', 5)),
+                history=int(self.config.get('telemetry_history', 720))
+            )
+            self.telemetry.start()
+            
+            # 전체 프로젝트 점수 집계 (data_path/summary.json, 바뀐 프로젝트만 다시 계산)
+            self.rollups = RollupStore(self.config['data_path'], self.config['uploads_path'],
+                                       log=self.log_message)
+            self.rollups.start(interval=float(self.config.get('rollup_interval', 30)))
+            
+            # 엑셀 파일 읽기 결과 캐시 (data_path/cache/workbooks, 웹 서버와 함께 사용)
+            try:
+                self.workbook_cache = WorkbookCache(
+                    self.config['data_path'], self.config['uploads_path'],
+                    budget_bytes=int(self.config.get('workbook_cache_mb', 64)) * 1024 * 1024,
+                    log=self.log_message
+                )
+                # 웹 서버가 쓴 캐시 파일도 예산 안에 있도록 주기적으로 정리
+                self.workbook_cache.start(interval=float(self.config.get('cache_trim_interval', 60)))
+            except OSError as e:
+                self.log_message(f"엑셀 캐시 초기화 오류: {e}")
+            
+            # 업로드 폴더 감시 (바뀐 엑셀 파일만 집계/캐시에 전달)
+            if self.config.get('watch_uploads', True):
+                from manager.watcher import UploadWatcher
+                self.upload_watcher = UploadWatcher(
+                    self.config['uploads_path'],
+                    manifest_file=os.path.join(self.config['data_path'], 'uploads_manifest.json'),
+                    debounce=float(self.config.get('watch_debounce', 1.0)),
+                    poll_interval=float(self.config.get('watch_poll_interval', 5)),
+                    log=self.log_message
+                )
+                self.upload_watcher.add_listener(self.on_uploads_changed)
+                self.upload_watcher.start()
+            
+            # 참조 없는 업로드 파일 정리 (웹 서버는 프로젝트를 바꾸거나 지워도 파일을 바로 지우지 않음)
+            gc_interval = float(self.config.get('upload_gc_interval', 3600))
+            if gc_interval > 0:
+                from manager.storage import ContentStore
+                self.content_store = ContentStore(self.config['uploads_path'], self.config['data_path'],
+                                                  log=self.log_message)
+                self.content_store.start(interval=gc_interval)
+            
+            # 리소스 지표 HTTP 엔드포인트 (/metrics, /metrics.json)
+            self.start_metrics_server()
+    
+    def start_metrics_server(self):
+        """리소스 지표 HTTP 엔드포인트 시작 (/metrics, /metrics.json)"""
+        metrics_port = int(self.config.get('metrics_port', 0))
+        if not metrics_port:
+            return
+        from manager.telemetry import MetricsServer
+        try:
+            self.metrics_server = MetricsServer(self.telemetry, metrics_port,
+                                                extra=self.get_manager_metrics)
+            self.metrics_server.start()
+            self.log_message(f"리소스 지표: http://127.0.0.1:{metrics_port}/metrics")
+        except OSError as e:
+            self.log_message(f"리소스 지표 서버 시작 오류 (포트 {metrics_port}): {e}")
+            self.metrics_server = None
+    
+    def shutdown(self):
+        """서버와 백그라운드 작업 종료"""
+        if self.server_running or self.restart_after_id is not None:
+            self.stop_server()
+        
+        if self.telemetry:
+            self.telemetry.stop()
+        if self.rollups:
+            self.rollups.stop()
+        if self.workbook_cache:
+            self.workbook_cache.stop()
+        if self.upload_watcher:
+            self.upload_watcher.stop()
+        if self.content_store:
+            self.content_store.stop()
+        if self.metrics_server:
+            self.metrics_server.stop()
+        
+        if self.log_writer:
+            self.log_writer.close()
+    
+    def on_uploads_changed(self, changes):
+        """업로드 폴더의 엑셀 파일이 바뀐 경우 (감시 스레드)"""
+        counts = ", ".join(f"{label} {len(changes[kind])}개" for kind, label in
+                           (('added', "추가"), ('modified', "변경"), ('removed', "삭제")) if changes[kind])
+        self.log_message(f"업로드 폴더 변경 감지: {counts}")
+        if self.workbook_cache:
+            self.workbook_cache.invalidate_paths(changes['modified'] + changes['removed'])
+        self.rollups.request_update()
+    
+    def prewarm_workbook_cache(self, port):
+        """
+        최근 수정된 프로젝트의 엑셀 파일을 웹 서버에 요청해 미리 캐시 (백그라운드 스레드)
+        캐시 항목은 웹 서버의 /api/excel이 만들므로 응답 형식이 항상 같음
+        """
+        limit = int(self.config.get('cache_prewarm', 20))
+        if not limit:
+            return
+        from manager.projectsfile import load_projects, projects_path
+        
+        start = time.perf_counter()
+        try:
+            projects = load_projects(projects_path(self.config['data_path']))
+        except (OSError, ValueError) as e:
+            self.log_message(f"엑셀 캐시 준비 오류: {e}")
+            return
+        loaded, cached, failed = self.workbook_cache.prewarm(projects, f"http://127.0.0.1:{port}", limit)
+        self.log_message(f"엑셀 캐시 준비: 새로 읽음 {loaded}개, 이미 있음 {cached}개, 실패 {failed}개 "
+                         f"({(time.perf_counter() - start) * 1000:.0f}ms)")
+    
+    # ---- 실행 환경별로 재정의하는 메서드 ----
+    
+    def schedule(self, delay_ms, callback, *args):
+        """delay_ms 후 메인 스레드에서 callback 실행, 취소용 핸들 반환"""
+        raise NotImplementedError
+    
+    def cancel_schedule(self, handle):
+        """schedule로 예약한 작업 취소"""
+        raise NotImplementedError
+    
+    def show_error(self, title, message):
+        """오류 알림"""
+        self.log_message(f"{title}: {message}")
+    
+    def notify(self, message):
+        """사용자 알림 (트레이 등)"""
+    
+    def update_ui_status(self):
+        """서버 상태가 바뀌었을 때 호출"""
+    
+    def get_resource_path(self, relative_path):
+        """리소스 파일 경로 얻기 (PyInstaller 호환)"""
+        try:
+            # PyInstaller로 빌드된 경우
+            base_path = sys._MEIPASS
+        except Exception:
+            # 개발 환경
+            base_path = os.path.abspath(".")
+        
+        return os.path.join(base_path, relative_path)
+
+    def get_server_path(self, relative_path):
+        """Node.js 런타임/서버 빌드 경로 (persistent 빌드는 사용자 폴더에 한 번 풀린 위치)"""
+        from manager.runtime import server_root
+        return os.path.join(server_root(log=self.log_message), relative_path)
+
+    def get_node_paths(self):
+        """Node.js와 npm 경로 얻기"""
+        if getattr(sys, 'frozen', False):
+            # PyInstaller로 빌드된 경우 - 내장된 Node.js 사용 (npm은 포함하지 않은 빌드도 있음)
+            try:
+                if sys.platform == "win32":
+                    node_path = self.get_server_path('node.exe')
+                    npm_path = self.get_server_path('npm.cmd')
+                else:
+                    node_path = self.get_server_path('node')
+                    npm_path = self.get_server_path('npm')
+            except OSError as e:
+                self.log_message(f"서버 파일 준비 오류: {e}")
+                return None, None
+        else:
+            # 개발 환경 - 시스템 Node.js 사용
+            node_path = shutil.which('node')
+            npm_path = shutil.which('npm') or shutil.which('npm.cmd')
+        
+        return node_path, npm_path
+
+    def check_node_dependencies(self):
+        """Node.js 의존성 확인"""
+        node_path, npm_path = self.get_node_paths()
+        
+        if not node_path or not os.path.exists(node_path):
+            if getattr(sys, 'frozen', False):
+                self.show_error(
+                    "빌드 오류", 
+                    "Node.js 런타임이 exe에 포함되지 않았습니다.\n"
+                    "개발자에게 문의하세요."
+                )
+            else:
+                self.show_error(
+                    "Node.js 필요", 
+                    "이 프로그램을 실행하려면 Node.js가 설치되어 있어야 합니다.\n"
+                    "https://nodejs.org에서 다운로드하세요."
+                )
+            return False
+        
+        return True
+
+    def get_launch_command(self, work_dir):
+        """서버 실행 명령 결정 (node 직접 실행 우선, 필요할 때만 npm), 실패하면 None"""
+        from manager.launcher import resolve_launch_command
+        
+        node_path, npm_path = self.get_node_paths()
+        if npm_path and not os.path.exists(npm_path):
+            npm_path = None
+        
+        try:
+            return resolve_launch_command(work_dir, node_path, npm_path,
+                                          self.config.get('launch_mode', 'auto'))
+        except ValueError as e:
+            if npm_path is None and getattr(sys, 'frozen', False):
+                self.show_error(
+                    "빌드 오류", 
+                    "서버 빌드와 npm이 exe에 포함되지 않았습니다.\n"
+                    "개발자에게 문의하세요."
+                )
+            elif npm_path is None:
+                self.show_error(
+                    "npm 필요", 
+                    "서버 빌드(.next)를 찾을 수 없고 npm도 설치되어 있지 않습니다."
+                )
+            else:
+                self.show_error("실행 오류", str(e))
+            self.log_message(f"서버 실행 명령 오류: {e}")
+            return None
+
+    def load_config(self):
+        """설정 파일 로드"""
+        # 업로드/데이터 기본 위치 (exe에서는 패키징 방식에 따라 다름, manager/runtime.py)
+        data_root = os.getcwd()
+        if getattr(sys, 'frozen', False):
+            from manager.runtime import default_data_root
+            try:
+                data_root = default_data_root()
+            except OSError as e:
+                print(f"서버 파일 준비 오류: {e}")
+        default_config = {
+            'server_port': 3000,
+            'uploads_path': os.path.join(data_root, 'public', 'uploads'),
+            'data_path': os.path.join(data_root, 'data'),
+            'auto_start': False,
+            'minimize_to_tray': True,
+            'auto_open_browser': True,
+            'startup_timeout': 60,
+            'log_buffer_size': 5000,
+            'log_max_lines': 2000,
+            'log_file_max_mb': 5,
+            'log_file_max_count': 50,
+            'server_output_encoding': 'auto',
+            # 'auto': node로 직접 실행하고 빌드가 없을 때만 npm, 'node', 'npm'
+            'launch_mode': 'auto',
+            'cluster_mode': False,
+            'cluster_workers': 0,
+            'cluster_base_port': 0,
+            'auto_restart': True,
+            'restart_max_delay': 60,
+            'crash_loop_limit': 5,
+            'crash_loop_window': 300,
+            'telemetry_interval': 5,
+            'telemetry_history': 720,
+            # 리소스 지표 HTTP 엔드포인트 포트 (0이면 사용 안 함, 예: 9464)
+            'metrics_port': 0,
+            'port_fallback': True,
+            'port_fallback_range': 20,
+            'rollup_interval': 30,
+            'workbook_cache_mb': 64,
+            'cache_prewarm': 20,
+            'cache_trim_interval': 60,
+            'watch_uploads': True,
+            'upload_gc_interval': 3600,
+            'watch_debounce': 1.0,
+            'watch_poll_interval': 5
+        }
+        
+        try:
+            config_path = self.get_resource_path(self.config_file)
+            if os.path.exists(config_path):
+                with open(config_path, 'r', encoding='utf-8') as f:
+                    self.config = {**default_config, **json.load(f)}
+            else:
+                self.config = default_config
+                self.save_config()
+        except Exception as e:
+            print(f"설정 로드 오류: {e}")
+            self.config = default_config
+
+    def save_config(self):
+        """설정 파일 저장"""
+        try:
+            config_path = self.get_resource_path(self.config_file)
+            with open(config_path, 'w', encoding='utf-8') as f:
+                json.dump(self.config, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            print(f"설정 저장 오류: {e}")
+
+    def log_message(self, message):
+        """로그 메시지 추가 (어느 스레드에서나 호출 가능)"""
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        log_entry = f"[{timestamp}] {message}"
+        
+        # 화면 표시는 GUI 스레드가 버퍼에서 가져가서 처리 (manager.gui)
+        self.log_sink.put(log_entry)
+        if self.log_writer:
+            self.log_writer.write(log_entry)
+        print(log_entry)  # 콘솔에도 출력
+
+    def start_server(self):
+        """서버 시작"""
+        if self.server_running:
+            self.log_message("서버가 이미 실행 중입니다.")
+            return
+        
+        # 예약된 자동 재시작 취소 (직접 시작한 경우 연속 실패 기록도 초기화)
+        self.cancel_pending_restart()
+        if not self.auto_restarting:
+            self.watchdog.reset()
+        
+        # Node.js 의존성 확인
+        with self.profiler.phase('check_node_dependencies'):
+            node_ok = self.check_node_dependencies()
+        if not node_ok:
+            self.auto_restarting = False
+            return
+        
+        # 포트 사전 확인 (사용 중이면 대체 포트)
+        with self.profiler.phase('preflight_port'):
+            port = self.preflight_port()
+        if port is None:
+            self.auto_restarting = False
+            return
+        self.server_port = port
+        
+        try:
+            # 필요한 폴더 생성
+            os.makedirs(self.config['uploads_path'], exist_ok=True)
+            os.makedirs(self.config['data_path'], exist_ok=True)
+            
+            # 환경 변수 설정
+            env = os.environ.copy()
+            env['PORT'] = str(self.server_port)
+            env['NODE_ENV'] = 'production'
+            # 웹 서버가 관리자와 같은 데이터/업로드 폴더를 쓰도록 전달 (lib/paths.js)
+            # standalone 서버는 자기 폴더로 이동해서 실행되므로 작업 디렉토리로는 알 수 없음
+            env['DATA_PATH'] = os.path.abspath(self.config['data_path'])
+            env['UPLOADS_PATH'] = os.path.abspath(self.config['uploads_path'])
+            
+            # 작업 디렉토리 설정
+            if getattr(sys, 'frozen', False):
+                # PyInstaller로 빌드된 경우
+                work_dir = self.get_server_path('.')
+            else:
+                # 개발 환경
+                work_dir = os.getcwd()
+            
+            # 프로덕션 모드로 서버 시작 (가능하면 npm 없이 node로 직접)
+            with self.profiler.phase('resolve_launch'):
+                launch = self.get_launch_command(work_dir)
+            if launch is None:
+                self.auto_restarting = False
+                return
+            self.launch_kind = launch.kind
+            cmd = launch.cmd
+            
+            # Next.js 서버 시작
+            self.log_message(f"서버를 시작하는 중... ({launch.describe()})")
+            
+            self.server_run_id += 1
+            spawn_start = time.perf_counter()
+            if self.config.get('cluster_mode', False):
+                self.start_cluster(cmd, env, work_dir)
+            else:
+                self.server_process = subprocess.Popen(
+                    cmd,
+                    env=env,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    cwd=work_dir
+                )
+                
+                self.watchdog.record_start()
+                
+                # 서버 출력을 별도 스레드에서 모니터링
+                threading.Thread(target=self.monitor_server_output,
+                                 args=(self.server_process,), daemon=True).start()
+            self.profiler.record('process_spawn', spawn_start, time.perf_counter())
+            
+            # 백그라운드 작업은 서버 프로세스를 띄운 뒤 처음 한 번 시작 (Next.js 준비와 겹쳐서 진행)
+            self.start_services()
+            
+            # 서버 상태 업데이트
+            self.server_running = True
+            self.server_state = STATE_STARTING
+            self.startup_time = None
+            self.last_exit_code = None
+            self.update_ui_status()
+            
+            # 서버가 실제로 응답할 때까지 별도 스레드에서 대기
+            threading.Thread(target=self.wait_for_server_ready,
+                             args=(self.server_run_id,), daemon=True).start()
+                
+        except Exception as e:
+            self.shutdown_cluster()
+            self.auto_restarting = False
+            self.log_message(f"서버 시작 오류: {e}")
+            self.show_error("오류", f"서버 시작에 실패했습니다: {e}")
+
+    def start_cluster(self, cmd, env, work_dir):
+        """클러스터 모드: 내부 포트에 워커들을 띄우고 서버 포트에 프록시 시작"""
+        from manager.cluster import ClusterProxy, Worker
+        
+        # 워커 포트는 preflight_port에서 비어 있는지 확인함
+        ports = self.get_cluster_ports(self.server_port)
+        self.log_message(f"클러스터 모드: 워커 {len(ports)}개 (내부 포트 {ports[0]}~{ports[-1]})")
+        
+        workers = [Worker(index, port) for index, port in enumerate(ports)]
+        proxy = ClusterProxy(self.server_port, workers, log=self.log_message)
+        # 프록시 포트를 먼저 확보 (실패하면 워커를 띄우지 않음)
+        proxy.start()
+        
+        self.cluster_workers = workers
+        self.cluster_proxy = proxy
+        self.cluster_launch = (cmd, env, work_dir)
+        
+        for worker in workers:
+            self.spawn_worker(worker)
+
+    def spawn_worker(self, worker):
+        """클러스터 워커 프로세스 실행"""
+        from manager.cluster import worker_env
+        
+        cmd, env, work_dir = self.cluster_launch
+        worker.process = subprocess.Popen(
+            cmd,
+            env=worker_env(env, worker.port),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            cwd=work_dir
+        )
+        worker.started_at = time.time()
+        threading.Thread(target=self.monitor_server_output,
+                         args=(worker.process, worker), daemon=True).start()
+
+    def shutdown_cluster(self):
+        """클러스터 프록시와 워커 종료"""
+        if self.cluster_proxy:
+            self.cluster_proxy.stop()
+            self.cluster_proxy = None
+        
+        workers, self.cluster_workers = self.cluster_workers, []
+        for worker in workers:
+            if worker.alive:
+                worker.process.terminate()
+        for worker in workers:
+            if worker.process:
+                try:
+                    worker.process.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    worker.process.kill()
+                    self.log_message(f"워커 {worker.index + 1}을(를) 강제로 종료했습니다.")
+
+    def is_server_alive(self):
+        """서버 프로세스(클러스터 모드에서는 워커 중 하나)가 살아 있는지 확인"""
+        if self.cluster_workers:
+            return any(worker.alive for worker in self.cluster_workers)
+        return self.server_process is not None and self.server_process.poll() is None
+
+    def get_server_pids(self):
+        """리소스 측정 대상 프로세스 (npm/워커) PID 목록"""
+        pids = [worker.process.pid for worker in self.cluster_workers if worker.alive]
+        process = self.server_process
+        if process is not None and process.poll() is None:
+            pids.append(process.pid)
+        return pids
+
+    def get_manager_metrics(self):
+        """지표 엔드포인트에 함께 내보낼 관리자 상태값"""
+        log_stats = self.log_sink.stats()
+        metrics = [
+            ('inspection_server_up', 'gauge', "1 if the server answered the readiness probe",
+             1 if self.server_running and self.server_state == STATE_READY else 0),
+            ('inspection_server_startup_seconds', 'gauge', "Time-to-ready of the last start",
+             self.startup_time or 0),
+            ('inspection_server_failures_total', 'counter', "Unexpected server exits",
+             self.watchdog.failures),
+            ('inspection_server_restarts_total', 'counter', "Automatic restarts",
+             self.watchdog.restarts),
+            ('inspection_manager_log_dropped_total', 'counter', "Log lines dropped by the GUI buffer",
+             log_stats['dropped']),
+        ]
+        if self.workbook_cache:
+            cache_stats = self.workbook_cache.stats()
+            metrics += [
+                ('inspection_workbook_cache_entries', 'gauge', "Workbook cache entries on disk",
+                 cache_stats['entries']),
+                ('inspection_workbook_cache_evictions_total', 'counter', "Workbook cache entries evicted",
+                 cache_stats['evictions']),
+                ('inspection_workbook_cache_bytes', 'gauge', "Workbook cache size on disk",
+                 cache_stats['bytes']),
+            ]
+        return metrics
+
+    def wait_for_server_ready(self, run_id):
+        """서버 준비 상태 확인 (백그라운드 스레드)"""
+        # requests는 시작 시간을 줄이기 위해 이 스레드에서 처음 로드
+        from manager.readiness import ReadinessProbe
+        
+        url = f"http://127.0.0.1:{self.server_port}/"
+        probe = ReadinessProbe(url, timeout=float(self.config.get('startup_timeout', 60)))
+        wait_start = time.perf_counter()
+        try:
+            state, elapsed = probe.wait(
+                is_alive=lambda: self.server_run_id == run_id and self.is_server_alive()
+            )
+        finally:
+            probe.close()
+        
+        # 기다리는 동안 서버가 중지/재시작된 경우 무시
+        if self.server_run_id != run_id:
+            return
+        
+        self.profiler.record('nextjs_ready', wait_start, time.perf_counter())
+        self.schedule(0, self.on_server_ready, state, elapsed)
+
+    def on_server_ready(self, state, elapsed):
+        """서버 준비 결과 처리 (GUI 스레드)"""
+        if not self.server_running:
+            return
+        
+        self.server_state = state
+        auto_restarted, self.auto_restarting = self.auto_restarting, False
+        if state == STATE_READY:
+            self.startup_time = elapsed
+            self.log_message(f"서버가 준비되었습니다. (준비 시간: {elapsed:.2f}초)")
+            self.report_cold_start()
+            self.update_ui_status()
+            
+            # 서버가 처음 준비되면 엑셀 캐시 미리 읽기 (웹 서버에 요청)
+            if self.workbook_cache and not self.cache_prewarmed:
+                self.cache_prewarmed = True
+                threading.Thread(target=self.prewarm_workbook_cache, args=(self.server_port,),
+                                 name='cache-prewarm', daemon=True).start()
+            
+            # 브라우저 자동 열기 (자동 재시작된 경우 제외)
+            if self.opens_browser and self.config['auto_open_browser'] and not auto_restarted:
+                self.open_browser()
+        else:
+            self.log_message(f"서버가 {elapsed:.1f}초 안에 응답하지 않았습니다. 로그를 확인하세요.")
+            self.update_ui_status()
+
+    def report_cold_start(self):
+        """프로그램 실행부터 첫 서버 준비까지 걸린 시간 기록 (한 번만)"""
+        if self.cold_start_reported:
+            return
+        self.cold_start_reported = True
+        self.cold_start_time = time.perf_counter() - self.launch_time
+        mode = "헤드리스" if not self.opens_browser else "GUI"
+        self.log_message(f"콜드 스타트 ({mode}): 프로그램 실행부터 서버 준비까지 {self.cold_start_time:.2f}초")
+        
+        # 시작 단계별 소요 시간 보고서 저장 (릴리스끼리 비교용)
+        self.profiler.mark('server_ready')
+        try:
+            self.profiler.finish(self.config['data_path'], self.get_release_info())
+            self.log_message(f"시작 시간 보고서 저장: "
+                             f"{os.path.join(self.config['data_path'], 'startup', 'latest.json')}")
+        except OSError as e:
+            self.log_message(f"시작 시간 보고서 저장 오류: {e}")
+    
+    def get_release_info(self):
+        """시작 시간 보고서에 넣을 버전 정보 (package.json 버전, Next.js BUILD_ID)"""
+        work_dir = self.get_server_path('.') if getattr(sys, 'frozen', False) else os.getcwd()
+        info = {'app_version': None, 'build_id': None, 'launch_kind': self.launch_kind}
+        for base in (work_dir, os.path.join(work_dir, '.next', 'standalone')):
+            try:
+                if info['app_version'] is None:
+                    with open(os.path.join(base, 'package.json'), 'r', encoding='utf-8') as f:
+                        info['app_version'] = json.load(f).get('version')
+            except (OSError, ValueError):
+                pass
+            try:
+                if info['build_id'] is None:
+                    with open(os.path.join(base, '.next', 'BUILD_ID'), 'r', encoding='utf-8') as f:
+                        info['build_id'] = f.read().strip()
+            except OSError:
+                pass
+        return info
+    
+    def stop_server(self):
+        """서버 중지"""
+        if not self.server_running:
+            if self.cancel_pending_restart():
+                self.server_run_id += 1
+                self.shutdown_cluster()
+                self.update_ui_status()
+            else:
+                self.log_message("서버가 실행되고 있지 않습니다.")
+            return
+        
+        try:
+            self.server_run_id += 1
+            self.cancel_pending_restart()
+            self.watchdog.record_stop()
+            
+            # 이 프로그램이 시작한 프로세스 (npm 실행 시 next-server는 손자 프로세스)
+            own_pids = self.get_server_tree_pids()
+            
+            if self.cluster_proxy or self.cluster_workers:
+                self.log_message("클러스터를 중지하는 중...")
+                self.shutdown_cluster()
+            
+            if self.server_process:
+                self.log_message("서버를 중지하는 중...")
+                
+                # 모니터링 스레드가 이 종료를 비정상 종료로 처리하지 않도록 먼저 분리
+                # (node를 직접 실행하면 terminate 직후 바로 종료됨)
+                process, self.server_process = self.server_process, None
+                
+                # 프로세스 종료
+                process.terminate()
+                
+                # 강제 종료가 필요한 경우
+                try:
+                    process.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    self.log_message("서버를 강제로 종료했습니다.")
+            
+            # 포트에 남은 자식 프로세스 종료
+            self.kill_process_on_port(self.server_port, own_pids)
+            
+            self.server_running = False
+            self.server_state = STATE_STOPPED
+            self.update_ui_status()
+            self.log_message("서버가 중지되었습니다.")
+            
+        except Exception as e:
+            self.log_message(f"서버 중지 오류: {e}")
+            self.show_error("오류", f"서버 중지에 실패했습니다: {e}")
+
+    def restart_server(self):
+        """서버 재시작"""
+        self.log_message("서버를 재시작합니다...")
+        self.stop_server()
+        time.sleep(2)
+        self.start_server()
+
+    def get_cluster_ports(self, server_port):
+        """클러스터 워커 포트 목록 (클러스터 모드가 아니면 빈 목록)"""
+        if not self.config.get('cluster_mode', False):
+            return []
+        import psutil
+        from manager.cluster import default_worker_count
+        
+        count = int(self.config.get('cluster_workers', 0))
+        if count <= 0:
+            count = default_worker_count(psutil.cpu_count(logical=False) or psutil.cpu_count())
+        base_port = int(self.config.get('cluster_base_port', 0)) or server_port + 1
+        return list(range(base_port, base_port + count))
+    
+    def preflight_port(self):
+        """
+        서버 시작 전 포트 확인 (클러스터 모드는 워커 포트까지), 반환값: 사용할 포트 (사용할 수 없으면 None)
+        """
+        port = int(self.config['server_port'])
+        worker_ports = self.get_cluster_ports(port)
+        busy = [candidate for candidate in [port] + worker_ports if not is_port_free(candidate)]
+        if not busy:
+            return port
+        
+        start = time.perf_counter()
+        owners = []
+        for busy_port in busy:
+            owner = find_port_owner(busy_port)
+            owners.append(f"포트 {busy_port}: {owner.describe() if owner else '알 수 없는 프로세스'}")
+        owner_text = ", ".join(owners)
+        self.log_message(f"사용 중인 포트가 있습니다 ({owner_text}). "
+                         f"(확인 {(time.perf_counter() - start) * 1000:.0f}ms)")
+        
+        if self.config.get('port_fallback', True):
+            # 대체 포트가 (고정된) 워커 포트와 겹치지 않고, 그 포트의 워커 포트도 모두 비어 있어야 함
+            fallback = find_free_port(port + 1, attempts=int(self.config.get('port_fallback_range', 20)),
+                                      exclude=set(worker_ports), companions=self.get_cluster_ports)
+            if fallback is not None:
+                self.log_message(f"대체 포트 {fallback}에서 서버를 시작합니다. (설정 포트: {port})")
+                return fallback
+        
+        self.show_error("포트 사용 중",
+                        f"사용 중인 포트가 있습니다.\n{owner_text}\n"
+                        "설정에서 다른 포트를 지정하거나 해당 프로그램을 종료하세요.")
+        return None
+    
+    def get_server_tree_pids(self):
+        """서버 프로세스와 모든 자식 프로세스 PID"""
+        import psutil
+        
+        pids = set()
+        for pid in self.get_server_pids():
+            pids.add(pid)
+            try:
+                pids.update(child.pid for child in psutil.Process(pid).children(recursive=True))
+            except psutil.Error:
+                continue
+        return pids
+    
+    def kill_process_on_port(self, port, own_pids):
+        """포트에 남아 있는 프로세스가 이 프로그램이 시작한 것이면 종료"""
+        import psutil
+        
+        if is_port_free(port):
+            return
+        try:
+            owner = find_port_owner(port)
+            if owner is None or owner.pid is None:
+                return
+            if owner.pid not in own_pids:
+                self.log_message(f"포트 {port}을(를) {owner.describe()}이(가) 사용 중이지만 "
+                                 "이 프로그램이 시작한 프로세스가 아니므로 종료하지 않습니다.")
+                return
+            psutil.Process(owner.pid).terminate()
+            self.log_message(f"포트 {port}에 남아 있던 프로세스({owner.describe()})를 종료했습니다.")
+        except psutil.Error as e:
+            self.log_message(f"포트 프로세스 종료 오류: {e}")
+
+    def monitor_server_output(self, process, worker=None):
+        """서버 출력 모니터링 (클러스터 모드에서는 워커별로 실행)"""
+        prefix = f"[워커 {worker.index + 1}] " if worker else ""
+        try:
+            # 바이너리로 크게 읽고 인코딩(UTF-8/cp949)은 처음 한 번만 판별
+            encoding = self.config.get('server_output_encoding', 'auto')
+            for line in iter_lines(process.stdout, None if encoding == 'auto' else encoding):
+                line = line.strip()
+                if line:
+                    self.log_message(prefix + line)
+            
+            return_code = process.wait()
+            if worker is not None:
+                if worker in self.cluster_workers and worker.process is process:
+                    self.log_message(f"{prefix}워커가 종료되었습니다. (종료 코드: {return_code})")
+                    # 종료 코드 0은 정상 종료이므로 재시작하지 않음
+                    if return_code != 0 and self.config.get('auto_restart', True):
+                        self.schedule(0, self.handle_worker_exit, worker, return_code, self.server_run_id)
+                    elif not self.is_server_alive():
+                        self.log_message("모든 클러스터 워커가 종료되었습니다.")
+                        self.last_exit_code = return_code
+                        self.server_running = False
+                        self.server_state = STATE_FAILED if return_code != 0 else STATE_STOPPED
+                        self.update_ui_status()
+            elif self.server_process is process:
+                if return_code != 0:
+                    self.log_message(f"서버가 비정상 종료되었습니다. (종료 코드: {return_code})")
+                else:
+                    self.log_message("서버가 종료되었습니다. (종료 코드: 0)")
+                    self.watchdog.record_stop()
+                # 종료 코드 0은 정상 종료이므로 재시작하지 않음
+                # (직접 중지한 경우는 stop_server에서 server_process를 먼저 분리하므로 여기에 오지 않음)
+                auto_restart = return_code != 0 and self.config.get('auto_restart', True)
+                # server_running을 바꾸기 전에 표시해야 종료 처리 전의 틈이 생기지 않음
+                self.exit_pending = auto_restart
+                self.last_exit_code = return_code
+                self.server_running = False
+                self.server_state = STATE_FAILED if return_code != 0 else STATE_STOPPED
+                self.update_ui_status()
+                
+                # 사용자가 중지하지 않았는데 비정상 종료된 경우 자동 재시작
+                if auto_restart:
+                    self.schedule(0, self.handle_server_exit, return_code, self.server_run_id)
+        except Exception as e:
+            self.log_message(f"서버 모니터링 오류: {e}")
+            if self.server_process is process:
+                self.server_running = False
+                self.server_state = STATE_FAILED
+                self.update_ui_status()
+
+    def handle_server_exit(self, return_code, run_id):
+        """서버가 예기치 않게 종료된 경우 재시작 예약 (GUI 스레드)"""
+        self.exit_pending = False
+        if run_id != self.server_run_id or self.server_running:
+            return
+        
+        self.auto_restarting = False
+        delay = self.watchdog.record_exit(return_code)
+        if delay is None:
+            self.report_crash_loop()
+        else:
+            self.log_message(f"{delay:.1f}초 후 서버를 자동으로 다시 시작합니다.")
+            self.restart_after_id = self.schedule(int(delay * 1000), self.auto_restart, run_id)
+        self.update_ui_status()
+
+    def handle_worker_exit(self, worker, return_code, run_id):
+        """클러스터 워커가 예기치 않게 종료된 경우 해당 워커만 재시작 예약 (GUI 스레드)"""
+        if run_id != self.server_run_id or worker not in self.cluster_workers:
+            return
+        
+        delay = self.watchdog.record_exit(return_code, started_at=worker.started_at,
+                                          source=f"worker-{worker.index + 1}")
+        if delay is None:
+            self.report_crash_loop()
+            if not self.is_server_alive():
+                self.server_run_id += 1
+                self.shutdown_cluster()
+                self.server_running = False
+                self.server_state = STATE_FAILED
+        else:
+            self.log_message(f"[워커 {worker.index + 1}] {delay:.1f}초 후 다시 시작합니다.")
+            self.schedule(int(delay * 1000), self.respawn_worker, worker, run_id)
+        self.update_ui_status()
+
+    def respawn_worker(self, worker, run_id):
+        """클러스터 워커 재시작"""
+        if run_id != self.server_run_id or worker not in self.cluster_workers or worker.alive:
+            return
+        try:
+            self.spawn_worker(worker)
+            self.log_message(f"[워커 {worker.index + 1}] 워커를 다시 시작했습니다.")
+        except Exception as e:
+            self.log_message(f"[워커 {worker.index + 1}] 워커 재시작 오류: {e}")
+
+    def auto_restart(self, run_id):
+        """예약된 자동 재시작 실행"""
+        self.restart_after_id = None
+        if run_id != self.server_run_id or self.server_running:
+            return
+        self.log_message("서버를 자동으로 다시 시작합니다...")
+        self.auto_restarting = True
+        self.start_server()
+
+    def cancel_pending_restart(self):
+        """예약된 자동 재시작 취소 (취소했으면 True)"""
+        if self.restart_after_id is None:
+            return False
+        self.cancel_schedule(self.restart_after_id)
+        self.restart_after_id = None
+        self.log_message("예약된 자동 재시작을 취소했습니다.")
+        return True
+
+    def report_crash_loop(self):
+        """반복 종료 감지 알림"""
+        message = (f"서버가 {format_duration(self.watchdog.loop_window)} 안에 "
+                   f"{self.watchdog.loop_limit}번 종료되어 자동 재시작을 중단했습니다. 로그를 확인하세요.")
+        self.log_message(message)
+        self.notify(message)
+
+    def get_status_text(self):
+        """현재 서버 상태 문구"""
+        if self.server_running:
+            if self.server_state == STATE_READY:
+                if self.startup_time is not None:
+                    return f"서버 실행 중 (준비 {self.startup_time:.1f}초)"
+                return "서버 실행 중"
+            if self.server_state == STATE_FAILED:
+                return "서버 응답 없음"
+            return "서버 시작 중..."
+        if self.restart_after_id is not None:
+            return "서버 중지됨 (자동 재시작 대기 중)"
+        if self.watchdog.gave_up:
+            return "서버 중지됨 (반복 종료로 자동 재시작 중단)"
+        if self.server_state == STATE_FAILED:
+            return "서버 중지됨 (비정상 종료)"
+        return "서버 중지됨"
+
+    def open_browser(self):
+        """브라우저에서 웹 애플리케이션 열기"""
+        import webbrowser
+        
+        url = f"http://localhost:{self.server_port}"
+        webbrowser.open(url)
+        self.log_message(f"브라우저에서 {url}을 열었습니다.")
@@ -0,0 +1,232 @@
+"""
+시작 단계별 소요 시간 측정
+프로그램 실행(더블 클릭)부터 웹 페이지를 쓸 수 있을 때까지의 단계
+(모듈 가져오기, 설정 로드, GUI 구성, Node.js 확인, 서버 프로세스 실행, Next.js 준비)를
+프로그램 실행 시각 기준으로 기록하고, 첫 서버 준비 시점에 data_path/startup/에 저장합니다.
+history.jsonl에 실행마다 한 줄씩 쌓이므로 버전(릴리스)끼리 비교할 수 있습니다.
+
+모듈 가져오기 분석 (python -X importtime과 비슷한 모듈별 시간, exe에서도 사용 가능):
+    InspectionSystemManager.exe --profile-imports   또는   INSPECTION_PROFILE_IMPORTS=1
+"""
+
+import builtins
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+REPORT_VERSION = 1
+REPORT_DIR = 'startup'
+HISTORY_FILE = 'history.jsonl'
+LATEST_FILE = 'latest.json'
+# 보고서에 넣을 모듈 가져오기 항목 수 (누적 시간 순)
+IMPORT_TOP = 25
+
+
+class ImportTimer:
+    """모듈별 가져오기 시간 (자기 시간, 누적 시간) 측정 (builtins.__import__ 감싸기)"""
+
+    def __init__(self):
+        self.records = {}       # 모듈 이름 -> (자기 시간, 누적 시간)
+        self.local = threading.local()
+        self.original = None
+
+    def install(self):
+        if self.original is None:
+            self.original = builtins.__import__
+            builtins.__import__ = self._import
+
+    def uninstall(self):
+        # 다른 코드가 그 위에 다시 감싼 경우에는 그대로 둠 (측정은 계속 원래 함수로 전달)
+        if self.original is not None and builtins.__import__ == self._import:
+            builtins.__import__ = self.original
+            self.original = None
+
+    def _import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        # 이미 가져온 모듈과 상대 가져오기는 측정하지 않음 (상위 모듈 시간에 포함)
+        if level or name in sys.modules:
+            return self.original(name, globals, locals, fromlist, level)
+
+        stack = getattr(self.local, 'stack', None)
+        if stack is None:
+            stack = self.local.stack = []
+        start = time.perf_counter()
+        stack.append(0.0)
+        try:
+            return self.original(name, globals, locals, fromlist, level)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            self.records.setdefault(name, (elapsed - children, elapsed))
+
+    def top(self, count=IMPORT_TOP):
+        """누적 시간이 긴 모듈 [{'module', 'self_ms', 'cumulative_ms'}]"""
+        items = sorted(self.records.items(), key=lambda item: item[1][1], reverse=True)[:count]
+        return [{'module': name, 'self_ms': round(own * 1000, 1), 'cumulative_ms': round(total * 1000, 1)}
+                for name, (own, total) in items]
+
+
+def imports_requested(argv=None):
+    """모듈 가져오기 분석을 켰는지 (--profile-imports 또는 환경 변수)"""
+    argv = sys.argv if argv is None else argv
+    return '--profile-imports' in argv or os.environ.get('INSPECTION_PROFILE_IMPORTS') == '1'
+
+
+class StartupProfiler:
+    """시작 단계별 시각 기록 (프로그램 실행 시각 기준, 초)"""
+
+    def __init__(self, launch_time=None, import_timer=None):
+        self.launch_time = launch_time if launch_time is not None else time.perf_counter()
+        # 실행 시각의 벽시계 값 (프로세스 생성 시각과 비교용)
+        self.launch_wall = time.time() - (time.perf_counter() - self.launch_time)
+        self.import_timer = import_timer
+        self.phases = []        # (단계, 시작, 끝)
+        self.marks = {}         # 시점 이름 -> 시각
+        self.finished = False
+        self.report = None
+        self.lock = threading.Lock()
+
+    def now(self):
+        return time.perf_counter() - self.launch_time
+
+    def record(self, name, start, end):
+        """단계 기록 (start/end: perf_counter 값), 보고서를 저장한 뒤(재시작 등)에는 무시"""
+        with self.lock:
+            if not self.finished:
+                self.phases.append((name, start - self.launch_time, end - self.launch_time))
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter())
+
+    def mark(self, name):
+        """시점 기록 (처음 한 번만)"""
+        with self.lock:
+            if not self.finished:
+                self.marks.setdefault(name, self.now())
+
+    def process_bootstrap(self):
+        """프로세스 생성부터 main.py 실행까지 (exe 압축 해제 + Python 시작), 알 수 없으면 None"""
+        try:
+            import psutil
+            created = psutil.Process().create_time()
+        except Exception:
+            return None
+        return max(self.launch_wall - created, 0.0)
+
+    def to_dict(self, release=None):
+        with self.lock:
+            phases = sorted(self.phases, key=lambda phase: phase[1])
+            marks = dict(self.marks)
+        report = {
+            'version': REPORT_VERSION,
+            'date': time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.launch_wall)),
+            'launched_at': round(self.launch_wall, 3),
+            'release': release or {},
+            'platform': sys.platform,
+            'frozen': bool(getattr(sys, 'frozen', False)),
+            'bootstrap_seconds': self.process_bootstrap(),
+            'phases': [{'name': name, 'start': round(start, 4), 'seconds': round(end - start, 4)}
+                       for name, start, end in phases],
+            'marks': {name: round(value, 4) for name, value in marks.items()},
+            'total_seconds': round(self.now(), 4),
+        }
+        if self.import_timer:
+            report['imports'] = self.import_timer.top()
+        return report
+
+    def finish(self, data_path, release=None):
+        """첫 서버 준비 시점에 한 번 저장 (latest.json + history.jsonl), 반환값: 보고서"""
+        if self.finished:
+            return self.report
+        self.finished = True
+        if self.import_timer:
+            self.import_timer.uninstall()
+        self.report = self.to_dict(release)
+
+        report_dir = os.path.join(data_path, REPORT_DIR)
+        os.makedirs(report_dir, exist_ok=True)
+        temp_file = os.path.join(report_dir, LATEST_FILE + '.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(self.report, f, ensure_ascii=False, indent=2)
+        os.replace(temp_file, os.path.join(report_dir, LATEST_FILE))
+        with open(os.path.join(report_dir, HISTORY_FILE), 'a', encoding='utf-8') as f:
+            f.write(json.dumps(self.report, ensure_ascii=False) + '\n')
+        return self.report
+
+
+def load_history(data_path, limit=50):
+    """이전 시작 보고서 목록 (오래된 것부터, 최근 limit개)"""
+    path = os.path.join(data_path, REPORT_DIR, HISTORY_FILE)
+    reports = []
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    reports.append(json.loads(line))
+                except ValueError:
+                    continue
+    except OSError:
+        return []
+    return reports[-limit:]
+
+
+def release_key(report):
+    release = report.get('release') or {}
+    return (release.get('app_version'), release.get('build_id'))
+
+
+def previous_release_report(history, report):
+    """다른 릴리스의 가장 최근 보고서 (없으면 같은 릴리스의 이전 보고서)"""
+    earlier = [entry for entry in history if entry.get('launched_at') != report.get('launched_at')]
+    for entry in reversed(earlier):
+        if release_key(entry) != release_key(report):
+            return entry
+    return earlier[-1] if earlier else None
+
+
+def format_report(report, previous=None):
+    """시작 시간 보고서 표 (GUI/콘솔용 줄 목록)"""
+    release = report.get('release') or {}
+    lines = [f"{report['date']}  버전 {release.get('app_version') or '-'}  빌드 {release.get('build_id') or '-'}"
+             f"  ({'exe' if report.get('frozen') else '개발 환경'})"]
+    if report.get('bootstrap_seconds') is not None:
+        lines.append(f"프로세스 생성 -> main.py: {report['bootstrap_seconds'] * 1000:8.0f}ms (exe 압축 해제 + Python 시작)")
+
+    previous_phases = {}
+    if previous:
+        for phase in previous.get('phases', []):
+            previous_phases.setdefault(phase['name'], phase['seconds'])
+        previous_release = previous.get('release') or {}
+        lines.append(f"비교: {previous['date']}  버전 {previous_release.get('app_version') or '-'}  "
+                     f"빌드 {previous_release.get('build_id') or '-'}")
+
+    lines.append("")
+    lines.append(f"{'단계':<24}{'시작':>10}{'소요':>10}" + (f"{'이전':>10}{'차이':>10}" if previous else ""))
+    for phase in report.get('phases', []):
+        line = f"{phase['name']:<24}{phase['start'] * 1000:>8.0f}ms{phase['seconds'] * 1000:>8.0f}ms"
+        if previous and phase['name'] in previous_phases:
+            before = previous_phases[phase['name']]
+            line += f"{before * 1000:>8.0f}ms{(phase['seconds'] - before) * 1000:>+8.0f}ms"
+        lines.append(line)
+    for name, value in sorted(report.get('marks', {}).items(), key=lambda item: item[1]):
+        lines.append(f"{'* ' + name:<24}{value * 1000:>8.0f}ms")
+    total = f"전체 {report['total_seconds']:.2f}초"
+    if previous:
+        total += f" (이전 {previous['total_seconds']:.2f}초)"
+    lines.append(total)
+
+    if report.get('imports'):
+        lines.append("")
+        lines.append(f"{'모듈 가져오기 (누적 순)':<40}{'자기':>10}{'누적':>10}")
+        for entry in report['imports']:
+            lines.append(f"{entry['module']:<40}{entry['self_ms']:>8.1f}ms{entry['cumulative_ms']:>8.1f}ms")
+    return lines
@@ -0,0 +1,290 @@
+"""
+업로드 파일 저장소 (내용 기준 중복 제거)
+엑셀 파일을 SHA-256 해시로 uploads_path/store/<해시 앞 2자리>/<해시><확장자>에 한 번만 저장합니다.
+같은 내용을 여러 프로젝트가 올려도 파일은 하나이고, 참조 수는 projects.json에서
+그 파일을 가리키는 프로젝트 수로 계산합니다. (웹 서버의 lib/contentStore.js와 같은 구조)
+
+참조가 없어진 파일은 웹 서버가 바로 지우지 않고 collect_garbage가 정리합니다.
+projects.json 잠금을 잡은 채 참조를 세고, 유예 기간(GC_GRACE_SECONDS) 안에 저장되거나
+다시 사용된 파일(저장할 때 수정 시각을 갱신)은 아직 프로젝트에 등록되기 전일 수 있으므로 남겨 둡니다.
+
+기존 업로드 폴더 정리:
+    python -m manager.storage [--dry-run] [--gc] [--gc-grace 시간] [--config server_config.json]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from collections import Counter
+
+from manager.projectsfile import ProjectsFileLock, load_projects, modify_projects
+
+STORE_DIR = 'store'
+UPLOADS_URL = '/uploads/'
+HASH_CHUNK_SIZE = 1024 * 1024
+# 참조 없는 파일도 이 시간 안에 저장/재사용되었으면 정리하지 않음 (초)
+GC_GRACE_SECONDS = 24 * 3600
+
+
+def file_digest(path):
+    """파일의 SHA-256 (16진수)"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(HASH_CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def format_size(size):
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.0f}{unit}" if unit == 'B' else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GB"
+
+
+class ContentStore:
+    """내용 주소 기반 업로드 저장소"""
+
+    def __init__(self, uploads_path, data_path, log=print):
+        self.uploads_path = uploads_path
+        self.store_path = os.path.join(uploads_path, STORE_DIR)
+        self.projects_file = os.path.join(data_path, 'projects.json')
+        self.log = log
+        self._stop = threading.Event()
+        self._thread = None
+
+    # ---- 경로 ----
+
+    def blob_relpath(self, digest, ext):
+        """uploads_path 기준 상대 경로 (URL 구분자 '/')"""
+        return f"{STORE_DIR}/{digest[:2]}/{digest}{ext.lower()}"
+
+    def to_url(self, relpath):
+        return UPLOADS_URL + relpath
+
+    def to_path(self, file_url):
+        """프로젝트의 filePath(/uploads/...)를 실제 파일 경로로 변환"""
+        relative = file_url.lstrip('/')
+        if relative.startswith('uploads/'):
+            relative = relative[len('uploads/'):]
+        return os.path.join(self.uploads_path, *relative.split('/'))
+
+    def is_blob(self, file_url):
+        return file_url.startswith(UPLOADS_URL + STORE_DIR + '/')
+
+    # ---- 저장/참조 ----
+
+    def put_file(self, source, move=False, digest=None):
+        """
+        파일을 저장소에 추가 (같은 내용이 이미 있으면 저장하지 않음)
+        move=True면 원본 파일을 옮기거나(새 내용) 지움(중복)
+        반환값: (filePath URL, 새로 저장했는지 여부)
+        """
+        digest = digest or file_digest(source)
+        relpath = self.blob_relpath(digest, os.path.splitext(source)[1] or '.xlsx')
+        target = os.path.join(self.uploads_path, *relpath.split('/'))
+
+        try:
+            # 이미 있으면 수정 시각만 갱신해서 정리 유예 기간 동안 지워지지 않게 함
+            os.utime(target)
+            created = False
+        except FileNotFoundError:
+            created = True
+        if created:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            temp_file = f"{target}.{os.getpid()}.tmp"
+            if move:
+                shutil.move(source, temp_file)
+            else:
+                shutil.copyfile(source, temp_file)
+            os.replace(temp_file, target)
+        elif move:
+            os.remove(source)
+        return self.to_url(relpath), created
+
+    def load_projects(self):
+        return load_projects(self.projects_file)
+
+    def refcounts(self, projects=None):
+        """filePath별 참조하는 프로젝트 수"""
+        projects = self.load_projects() if projects is None else projects
+        return Counter(project.get('filePath') for project in projects if project.get('filePath'))
+
+    def iter_blobs(self):
+        """저장소의 (filePath URL, 실제 경로, 크기)"""
+        if not os.path.isdir(self.store_path):
+            return
+        for prefix in sorted(os.listdir(self.store_path)):
+            folder = os.path.join(self.store_path, prefix)
+            if not os.path.isdir(folder):
+                continue
+            for name in sorted(os.listdir(folder)):
+                if name.endswith('.tmp'):
+                    continue
+                path = os.path.join(folder, name)
+                yield self.to_url(f"{STORE_DIR}/{prefix}/{name}"), path, os.path.getsize(path)
+
+    def collect_garbage(self, dry_run=False, grace=GC_GRACE_SECONDS):
+        """
+        어느 프로젝트도 참조하지 않고 grace초 동안 수정 시각이 바뀌지 않은 저장소 파일 삭제
+        반환값: (파일 수, 바이트)
+        """
+        if not os.path.exists(self.projects_file):
+            # 데이터 폴더 설정이 잘못된 경우 저장소 전체를 지우지 않도록
+            self.log(f"프로젝트 목록 파일이 없어 저장소를 정리하지 않습니다: {self.projects_file}")
+            return 0, 0
+
+        count = size = 0
+        # 정리하는 동안 웹 서버가 프로젝트에 파일을 연결하지 못하도록 잠금
+        with ProjectsFileLock(self.projects_file):
+            refs = self.refcounts()
+            cutoff = time.time() - grace
+            for url, path, blob_size in list(self.iter_blobs()):
+                if refs.get(url):
+                    continue
+                try:
+                    if os.path.getmtime(path) > cutoff:
+                        continue
+                    if not dry_run:
+                        os.remove(path)
+                except FileNotFoundError:
+                    continue
+                count += 1
+                size += blob_size
+        return count, size
+
+    def start(self, interval=3600.0, grace=GC_GRACE_SECONDS):
+        """백그라운드 스레드에서 주기적으로 collect_garbage()"""
+        self._thread = threading.Thread(target=self._run, args=(interval, grace),
+                                        name='upload-gc', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self, interval, grace):
+        while not self._stop.wait(interval):
+            try:
+                count, size = self.collect_garbage(grace=grace)
+                if count:
+                    self.log(f"참조 없는 업로드 파일 정리: {count}개 삭제 ({format_size(size)})")
+            except (OSError, ValueError) as e:
+                self.log(f"업로드 파일 정리 오류: {e}")
+
+    # ---- 기존 업로드 폴더 정리 ----
+
+    def migrate(self, dry_run=False):
+        """
+        uploads_path의 파일을 저장소로 옮기고 projects.json의 filePath를 바꿈
+        저장소에 복사하고 filePath를 바꾼 뒤에 원본을 지우므로, 중간에 실패해도 프로젝트가 가리키는 파일은 남음
+        같은 내용의 파일은 하나만 남김. 어느 프로젝트도 참조하지 않는 파일은 그대로 둠
+        반환값: 결과 요약 dict
+        """
+        projects = self.load_projects()
+        refs = self.refcounts(projects)
+
+        report = {
+            'files': 0, 'unique': 0, 'duplicates': 0, 'bytes_before': 0, 'bytes_after': 0,
+            'projects_updated': 0, 'unreferenced': [], 'dry_run': dry_run,
+        }
+        existing = {url: size for url, _, size in self.iter_blobs()}
+        report['bytes_before'] = report['bytes_after'] = sum(existing.values())
+        seen = set(existing)
+        renamed = {}
+
+        for name in sorted(os.listdir(self.uploads_path)):
+            path = os.path.join(self.uploads_path, name)
+            if not os.path.isfile(path) or name.startswith('~$'):
+                continue
+            url = UPLOADS_URL + name
+            if not refs.get(url):
+                report['unreferenced'].append(name)
+                continue
+
+            size = os.path.getsize(path)
+            digest = file_digest(path)
+            blob_url = self.to_url(self.blob_relpath(digest, os.path.splitext(name)[1] or '.xlsx'))
+            report['files'] += 1
+            report['bytes_before'] += size
+            if blob_url in seen:
+                report['duplicates'] += 1
+            else:
+                seen.add(blob_url)
+                report['unique'] += 1
+                report['bytes_after'] += size
+            renamed[url] = blob_url
+            if not dry_run:
+                self.put_file(path, digest=digest)
+
+        def rename_files(projects):
+            report['projects_updated'] = 0
+            for project in projects:
+                new_url = renamed.get(project.get('filePath'))
+                if new_url:
+                    project['filePath'] = new_url
+                    report['projects_updated'] += 1
+
+        if renamed and not dry_run:
+            # 잠금을 잡고 최신 projects.json에 적용 (그동안 웹 서버가 바꾼 내용 유지)
+            modify_projects(self.projects_file, rename_files)
+            for url in renamed:
+                try:
+                    os.remove(self.to_path(url))
+                except OSError as e:
+                    self.log(f"원본 파일 삭제 오류 ({url}): {e}")
+        else:
+            rename_files(projects)
+
+        report['bytes_saved'] = report['bytes_before'] - report['bytes_after']
+        return report
+
+
+def format_report(report):
+    lines = [
+        "업로드 폴더 정리" + (" (미리 보기, 변경하지 않음)" if report['dry_run'] else ""),
+        f"  프로젝트가 참조하는 파일 {report['files']}개 -> 고유 내용 {report['unique']}개 "
+        f"(중복 {report['duplicates']}개)",
+        f"  용량 {format_size(report['bytes_before'])} -> {format_size(report['bytes_after'])} "
+        f"({format_size(report['bytes_saved'])} 절약)",
+        f"  filePath를 바꾼 프로젝트 {report['projects_updated']}개",
+    ]
+    if report['unreferenced']:
+        lines.append(f"  참조하는 프로젝트가 없어 그대로 둔 파일 {len(report['unreferenced'])}개: "
+                     + ", ".join(report['unreferenced']))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="업로드 폴더 중복 제거 (내용 기준 저장소로 이동)")
+    parser.add_argument('--config', default='server_config.json', help="서버 관리자 설정 파일")
+    parser.add_argument('--dry-run', action='store_true', help="변경하지 않고 결과만 표시")
+    parser.add_argument('--gc', action='store_true', help="참조하지 않는 저장소 파일 삭제")
+    parser.add_argument('--gc-grace', type=float, default=GC_GRACE_SECONDS / 3600,
+                        help="이 시간(시간 단위) 안에 저장된 파일은 정리하지 않음 (기본: 24)")
+    args = parser.parse_args(argv)
+
+    config = {}
+    if os.path.exists(args.config):
+        with open(args.config, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    store = ContentStore(
+        config.get('uploads_path', os.path.join(os.getcwd(), 'public', 'uploads')),
+        config.get('data_path', os.path.join(os.getcwd(), 'data'))
+    )
+
+    print(format_report(store.migrate(dry_run=args.dry_run)))
+    if args.gc:
+        count, size = store.collect_garbage(dry_run=args.dry_run, grace=args.gc_grace * 3600)
+        print(f"  참조 없는 저장소 파일 {count}개 삭제 ({format_size(size)})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""
+서버 리소스 측정
+npm -> node 프로세스 트리의 CPU, 메모리(RSS), 열린 핸들, 스레드 수를 주기적으로 측정해
+고정 크기 링 버퍼에 저장하고, 로컬 포트에서 JSON / Prometheus 텍스트 형식으로 제공합니다.
+"""
+
+import json
+import sys
+import threading
+import time
+from array import array
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import psutil
+
+METRICS = ('cpu_percent', 'rss_bytes', 'handles', 'threads', 'processes')
+
+METRIC_HELP = {
+    'cpu_percent': "CPU usage of the Next.js process tree (percent of one core)",
+    'rss_bytes': "Resident memory of the Next.js process tree",
+    'handles': "Open file handles (Windows: handles, POSIX: file descriptors)",
+    'threads': "Threads in the Next.js process tree",
+    'processes': "Processes in the Next.js process tree",
+}
+
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+
+class RingSeries:
+    """고정 크기 시계열 (미리 할당한 배열을 순환 사용)"""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._values = array('d', [0.0]) * capacity
+        self._start = 0
+        self._size = 0
+
+    def append(self, value):
+        end = (self._start + self._size) % self.capacity
+        self._values[end] = value
+        if self._size < self.capacity:
+            self._size += 1
+        else:
+            self._start = (self._start + 1) % self.capacity
+
+    def values(self, last=None):
+        count = self._size if last is None else min(last, self._size)
+        first = self._start + self._size - count
+        return [self._values[(first + i) % self.capacity] for i in range(count)]
+
+    def __len__(self):
+        return self._size
+
+
+def sparkline(values, width=30):
+    """값 목록을 막대 문자열로 변환"""
+    values = values[-width:]
+    if not values:
+        return ""
+    low, high = min(values), max(values)
+    span = high - low
+    if span <= 0:
+        return SPARK_CHARS[0] * len(values)
+    scale = len(SPARK_CHARS) - 1
+    return "".join(SPARK_CHARS[int((value - low) / span * scale)] for value in values)
+
+
+def format_metric(value):
+    """Prometheus 값 표기 (정수는 지수 표기 없이)"""
+    value = float(value)
+    if value.is_integer():
+        return str(int(value))
+    return f"{value:.3f}"
+
+
+def format_bytes(value):
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if value < 1024 or unit == 'GB':
+            return f"{value:.0f}{unit}" if unit == 'B' else f"{value:.1f}{unit}"
+        value /= 1024
+
+
+class ProcessTreeSampler:
+    """프로세스 트리 리소스 측정기 (백그라운드 스레드)"""
+
+    def __init__(self, get_root_pids, interval=5.0, history=720):
+        self.get_root_pids = get_root_pids
+        self.interval = interval
+        self.samples_total = 0
+
+        self.timestamps = RingSeries(history)
+        self.series = {name: RingSeries(history) for name in METRICS}
+
+        # cpu_percent는 같은 Process 객체에서 이전 호출 이후의 사용률을 계산하므로 재사용
+        self._processes = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='telemetry', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.sample()
+            except Exception as e:
+                print(f"리소스 측정 오류: {e}")
+            self._stop.wait(self.interval)
+
+    def _tree(self, pids):
+        """루트 프로세스와 모든 자식 프로세스"""
+        tree = {}
+        for pid in pids:
+            try:
+                root = self._processes.get(pid) or psutil.Process(pid)
+                tree[pid] = root
+                for child in root.children(recursive=True):
+                    tree[child.pid] = self._processes.get(child.pid) or child
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return tree
+
+    def sample(self):
+        """한 번 측정해서 기록"""
+        pids = [pid for pid in self.get_root_pids() if pid]
+        tree = self._tree(pids)
+
+        totals = dict.fromkeys(METRICS, 0.0)
+        for pid, proc in tree.items():
+            try:
+                with proc.oneshot():
+                    totals['cpu_percent'] += proc.cpu_percent(None)
+                    totals['rss_bytes'] += proc.memory_info().rss
+                    totals['threads'] += proc.num_threads()
+                    if sys.platform == "win32":
+                        totals['handles'] += proc.num_handles()
+                    else:
+                        totals['handles'] += proc.num_fds()
+                totals['processes'] += 1
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+        self._processes = tree
+
+        with self._lock:
+            self.timestamps.append(time.time())
+            for name in METRICS:
+                self.series[name].append(totals[name])
+            self.samples_total += 1
+        return totals
+
+    def latest(self):
+        """가장 최근 측정값"""
+        with self._lock:
+            if not len(self.timestamps):
+                return None
+            result = {name: self.series[name].values(1)[0] for name in METRICS}
+            result['timestamp'] = self.timestamps.values(1)[0]
+            return result
+
+    def snapshot(self, last=None):
+        """시계열 전체(또는 마지막 last개) 복사본"""
+        with self._lock:
+            data = {name: self.series[name].values(last) for name in METRICS}
+            data['timestamp'] = self.timestamps.values(last)
+            return data
+
+    def summary(self):
+        """지표별 현재/평균/최대값"""
+        data = self.snapshot()
+        result = {}
+        for name in METRICS:
+            values = data[name]
+            if values:
+                result[name] = {
+                    'current': values[-1],
+                    'avg': sum(values) / len(values),
+                    'max': max(values),
+                }
+        return result
+
+    def to_json(self, last=None):
+        return json.dumps({
+            'interval': self.interval,
+            'samples_total': self.samples_total,
+            'latest': self.latest(),
+            'summary': self.summary(),
+            'series': self.snapshot(last),
+        })
+
+    def to_prometheus(self, extra=None):
+        """Prometheus 텍스트 형식"""
+        lines = []
+        latest = self.latest() or dict.fromkeys(METRICS, 0.0)
+        for name in METRICS:
+            metric = f"inspection_server_{name}"
+            lines.append(f"# HELP {metric} {METRIC_HELP[name]}")
+            lines.append(f"# TYPE {metric} gauge")
+            lines.append(f"{metric} {format_metric(latest[name])}")
+        lines.append("# HELP inspection_server_samples_total Number of resource samples taken")
+        lines.append("# TYPE inspection_server_samples_total counter")
+        lines.append(f"inspection_server_samples_total {self.samples_total}")
+        for metric, kind, help_text, value in (extra() if extra else []):
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            lines.append(f"{metric} {format_metric(value)}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """/metrics (Prometheus), /metrics.json 제공용 로컬 HTTP 서버"""
+
+    def __init__(self, sampler, port, host='127.0.0.1', extra=None):
+        self.sampler = sampler
+        self.extra = extra
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split('?', 1)[0].rstrip('/')
+                if path == '/metrics':
+                    body = server.sampler.to_prometheus(server.extra).encode('utf-8')
+                    content_type = 'text/plain; version=0.0.4; charset=utf-8'
+                elif path == '/metrics.json':
+                    body = server.sampler.to_json().encode('utf-8')
+                    content_type = 'application/json'
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='metrics', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
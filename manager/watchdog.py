@@ -0,0 +1,160 @@
+"""
+서버 감시 (비정상 종료 시 자동 재시작)
+지수 백오프 + 지터로 재시작 간격을 늘리고, 짧은 시간 안에 종료가 반복되면
+(crash loop) 재시작을 멈춥니다. 재시작 기록과 평균 고장 간격(MTBF)을 제공합니다.
+종료 코드 0과 서버 관리자가 직접 중지한 경우는 비정상 종료로 기록하지 않습니다.
+연속 실패 횟수와 crash loop 판단은 서버/워커별로 따로 합니다.
+"""
+
+import json
+import os
+import random
+import time
+from collections import deque
+
+HISTORY_SIZE = 50
+# 재시작 기록 파일이 이 크기를 넘으면 .1로 바꾸고 새 파일에 기록 (이전 파일은 하나만 보관)
+HISTORY_MAX_BYTES = 256 * 1024
+
+
+class CrashWatchdog:
+    """비정상 종료 기록 및 재시작 간격 계산"""
+
+    def __init__(self, base_delay=1.0, max_delay=60.0, jitter=0.2,
+                 loop_limit=5, loop_window=300.0, stable_after=120.0, history_file=None):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.loop_limit = loop_limit          # loop_window초 안에 이 횟수만큼 종료되면 중단
+        self.loop_window = loop_window
+        self.stable_after = stable_after      # 이 시간 이상 실행되면 연속 실패 횟수 초기화
+        self.history_file = history_file
+
+        self.history = deque(maxlen=HISTORY_SIZE)
+        self.consecutive = {}                 # 종료한 프로세스(server, worker-N)별 연속 실패 횟수
+        self.restarts = 0
+        self.failures = 0
+        self.total_uptime = 0.0
+        self.started_at = None
+        self.gave_up = False
+        # crash loop 판단에 쓰는 기록의 시작 시각 (이전 실행/초기화 전 기록은 화면 표시에만 사용)
+        self.loop_since = time.time()
+
+        self._load_history()
+
+    def _load_history(self):
+        if not self.history_file:
+            return
+        for path in (self.history_file + '.1', self.history_file):
+            if not os.path.exists(path):
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        line = line.strip()
+                        if line:
+                            self.history.append(json.loads(line))
+            except (OSError, ValueError) as e:
+                print(f"재시작 기록 로드 오류: {e}")
+
+    def _append_history(self, entry):
+        self.history.append(entry)
+        if not self.history_file:
+            return
+        try:
+            if os.path.exists(self.history_file) and os.path.getsize(self.history_file) >= HISTORY_MAX_BYTES:
+                os.replace(self.history_file, self.history_file + '.1')
+            with open(self.history_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        except OSError as e:
+            print(f"재시작 기록 저장 오류: {e}")
+
+    def reset(self, now=None):
+        """사용자가 직접 시작/중지한 경우 연속 실패 상태 초기화"""
+        self.consecutive.clear()
+        self.gave_up = False
+        self.loop_since = time.time() if now is None else now
+
+    def record_start(self, now=None):
+        """서버 프로세스 시작 시각 기록"""
+        self.started_at = time.time() if now is None else now
+
+    def record_stop(self, now=None):
+        """정상 중지 시 실행 시간 누적"""
+        now = time.time() if now is None else now
+        if self.started_at is not None:
+            self.total_uptime += now - self.started_at
+            self.started_at = None
+
+    def record_exit(self, exit_code, now=None, started_at=None, source=None):
+        """
+        비정상 종료 기록 (종료 코드 0은 호출하지 않음, record_stop 사용)
+        started_at: 종료된 프로세스의 시작 시각 (클러스터 워커처럼 따로 관리하는 경우)
+        반환값: 재시작까지 기다릴 시간(초), crash loop로 판단되면 None
+        """
+        now = time.time() if now is None else now
+        source = source or 'server'
+        if started_at is None:
+            started_at, self.started_at = self.started_at, None
+        uptime = now - started_at if started_at is not None else 0.0
+        self.total_uptime += uptime
+        self.failures += 1
+
+        consecutive = 0 if uptime >= self.stable_after else self.consecutive.get(source, 0)
+        consecutive = self.consecutive[source] = consecutive + 1
+
+        # 같은 프로세스(서버 또는 같은 번호의 워커)의 최근 종료만 셈
+        recent = [entry for entry in self.history
+                  if entry.get('source', 'server') == source
+                  and entry['time'] >= self.loop_since and now - entry['time'] <= self.loop_window]
+        if len(recent) + 1 >= self.loop_limit:
+            self.gave_up = True
+            delay = None
+        else:
+            delay = min(self.max_delay, self.base_delay * (2 ** (consecutive - 1)))
+            delay *= 1 + random.uniform(-self.jitter, self.jitter)
+            self.restarts += 1
+
+        self._append_history({
+            'time': now,
+            'source': source,
+            'exit_code': exit_code,
+            'uptime': round(uptime, 1),
+            'delay': None if delay is None else round(delay, 1),
+        })
+        return delay
+
+    def mtbf(self):
+        """평균 고장 간격(초), 고장이 없으면 None"""
+        if not self.failures:
+            return None
+        uptime = self.total_uptime
+        if self.started_at is not None:
+            uptime += time.time() - self.started_at
+        return uptime / self.failures
+
+    def summary_text(self):
+        """GUI/트레이 표시용 요약"""
+        if not self.failures and not self.history:
+            return "자동 재시작: 기록 없음"
+
+        parts = [f"자동 재시작 {self.restarts}회"]
+        mtbf = self.mtbf()
+        if mtbf is not None:
+            parts.append(f"MTBF {format_duration(mtbf)}")
+        if self.history:
+            last = self.history[-1]
+            parts.append(f"마지막 종료 {time.strftime('%m-%d %H:%M', time.localtime(last['time']))}"
+                         f" (코드 {last['exit_code']})")
+        if self.gave_up:
+            parts.append("반복 종료로 재시작 중단")
+        return " · ".join(parts)
+
+
+def format_duration(seconds):
+    """초를 읽기 쉬운 문자열로 변환"""
+    if seconds < 60:
+        return f"{seconds:.0f}초"
+    if seconds < 3600:
+        return f"{seconds / 60:.1f}분"
+    return f"{seconds / 3600:.1f}시간"
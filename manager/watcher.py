@@ -0,0 +1,345 @@
+"""
+업로드 폴더 감시
+uploads_path의 엑셀 파일이 추가/교체/삭제되면 (웹 화면 밖에서 바뀐 경우 포함)
+잠시 기다렸다가(debounce) 바뀐 파일 목록만 리스너에게 전달합니다.
+
+Linux에서는 inotify를 사용하고, 그 밖의 환경에서는 폴더의 수정 시각을 주기적으로 비교해
+수정 시각이 바뀐 폴더만 다시 읽습니다. 마지막으로 확인한 상태(manifest)를 파일로 저장해 두어
+다음 실행 때도 수정 시각이 그대로인 폴더는 읽지 않고 저장된 목록을 그대로 사용합니다.
+
+파일 추가/삭제/이름 바꾸기(업로드 저장소는 내용이 바뀌면 새 이름으로 저장)는 폴더 수정 시각이
+바뀌므로 감지되지만, 같은 파일을 제자리에서 고쳐 쓴 경우는 inotify(IN_CLOSE_WRITE)로만 감지됩니다.
+"""
+
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import struct
+import sys
+import threading
+import time
+
+WORKBOOK_EXTENSIONS = ('.xlsx', '.xls')
+MANIFEST_VERSION = 1
+
+# inotify 이벤트 (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+EVENT_HEADER = struct.Struct('iIII')
+
+
+def is_workbook(name):
+    """감시 대상 파일인지 확인 (엑셀 임시 잠금 파일 ~$... 제외)"""
+    base = os.path.basename(name)
+    return base.lower().endswith(WORKBOOK_EXTENSIONS) and not base.startswith('~$')
+
+
+class _Inotify:
+    """ctypes로 사용하는 최소한의 inotify"""
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 실패")
+
+    def add_watch(self, path, mask=WATCH_MASK):
+        wd = self._add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch 실패: {path}")
+        return wd
+
+    def read_events(self):
+        """(wd, mask, 이름) 목록"""
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        events = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0')
+            offset += length
+            events.append((wd, mask, os.fsdecode(name)))
+        return events
+
+    def close(self):
+        os.close(self.fd)
+
+
+class UploadWatcher:
+    """업로드 폴더의 엑셀 파일 변경 감시"""
+
+    def __init__(self, root, manifest_file=None, debounce=1.0, poll_interval=5.0,
+                 use_inotify=True, log=print):
+        self.root = root
+        self.manifest_file = manifest_file
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify and sys.platform.startswith('linux')
+        self.log = log
+
+        self.backend = None
+        self.files = {}         # 상대 경로 -> [크기, 수정 시각(ns)]
+        self.dirs = {}          # 상대 경로 -> 수정 시각(ns)
+        self.listeners = []
+        self.batches = 0
+
+        self._pending = set()
+        self._last_event = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def add_listener(self, callback):
+        """변경 시 callback({'added': [...], 'modified': [...], 'removed': [...]}) 호출 (절대 경로)"""
+        self.listeners.append(callback)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name='upload-watcher', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    # ---- 상태 비교 ----
+
+    def _abs(self, rel):
+        return os.path.join(self.root, rel) if rel else self.root
+
+    def _load_manifest(self):
+        if not self.manifest_file or not os.path.exists(self.manifest_file):
+            return False
+        try:
+            with open(self.manifest_file, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            self.log(f"업로드 목록 파일 읽기 오류: {e}")
+            return False
+        if manifest.get('version') != MANIFEST_VERSION or manifest.get('root') != os.path.abspath(self.root):
+            return False
+        self.files = manifest.get('files', {})
+        self.dirs = manifest.get('dirs', {})
+        return True
+
+    def _save_manifest(self):
+        if not self.manifest_file:
+            return
+        manifest = {
+            'version': MANIFEST_VERSION,
+            'root': os.path.abspath(self.root),
+            'files': self.files,
+            'dirs': self.dirs,
+        }
+        try:
+            os.makedirs(os.path.dirname(self.manifest_file), exist_ok=True)
+            temp_file = self.manifest_file + '.tmp'
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temp_file, self.manifest_file)
+        except OSError as e:
+            self.log(f"업로드 목록 파일 저장 오류: {e}")
+
+    def _list_dir(self, rel, changes):
+        """폴더 하나를 다시 읽어 새 파일/삭제된 파일/하위 폴더 반영"""
+        path = self._abs(rel)
+        try:
+            self.dirs[rel] = os.stat(path).st_mtime_ns
+            entries = list(os.scandir(path))
+        except OSError:
+            self._forget_dir(rel, changes)
+            return
+
+        seen = set()
+        for entry in entries:
+            child = os.path.join(rel, entry.name) if rel else entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if child not in self.dirs:
+                        self._list_dir(child, changes)
+                elif is_workbook(entry.name):
+                    seen.add(child)
+                    self._check_file(child, changes, entry.stat())
+            except OSError:
+                continue
+
+        for known in list(self.files):
+            if os.path.dirname(known) == rel and known not in seen:
+                del self.files[known]
+                changes['removed'].add(known)
+        for known in list(self.dirs):
+            if known != rel and os.path.dirname(known) == rel and not os.path.isdir(self._abs(known)):
+                self._forget_dir(known, changes)
+
+    def _forget_dir(self, rel, changes):
+        """삭제된 폴더와 그 안의 파일 제거"""
+        prefix = os.path.join(rel, '')
+        for known in list(self.files):
+            if known.startswith(prefix):
+                del self.files[known]
+                changes['removed'].add(known)
+        for known in list(self.dirs):
+            if known == rel or known.startswith(prefix):
+                del self.dirs[known]
+
+    def _check_file(self, rel, changes, stat=None):
+        """파일 하나의 크기/수정 시각 비교"""
+        if stat is None:
+            try:
+                stat = os.stat(self._abs(rel))
+            except OSError:
+                if self.files.pop(rel, None) is not None:
+                    changes['removed'].add(rel)
+                return
+        state = [stat.st_size, stat.st_mtime_ns]
+        previous = self.files.get(rel)
+        if previous is None:
+            changes['added'].add(rel)
+        elif previous != state:
+            changes['modified'].add(rel)
+        self.files[rel] = state
+
+    def _rescan(self, full):
+        """
+        전체 상태 비교
+        full=False: 수정 시각이 바뀐 폴더만 다시 읽고 나머지 폴더의 파일은 저장된 상태를 그대로 사용
+        """
+        changes = {'added': set(), 'modified': set(), 'removed': set()}
+        if full or not self.dirs:
+            self.dirs = {}
+            self._list_dir('', changes)
+            return changes
+
+        for rel, mtime in list(self.dirs.items()):
+            if rel not in self.dirs:
+                continue
+            try:
+                current = os.stat(self._abs(rel)).st_mtime_ns
+            except OSError:
+                self._forget_dir(rel, changes)
+                continue
+            if current != mtime:
+                self._list_dir(rel, changes)
+        return changes
+
+    def _dispatch(self, changes):
+        if not any(changes.values()):
+            return
+        self._save_manifest()
+        self.batches += 1
+        result = {kind: sorted(self._abs(rel) for rel in paths) for kind, paths in changes.items()}
+        for callback in self.listeners:
+            try:
+                callback(result)
+            except Exception as e:
+                self.log(f"업로드 변경 처리 오류: {e}")
+
+    # ---- 실행 ----
+
+    def _run(self):
+        if not os.path.isdir(self.root):
+            try:
+                os.makedirs(self.root, exist_ok=True)
+            except OSError as e:
+                self.log(f"업로드 폴더 감시 시작 오류: {e}")
+                return
+
+        start = time.perf_counter()
+        loaded = self._load_manifest()
+        changes = self._rescan(full=not loaded)
+        elapsed = (time.perf_counter() - start) * 1000
+        mode = "저장된 목록과 비교" if loaded else "전체 검색"
+        self.log(f"업로드 폴더 확인 ({mode}): 파일 {len(self.files)}개, "
+                 f"변경 {sum(len(paths) for paths in changes.values())}개 ({elapsed:.0f}ms)")
+        if not loaded:
+            self._save_manifest()
+        self._dispatch(changes)
+
+        if self.use_inotify:
+            try:
+                self._run_inotify()
+                return
+            except OSError as e:
+                self.log(f"inotify를 사용할 수 없어 주기적 확인으로 감시합니다: {e}")
+        self._run_polling()
+
+    def _run_polling(self):
+        self.backend = 'polling'
+        while not self._stop.wait(self.poll_interval):
+            self._dispatch(self._rescan(full=False))
+
+    def _run_inotify(self):
+        inotify = _Inotify()
+        self.backend = 'inotify'
+        watches = {}
+
+        def watch(rel):
+            watches[inotify.add_watch(self._abs(rel))] = rel
+
+        try:
+            for rel in list(self.dirs):
+                watch(rel)
+
+            while not self._stop.is_set():
+                timeout = 0.5
+                if self._pending:
+                    timeout = max(0.0, min(timeout, self._last_event + self.debounce - time.monotonic()))
+                readable, _, _ = select.select([inotify.fd], [], [], timeout)
+
+                if readable:
+                    for wd, mask, name in inotify.read_events():
+                        if mask & IN_Q_OVERFLOW:
+                            # 이벤트 누락: 폴더 전체 다시 확인
+                            self._pending.add(None)
+                        elif mask & IN_IGNORED:
+                            watches.pop(wd, None)
+                        elif wd in watches:
+                            rel_dir = watches[wd]
+                            rel = os.path.join(rel_dir, name) if rel_dir else name
+                            if mask & IN_ISDIR:
+                                if mask & (IN_CREATE | IN_MOVED_TO):
+                                    watch(rel)
+                                self._pending.add(('dir', rel_dir))
+                            elif name and is_workbook(name):
+                                self._pending.add(('file', rel))
+                        self._last_event = time.monotonic()
+
+                if self._pending and time.monotonic() - self._last_event >= self.debounce:
+                    self._flush_pending(watch)
+        finally:
+            inotify.close()
+
+    def _flush_pending(self, watch):
+        """모아 둔 이벤트의 파일만 확인해서 전달"""
+        pending, self._pending = self._pending, set()
+        changes = {'added': set(), 'modified': set(), 'removed': set()}
+        if None in pending:
+            changes = self._rescan(full=True)
+            for rel in self.dirs:
+                try:
+                    watch(rel)
+                except OSError:
+                    continue
+        else:
+            for kind, rel in pending:
+                if kind == 'dir':
+                    self._list_dir(rel, changes)
+                else:
+                    self._check_file(rel, changes)
+        self._dispatch(changes)
@@ -0,0 +1,344 @@
+"""
+검수 양식 엑셀 파일 읽기
+xlsx(zip) 안의 첫 번째 시트 XML을 iterparse로 한 줄씩 읽어 양식에 필요한 값만 꺼냅니다.
+(스타일/수식/서식 전체를 해석하는 XLSX.read 대신, 날짜 서식 여부만 확인)
+
+양식 구조 (/api/excel과 동일):
+  2~6행 B열       프로젝트명, 현장, 총괄담당자, 검수자, 검수일자
+  8행             헤더 (대분류, 중분류, 소분류, 임무, 담당자, 점수, 점수 범위)
+  9행부터         데이터 (대분류는 병합 셀이면 비어 있으므로 윗줄 값 사용)
+
+결과는 열 단위(columnar)로 저장합니다.
+"""
+
+import posixpath
+import re
+import zipfile
+from array import array
+from datetime import date, datetime, timedelta
+from xml.etree.ElementTree import iterparse
+
+NS_MAIN = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+NS_REL = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+NS_PKG_REL = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+DEFAULT_HEADERS = ["대분류", "중분류", "소분류", "임무", "담당자", "점수", "점수 범위"]
+TEXT_COLUMNS = ("대분류", "중분류", "소분류", "임무", "담당자")
+
+# jsonData 인덱스 기준 (0부터, 엑셀 행 번호 - 1)
+INFO_ROWS = {
+    1: 'projectName',
+    2: 'location',
+    3: 'generalManager',
+    4: 'inspector',
+    5: 'inspectionDate',
+}
+HEADER_ROW = 7
+DATA_START_ROW = 8
+
+# 날짜로 표시되는 기본 숫자 서식 ID (14~22, 한국어/중국어/일본어 로케일 서식 포함)
+BUILTIN_DATE_FORMATS = set(range(14, 23)) | set(range(27, 37)) | set(range(45, 48)) | set(range(50, 59))
+
+EXCEL_EPOCH = datetime(1899, 12, 30)
+
+_LEADING_INT = re.compile(r'\s*([+-]?\d+)')
+_ISO_DATE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_FLEXIBLE_DATES = (
+    (re.compile(r'^(\d{4})-(\d{1,2})-(\d{1,2})$'), 'ymd'),      # 2025-6-3
+    (re.compile(r'^(\d{1,2})/(\d{1,2})/(\d{2,4})$'), 'mdy'),    # 6/3/25 또는 6/3/2025
+    (re.compile(r'^(\d{1,2})-(\d{1,2})-(\d{2,4})$'), 'mdy'),    # 6-3-25
+    (re.compile(r'^(\d{1,2})\.(\d{1,2})\.(\d{2,4})$'), 'mdy'),  # 6.3.25
+    (re.compile(r'^(\d{4})[./](\d{1,2})[./](\d{1,2})\.?$'), 'ymd'),  # 2025.6.3, 2025/6/3
+)
+
+
+class TemplateData:
+    """양식에서 읽은 값 (열 단위)"""
+
+    def __init__(self, sheet_name, project_info, headers):
+        self.sheet_name = sheet_name
+        self.project_info = project_info
+        self.headers = headers
+        # 8행에서 양식 헤더(대분류, ...)를 찾았는지 (못 찾으면 기본 헤더 사용)
+        self.header_found = False
+        self.columns = {name: [] for name in TEXT_COLUMNS}
+        self.scores = array('i')
+        self.score_ranges = []
+        self.max_scores = array('i')
+
+    def __len__(self):
+        return len(self.scores)
+
+    def append(self, texts, score, score_range, max_score):
+        for name, value in zip(TEXT_COLUMNS, texts):
+            self.columns[name].append(value)
+        self.scores.append(score)
+        self.score_ranges.append(score_range)
+        self.max_scores.append(max_score)
+
+    def to_dict(self):
+        """JSON 저장용 (열 단위)"""
+        return {
+            'sheetName': self.sheet_name,
+            'projectInfo': self.project_info,
+            'headers': self.headers,
+            'columns': {
+                **self.columns,
+                '점수': self.scores.tolist(),
+                '점수범위': self.score_ranges,
+                '최대점수': self.max_scores.tolist(),
+            },
+        }
+
+    def to_rows(self):
+        """/api/excel 응답의 data와 같은 형식 (헤더 포함, 셀마다 {value})"""
+        rows = [[{'value': header or ""} for header in self.headers]]
+        for i in range(len(self)):
+            row = [{'value': self.columns[name][i]} for name in TEXT_COLUMNS]
+            row.append({'value': self.scores[i]})
+            row.append({'value': self.score_ranges[i]})
+            row.append({'value': self.max_scores[i]})
+            rows.append(row)
+        return rows
+
+
+def parse_int(value):
+    """JavaScript parseInt처럼 앞쪽 정수만 읽기, 실패하면 None"""
+    match = _LEADING_INT.match(value)
+    return int(match.group(1)) if match else None
+
+
+def normalize_date(value):
+    """검수일자를 yyyy-mm-dd로 변환, 알 수 없는 형식이면 None"""
+    if _ISO_DATE.match(value):
+        return value
+    for pattern, order in _FLEXIBLE_DATES:
+        match = pattern.match(value)
+        if not match:
+            continue
+        if order == 'ymd':
+            year, month, day = (int(part) for part in match.groups())
+        else:
+            month, day, year = (int(part) for part in match.groups())
+            if len(match.group(3)) == 2:
+                century = date.today().year // 100 * 100
+                year += century if year <= 50 else century - 100
+        try:
+            return date(year, month, day).isoformat()
+        except ValueError:
+            return None
+    return None
+
+
+def column_index(ref):
+    """셀 참조(예: 'B6')의 열 번호 (0부터)"""
+    index = 0
+    for ch in ref:
+        if 'A' <= ch <= 'Z':
+            index = index * 26 + ord(ch) - 64
+        else:
+            break
+    return index - 1
+
+
+def format_number(value):
+    """숫자 셀 표시값 (정수는 소수점 없이)"""
+    number = float(value)
+    if number.is_integer():
+        return str(int(number))
+    return repr(number)
+
+
+def _is_date_format_code(code):
+    """사용자 정의 숫자 서식이 날짜 서식인지 확인"""
+    code = re.sub(r'"[^"]*"|\[[^\]]*\]|\\.', '', code).lower()
+    return any(ch in code for ch in 'ymd')
+
+
+def _first_sheet_path(archive):
+    """workbook.xml에서 첫 번째 시트의 이름과 zip 내부 경로"""
+    with archive.open('xl/workbook.xml') as f:
+        for _, elem in iterparse(f):
+            if elem.tag == NS_MAIN + 'sheet':
+                name = elem.get('name')
+                rel_id = elem.get(NS_REL + 'id')
+                break
+        else:
+            raise ValueError("시트를 찾을 수 없습니다.")
+
+    with archive.open('xl/_rels/workbook.xml.rels') as f:
+        for _, elem in iterparse(f):
+            if elem.tag == NS_PKG_REL + 'Relationship' and elem.get('Id') == rel_id:
+                target = elem.get('Target')
+                break
+        else:
+            raise ValueError("시트 파일을 찾을 수 없습니다.")
+
+    if target.startswith('/'):
+        return name, target.lstrip('/')
+    return name, posixpath.normpath(posixpath.join('xl', target))
+
+
+def _read_shared_strings(archive):
+    """공유 문자열 목록 (서식 있는 텍스트는 글자만 이어 붙임, 읽기 표시(rPh)는 제외)"""
+    if 'xl/sharedStrings.xml' not in archive.NameToInfo:
+        return []
+    strings = []
+    with archive.open('xl/sharedStrings.xml') as f:
+        for _, elem in iterparse(f):
+            if elem.tag != NS_MAIN + 'si':
+                continue
+            parts = []
+            for child in elem:
+                if child.tag == NS_MAIN + 't':
+                    parts.append(child.text or '')
+                elif child.tag == NS_MAIN + 'r':
+                    text = child.find(NS_MAIN + 't')
+                    if text is not None:
+                        parts.append(text.text or '')
+            strings.append(''.join(parts))
+            elem.clear()
+    return strings
+
+
+def _read_date_styles(archive):
+    """날짜 서식이 적용된 셀 스타일(s 속성) 번호 집합"""
+    if 'xl/styles.xml' not in archive.NameToInfo:
+        return set()
+    custom = {}
+    date_styles = set()
+    style_index = 0
+    in_cell_xfs = False
+    with archive.open('xl/styles.xml') as f:
+        for event, elem in iterparse(f, events=('start', 'end')):
+            tag = elem.tag
+            if tag == NS_MAIN + 'cellXfs':
+                in_cell_xfs = event == 'start'
+            elif event == 'end' and tag == NS_MAIN + 'numFmt':
+                custom[int(elem.get('numFmtId'))] = elem.get('formatCode', '')
+            elif event == 'end' and tag == NS_MAIN + 'xf' and in_cell_xfs:
+                fmt_id = int(elem.get('numFmtId', 0))
+                if fmt_id in custom:
+                    is_date = _is_date_format_code(custom[fmt_id])
+                else:
+                    is_date = fmt_id in BUILTIN_DATE_FORMATS
+                if is_date:
+                    date_styles.add(style_index)
+                style_index += 1
+    return date_styles
+
+
+def iter_sheet_rows(archive, sheet_path, shared_strings):
+    """(행 인덱스, {열 인덱스: 표시값}) 순서대로 반환 (값이 있는 행만)"""
+    # styles.xml은 스타일이 지정된 숫자 셀이 처음 나올 때 읽음
+    date_styles = None
+    cell_tag = NS_MAIN + 'c'
+    row_tag = NS_MAIN + 'row'
+    value_tag = NS_MAIN + 'v'
+    inline_tag = NS_MAIN + 'is'
+    text_tag = NS_MAIN + 't'
+
+    with archive.open(sheet_path) as f:
+        row_number = 0
+        for _, elem in iterparse(f):
+            if elem.tag != row_tag:
+                continue
+            row_number = int(elem.get('r', row_number + 1))
+            cells = {}
+            next_col = 0
+            for cell in elem.iter(cell_tag):
+                ref = cell.get('r')
+                col = column_index(ref) if ref else next_col
+                next_col = col + 1
+
+                kind = cell.get('t', 'n')
+                if kind == 'inlineStr':
+                    node = cell.find(inline_tag)
+                    value = ''.join(t.text or '' for t in node.iter(text_tag)) if node is not None else ''
+                else:
+                    node = cell.find(value_tag)
+                    if node is None or node.text is None:
+                        continue
+                    value = node.text
+                    if kind == 's':
+                        value = shared_strings[int(value)]
+                    elif kind == 'b':
+                        value = 'TRUE' if value == '1' else 'FALSE'
+                    elif kind == 'n':
+                        style = int(cell.get('s', 0))
+                        if style and date_styles is None:
+                            date_styles = _read_date_styles(archive)
+                        if style and style in date_styles:
+                            value = (EXCEL_EPOCH + timedelta(days=float(value))).date().isoformat()
+                        else:
+                            value = format_number(value)
+                if value != '':
+                    cells[col] = value
+            elem.clear()
+            if cells:
+                yield row_number - 1, cells
+
+
+def read_template(path):
+    """
+    검수 양식 파일 읽기
+    반환값: TemplateData, xlsx 파일이 아니면 ValueError 발생
+    """
+    try:
+        archive = zipfile.ZipFile(path)
+    except zipfile.BadZipFile:
+        raise ValueError("올바른 엑셀(xlsx) 파일이 아닙니다.")
+
+    with archive:
+        sheet_name, sheet_path = _first_sheet_path(archive)
+        shared_strings = _read_shared_strings(archive)
+
+        project_info = dict.fromkeys(INFO_ROWS.values(), "")
+        headers = DEFAULT_HEADERS
+        header_found = False
+        data = None
+        prev_category = ""
+
+        for index, cells in iter_sheet_rows(archive, sheet_path, shared_strings):
+            if index < DATA_START_ROW:
+                if index in INFO_ROWS:
+                    project_info[INFO_ROWS[index]] = cells.get(1, "")
+                elif index == HEADER_ROW and cells.get(0) == "대분류":
+                    width = max(max(cells) + 1, len(DEFAULT_HEADERS))
+                    headers = [cells.get(col, "") for col in range(width)]
+                    header_found = True
+                continue
+
+            if data is None:
+                data = TemplateData(sheet_name, project_info, headers)
+
+            # 모든 셀이 비어 있는 행은 건너뛰기
+            values = [value.strip() for value in cells.values()]
+            if not any(values):
+                continue
+
+            texts = [cells.get(col, "").strip() for col in range(len(TEXT_COLUMNS))]
+            # 대분류가 비어 있으면 이전 값 사용 (병합 셀 처리)
+            if texts[0]:
+                prev_category = texts[0]
+            else:
+                texts[0] = prev_category
+
+            score = parse_int(cells.get(5, "")) or 0
+
+            score_range = cells.get(6, "").strip()
+            max_score = 1
+            parts = score_range.split('/')
+            if len(parts) == 2:
+                max_score = parse_int(parts[1]) or 1
+
+            data.append(texts, score, score_range or "0/1", max_score)
+
+    if data is None:
+        data = TemplateData(sheet_name, project_info, headers)
+    data.header_found = header_found
+
+    # 검수일자를 yyyy-mm-dd로 변환 (/api/excel처럼 날짜로 읽을 수 없으면 빈 값)
+    project_info['inspectionDate'] = normalize_date(project_info['inspectionDate'].strip()) or ""
+
+    return data